@@ -0,0 +1,40 @@
+"""
+Benchmark of the image-plane camera: renders the shadow and a thin disk of a
+Kerr black hole and reports wall time and rays per second.
+
+Run from the repository root:
+
+    python benchmarks/bench_camera.py [resolution]
+
+The default 128x128 image takes a few tens of seconds; 512x512 traces 16
+times more rays.
+"""
+
+import sys
+import time
+
+import numpy
+
+from relatipy.numeric.camera import Camera
+from relatipy.numeric.geodesic import DiskEvent
+from relatipy.numeric.metrics import Kerr
+
+
+def main(resolution=128):
+    camera = Camera(
+        Kerr(1.0, 0.9), inclination=1.3, distance=1000.0, fov=2 * numpy.arctan(16 / 1000),
+        resolution=resolution, disk=DiskEvent(2.5, 15.0),
+    )
+
+    start = time.perf_counter()
+    image = camera.render()
+    elapsed = time.perf_counter() - start
+
+    n_rays = image.status.size
+    print(image)
+    print(f"{resolution}x{resolution}: {elapsed:.1f} s, {n_rays / elapsed:.0f} rays/s, "
+          f"{image.nfev / n_rays:.0f} RHS evaluations per ray")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
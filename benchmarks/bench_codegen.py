@@ -0,0 +1,56 @@
+"""
+Benchmark of the NumPy kernels generated by ``relatipy.symbolic.codegen``.
+
+Compiles the symbolic Kerr metric and compares its Christoffel kernels with
+the hand-edited ``Kerr._get_christoffel_components`` and
+``Kerr._get_christoffel_symbols``, for a single point and for batches of
+points of shape (N, 4).
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_codegen.py
+"""
+
+import time
+import timeit
+
+import numpy
+
+from relatipy.numeric.metrics import Kerr
+from relatipy.symbolic.codegen import compile_kernels
+from relatipy.symbolic.metrics import Kerr as SymbolicKerr
+
+
+def bench(label, func, number):
+    seconds = min(timeit.repeat(func, number=number, repeat=3)) / number
+    print(f"    {label:<36s} {seconds * 1e6:10.2f} us")
+    return seconds
+
+
+def main():
+    start = time.perf_counter()
+    kernels = compile_kernels(SymbolicKerr(), name="Kerr", cache=False)
+    print(f"Code generation: {time.perf_counter() - start:.2f} s")
+
+    metric = Kerr(1.0, 0.9)
+    args = [{"R_s": metric.R_s, "a": metric.a}[name] for name in kernels.PARAMETERS]
+
+    rng = numpy.random.default_rng(0)
+    for n in (1, 100, 10000):
+        xs = numpy.column_stack([
+            numpy.zeros(n), rng.uniform(3, 20, n), rng.uniform(0.1, 3.0, n), rng.uniform(0, 6.28, n),
+        ])
+        error = numpy.max(numpy.abs(kernels.christoffel_symbols(xs, *args) - metric._get_christoffel_symbols(xs)))
+        number = max(5, 2000 // n)
+
+        print(f"Kerr Christoffel symbols, N = {n} (max difference {error:.1e})")
+        t_before = bench("components (hand-edited)", lambda: metric._get_christoffel_components(xs), number)
+        t_after = bench("components (generated)", lambda: kernels.christoffel_components(xs, *args), number)
+        print(f"    speedup: {t_before / t_after:.2f}x")
+        t_before = bench("full tensor (hand-edited)", lambda: metric._get_christoffel_symbols(xs), number)
+        t_after = bench("full tensor (generated)", lambda: kernels.christoffel_symbols(xs, *args), number)
+        print(f"    speedup: {t_before / t_after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
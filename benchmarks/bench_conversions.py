@@ -0,0 +1,50 @@
+"""
+Micro-benchmark of the direct coordinate conversions.
+
+Compares the conversion chosen by the registry (the direct transforms where
+they exist) with the former route through Cartesian coordinates, for N points.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_conversions.py
+"""
+
+import timeit
+
+import numpy
+
+from relatipy.numeric.coordinates import coordinate_systems, get_conversion_path
+from relatipy.numeric.coordinates.conversions import convert
+
+
+def through_cartesian(xs, vs, source, target, source_kwargs, target_kwargs):
+    xs_p, vs_p = coordinate_systems[source]._convert_to_cartesian(xs, vs, **source_kwargs)
+    return coordinate_systems[target]._convert_from_cartesian(xs_p, vs_p, **target_kwargs)
+
+
+def bench(label, func):
+    seconds = min(timeit.repeat(func, number=1, repeat=3))
+    print(f"    {label:<24s} {seconds * 1e3:10.1f} ms")
+    return seconds
+
+
+def main(N=1_000_000):
+    rng = numpy.random.default_rng(0)
+    xs = numpy.array([numpy.zeros(N), rng.uniform(3, 30, N), rng.uniform(0.1, 3.0, N), rng.uniform(-3, 3, N)])
+    vs = rng.uniform(-0.1, 0.1, (3, N))
+    spin = {"a": 0.5}
+
+    for source, target, source_kwargs, target_kwargs in [
+        ("BoyerLindquist", "Spherical", spin, {}),
+        ("Spherical", "BoyerLindquist", {}, spin),
+        ("Spherical", "Cylindrical", {}, {}),
+        ("Cylindrical", "BoyerLindquist", {}, spin),
+    ]:
+        print(f"{source} -> {target}, N={N}, path {' -> '.join(get_conversion_path(source, target))}")
+        t_cartesian = bench("through Cartesian", lambda: through_cartesian(xs, vs, source, target, source_kwargs, target_kwargs))
+        t_registry = bench("registry", lambda: convert(xs, vs, source, target, source_kwargs, target_kwargs))
+        print(f"    speedup: {t_cartesian / t_registry:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Micro-benchmark of CoordinateBatch against lists of coordinate objects.
+
+Builds N Spherical points and converts them to Boyer-Lindquist coordinates,
+once as N objects and once as a single array-backed batch.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_coordinate_batch.py
+"""
+
+import time
+
+import numpy
+
+from relatipy.numeric.coordinates import CoordinateBatch, Spherical
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    print(f"    {label:<32s} {seconds * 1e3:10.1f} ms")
+    return seconds, result
+
+
+def main(N=20_000, N_batch=1_000_000):
+    rng = numpy.random.default_rng(0)
+
+    def sample(n):
+        xs = numpy.array([numpy.zeros(n), rng.uniform(5, 50, n), rng.uniform(0.2, 2.9, n), rng.uniform(-3, 3, n)])
+        return xs, rng.uniform(-0.1, 0.1, (3, n))
+
+    xs, vs = sample(N)
+    print(f"Spherical -> Cartesian, N={N}")
+    t_objects, _ = timed(
+        "list of objects",
+        lambda: [Spherical(x, v).convert_to("Cartesian") for x, v in zip(xs.T, vs.T)],
+    )
+    t_batch, _ = timed("CoordinateBatch", lambda: CoordinateBatch("Spherical", xs, vs).convert_to("Cartesian"))
+    print(f"    speedup: {t_objects / t_batch:.0f}x")
+
+    xs, vs = sample(N_batch)
+    print(f"Spherical -> Cylindrical, N={N_batch}")
+    timed("CoordinateBatch", lambda: CoordinateBatch("Spherical", xs, vs).convert_to("Cylindrical"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Construction time and memory of coordinate objects.
+
+Creates N single-event coordinate objects, as a parameter sweep does, and
+reports the time per object and the memory retained per object.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_coordinate_objects.py
+"""
+
+import time
+import tracemalloc
+
+import numpy
+
+from relatipy.numeric.coordinates import BoyerLindquist, Spherical
+
+
+def build(factory, xs, vs):
+    return [factory(x, v) for x, v in zip(xs, vs)]
+
+
+def main(N=100_000):
+    rng = numpy.random.default_rng(0)
+    xs = numpy.column_stack([numpy.zeros(N), rng.uniform(5, 50, N), rng.uniform(0.2, 2.9, N), rng.uniform(-3, 3, N)])
+    vs = rng.uniform(-0.1, 0.1, (N, 3))
+
+    for name, factory in (
+        ("Spherical", lambda x, v: Spherical(x, v)),
+        ("BoyerLindquist", lambda x, v: BoyerLindquist(x, v, a=0.5)),
+    ):
+        start = time.perf_counter()
+        build(factory, xs, vs)
+        seconds = time.perf_counter() - start
+
+        tracemalloc.start()
+        objects = build(factory, xs, vs)
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del objects
+
+        print(f"{name}: N={N}")
+        print(f"    construction {seconds / N * 1e6:8.2f} us per object")
+        print(f"    memory       {memory / N:8.0f} bytes per object")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark of a metric built by ``make_metric`` against the hand-written Kerr.
+
+Builds ``GeneratedKerr`` from the symbolic Kerr metric (in a temporary kernel
+cache) and times the Christoffel symbols for one and for N points, and the
+integration of a bound orbit.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_generated_metric.py
+"""
+
+import os
+import tempfile
+import time
+import timeit
+
+import numpy
+
+from relatipy.numeric.coordinates import BoyerLindquist
+from relatipy.numeric.metrics import Kerr, make_metric
+from relatipy.symbolic.metrics import Kerr as SymbolicKerr
+
+
+def bench(label, func, number):
+    seconds = min(timeit.repeat(func, number=number, repeat=3)) / number
+    print(f"    {label:<36s} {seconds * 1e6:12.2f} us")
+    return seconds
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ["RELATIPY_CACHE_DIR"] = directory
+
+        start = time.perf_counter()
+        GeneratedKerr = make_metric(SymbolicKerr(), parameters=["a"], name="GeneratedKerr", coordinate_system="BoyerLindquist")
+        print(f"make_metric: {time.perf_counter() - start:.2f} s")
+
+        kerr = Kerr(1.0, 0.9)
+        generated = GeneratedKerr(1.0, kerr.a)
+
+        rng = numpy.random.default_rng(0)
+        for n in (1, 10000):
+            xs = numpy.column_stack([
+                numpy.zeros(n), rng.uniform(3, 20, n), rng.uniform(0.1, 3.0, n), rng.uniform(0, 6.28, n),
+            ])
+            number = max(5, 2000 // n)
+            print(f"Compact Christoffel symbols, N = {n}")
+            t_before = bench("Kerr (hand-written)", lambda: kerr.get_christoffel_symbols(xs, compact=True), number)
+            t_after = bench("GeneratedKerr", lambda: generated.get_christoffel_symbols(xs, compact=True), number)
+            print(f"    speedup: {t_before / t_after:.2f}x")
+
+        ys0 = kerr.get_4state_vector(BoyerLindquist([0, 10.0, numpy.pi / 2, 0], [0, 0, 0.3], a=0.9))
+        taus = numpy.linspace(0, 500, 501)
+        print("Bound orbit, 500 proper time units")
+        t_before = bench("Kerr (hand-written)", lambda: kerr.geodesic._get_path_from_4state_vector(ys0, taus), 3)
+        t_after = bench("GeneratedKerr", lambda: generated.geodesic._get_path_from_4state_vector(ys0, taus), 3)
+        print(f"    speedup: {t_before / t_after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
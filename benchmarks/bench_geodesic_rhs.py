@@ -0,0 +1,83 @@
+"""
+Micro-benchmark of the Christoffel contraction in Geodesic.model_geodesic.
+
+Compares the former 64-iteration Python loop with the vectorized contraction
+over the independent non-zero components, for a single point and for a batch
+of N points.
+
+Run from the repository root:
+
+    python benchmarks/bench_geodesic_rhs.py
+"""
+
+import timeit
+from itertools import product
+
+import numpy
+
+from relatipy.numeric.metrics import Kerr, Schwarzschild
+
+
+def loop_contraction(chris, us):
+    as_ = numpy.zeros(4)
+    for sigma, mu, nu in product(range(4), repeat=3):
+        as_[sigma] -= chris[sigma, mu, nu] * us[mu] * us[nu]
+    return as_
+
+
+def einsum_contraction(chris, us):
+    return -numpy.einsum("...smn,...m,...n->...s", chris, us, us)
+
+
+def bench(label, func, number):
+    seconds = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f"    {label:<28s} {seconds * 1e6:10.2f} us")
+    return seconds
+
+
+def main(N=10_000):
+    rng = numpy.random.default_rng(0)
+
+    for metric in (Schwarzschild(1.0), Kerr(1.0, 0.9)):
+        geodesic = metric.geodesic
+        name = type(metric).__name__
+
+        xs = numpy.array([0.0, 10.0, 1.0, 0.5])
+        us = numpy.array([1.1, 0.1, 0.01, 0.02])
+        chris = metric.get_christoffel_symbols(xs)
+
+        print(f"{name}: single point")
+        t_loop = bench("python loop (64 terms)", lambda: loop_contraction(chris, us), 2000)
+        t_vec = bench("sparse contraction", lambda: geodesic.get_acceleration(chris, us), 2000)
+        print(f"    speedup: {t_loop / t_vec:.1f}x")
+
+        xs_N = numpy.column_stack(
+            [numpy.zeros(N), rng.uniform(5, 50, N), rng.uniform(0.1, 3.0, N), rng.uniform(0, 6, N)]
+        )
+        us_N = rng.normal(size=(N, 4))
+        chris_N = metric.get_christoffel_symbols(xs_N)
+
+        print(f"{name}: batch of N={N}")
+        t_loop = bench("python loop per point", lambda: [loop_contraction(c, u) for c, u in zip(chris_N, us_N)], 1)
+        t_einsum = bench("dense einsum", lambda: einsum_contraction(chris_N, us_N), 5)
+        t_vec = bench("sparse contraction", lambda: geodesic.get_acceleration(chris_N, us_N), 5)
+        print(f"    speedup vs loop: {t_loop / t_vec:.1f}x, vs dense einsum: {t_einsum / t_vec:.1f}x")
+
+        print(f"{name}: Christoffel evaluation + contraction, N={N}")
+        t_full = bench(
+            "full tensor + einsum",
+            lambda: einsum_contraction(metric.get_christoffel_symbols(xs_N), us_N),
+            5,
+        )
+        t_compact = bench(
+            "compact components",
+            lambda: geodesic._get_acceleration_from_components(
+                metric.get_christoffel_symbols(xs_N, compact=True)[0], us_N
+            ),
+            5,
+        )
+        print(f"    speedup: {t_full / t_compact:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Import-time budget of relatipy.
+
+Every module is imported in a fresh interpreter, the import time is measured
+and compared with its budget, and the heavy dependencies it pulled in are
+listed. Numeric code must not load sympy, einsteinpy, astropy or scipy just by
+being imported: they load on first use.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_import_time.py
+
+The script exits with status 1 when a budget is exceeded or a forbidden
+dependency is loaded.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+# Budgets in ms on top of the bare interpreter. numpy alone takes ~100 ms.
+BUDGETS = {
+    "relatipy": 20,
+    "relatipy.numeric": 20,
+    "relatipy.numeric.coordinates": 250,
+    "relatipy.numeric.metrics": 250,
+    "relatipy.numeric.geodesic": 250,
+    "relatipy.numeric.camera": 250,
+}
+
+HEAVY = ("numpy", "scipy", "astropy", "sympy", "einsteinpy")
+FORBIDDEN = ("scipy", "astropy", "sympy", "einsteinpy")
+
+SCRIPT = """
+import importlib, json, sys, time
+start = time.perf_counter()
+importlib.import_module({module!r})
+seconds = time.perf_counter() - start
+print(json.dumps([seconds, [m for m in {heavy!r} if m in sys.modules]]))
+"""
+
+
+def measure(module, repeat=5):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, ["src", os.environ.get("PYTHONPATH")])))
+    best, loaded = float("inf"), []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", SCRIPT.format(module=module, heavy=HEAVY)],
+            capture_output=True, text=True, check=True, env=env,
+        ).stdout
+        seconds, loaded = json.loads(output)
+        best = min(best, seconds)
+    return best, loaded
+
+
+def main():
+    failed = False
+    print(f"{'module':<32s} {'time':>9s} {'budget':>9s}  heavy dependencies loaded")
+    for module, budget in BUDGETS.items():
+        seconds, loaded = measure(module)
+        forbidden = [m for m in loaded if m in FORBIDDEN]
+        over = seconds * 1e3 > budget
+        failed |= over or bool(forbidden)
+        flag = "  <-- over budget" if over else ""
+        flag += f"  <-- loads {', '.join(forbidden)}" if forbidden else ""
+        print(f"{module:<32s} {seconds * 1e3:7.1f}ms {budget:7d}ms  {', '.join(loaded) or '-'}{flag}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""
+Micro-benchmark of the construction of the initial 4-state vectors of a sweep.
+
+Compares the former per-particle path (metric call and nested Python loops
+over the coordinate velocities for every particle) with the batched
+``BaseMetric.get_4state_vectors``, which normalizes all the 4-velocities with
+one contraction over the (N, 4, 4) metric.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_initial_conditions.py
+"""
+
+import timeit
+
+import numpy
+
+from relatipy.numeric.constants import _c
+from relatipy.numeric.metrics import Kerr
+
+
+def loop_4state_vector(metric, xs, dxs_dt):
+    us = numpy.zeros(4)
+    g = metric.metric(xs)
+
+    u_t2 = g[0, 0]
+    for i in range(1, 4):
+        u_t2 += 2 / _c * g[0, i] * dxs_dt[i - 1]
+        for j in range(1, 4):
+            u_t2 += 1 / _c**2 * g[i, j] * dxs_dt[i - 1] * dxs_dt[j - 1]
+
+    us[0] = _c * numpy.sqrt(1 / u_t2)
+    for i in range(1, 4):
+        us[i] = dxs_dt[i - 1] * us[0] / _c
+    return numpy.concatenate((xs, us))
+
+
+def bench(label, func, number):
+    seconds = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f"    {label:<28s} {seconds * 1e3:10.3f} ms")
+    return seconds
+
+
+def main(N=10_000):
+    rng = numpy.random.default_rng(0)
+    kerr = Kerr(1.0, 0.9)
+    xs = numpy.column_stack(
+        [numpy.zeros(N), rng.uniform(5, 50, N), rng.uniform(0.3, 2.8, N), rng.uniform(0, 6, N)]
+    )
+    dxs_dt = numpy.column_stack([rng.uniform(-0.1, 0.1, N), numpy.zeros(N), xs[:, 1] ** -1.5])
+
+    reference = numpy.array([loop_4state_vector(kerr, x, v) for x, v in zip(xs, dxs_dt)])
+    assert numpy.allclose(reference, kerr.get_4state_vectors(xs, dxs_dt))
+
+    print(f"Kerr: 4-state vectors of N={N} particles")
+    t_loop = bench("per particle (loops)", lambda: [loop_4state_vector(kerr, x, v) for x, v in zip(xs, dxs_dt)], 1)
+    t_batch = bench("batched einsum", lambda: kerr.get_4state_vectors(xs, dxs_dt), 20)
+    print(f"    speedup: {t_loop / t_batch:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark of the kernel cache of ``relatipy.numeric.kernels``.
+
+Generates the Kerr kernels into a temporary cache directory, then times what
+a new worker process pays to get them: regenerating them with sympy against
+importing the cached module by its key, which does not load sympy.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_kernel_cache.py
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from relatipy.symbolic.codegen import compile_kernels
+from relatipy.symbolic.metrics import Kerr
+
+REGENERATE = """
+from relatipy.symbolic.codegen import compile_kernels
+from relatipy.symbolic.metrics import Kerr
+compile_kernels(Kerr(), name="Kerr", cache=False)
+"""
+
+LOAD = """
+import sys
+from relatipy.numeric.kernels import load_kernels
+assert load_kernels({key!r}) is not None
+assert "sympy" not in sys.modules
+"""
+
+
+def run(label, script, env):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", script], check=True, env=env)
+    seconds = time.perf_counter() - start
+    print(f"    {label:<36s} {seconds:8.3f} s")
+    return seconds
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        env = dict(os.environ, RELATIPY_CACHE_DIR=directory, PYTHONPATH=os.pathsep.join(sys.path))
+        os.environ["RELATIPY_CACHE_DIR"] = directory
+        key = compile_kernels(Kerr(), name="Kerr").KERNEL_KEY
+
+        print("Kerr kernels in a new process")
+        t_before = run("regenerated with sympy", REGENERATE, env)
+        t_after = run("imported from the kernel cache", LOAD.format(key=key), env)
+        print(f"    speedup: {t_before / t_after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Benchmark of the lock-step adaptive bundle integrator against a loop of
+SciPy ``solve_ivp`` calls, one per particle.
+
+Integrates a sweep of equatorial Kerr orbits, half of them plunging into the
+horizon, with the same horizon event and comparable tolerances.
+
+Run from the repository root:
+
+    python benchmarks/bench_lockstep.py [n_particles]
+"""
+
+import sys
+import time
+
+import numpy
+
+from relatipy.numeric.coordinates import BoyerLindquist
+from relatipy.numeric.geodesic import HorizonEvent
+from relatipy.numeric.metrics import Kerr
+
+
+def main(n_particles=64):
+    kerr = Kerr(1.0, 0.5)
+    radii = numpy.linspace(6, 20, n_particles // 2)
+    ys0 = numpy.array([
+        kerr.get_4state_vector(BoyerLindquist([0, r, numpy.pi / 2, 0], [0, 0, r**-0.5 * factor], a=0.5))
+        for r in radii for factor in (1.0, 0.5)
+    ])
+    taus = numpy.linspace(0, 300, 301)
+    events = [HorizonEvent(kerr, 1e-2)]
+    geodesic = kerr.geodesic
+
+    for method in ("DOP853", "RK45"):
+        start = time.perf_counter()
+        nfev = 0
+        for y0 in ys0:
+            geodesic._get_path_from_4state_vector(y0, taus, method, events, rtol=1e-9, atol=1e-10)
+            nfev += geodesic.last_result.nfev
+        print(f"solve_ivp loop ({method:6s})  {time.perf_counter() - start:8.3f} s  nfev={nfev}")
+
+    start = time.perf_counter()
+    result = geodesic.get_paths_lockstep(ys0, taus, events=events, rtol=1e-9, atol=1e-10)
+    print(f"lock-step DOPRI5           {time.perf_counter() - start:8.3f} s  nfev={result.nfev}  {result}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,58 @@
+"""
+Micro-benchmark of the per-point metric and Christoffel calls.
+
+Compares the former path, which turned every input into an object array and
+walked it with the unit validator, with the float fast path taken by plain
+float ndarrays (the input of every right-hand side evaluation of the
+integrators).
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_metric_fast_path.py
+"""
+
+import timeit
+
+import numpy
+
+from relatipy.numeric.metrics import Kerr, Schwarzschild
+from relatipy.numeric.utils.dimensions import validator
+
+
+def legacy_metric(metric, xs):
+    xs = numpy.asarray(xs, dtype=object)
+    xs = validator.validate_vector(xs)
+    return metric._metric_dimensionless(xs)
+
+
+def legacy_christoffel_components(metric, xs):
+    xs = numpy.asarray(xs, dtype=object)
+    xs = validator.validate_vector(xs)
+    return metric._get_christoffel_components(xs), metric.christoffel_indices
+
+
+def bench(label, func, number=20000):
+    seconds = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f"    {label:<36s} {seconds * 1e6:8.2f} us")
+    return seconds
+
+
+def main():
+    xs = numpy.array([0.0, 10.0, 1.0, 0.5])
+
+    for metric in (Schwarzschild(1.0), Kerr(1.0, 0.9)):
+        name = type(metric).__name__
+
+        print(f"{name}: metric at a single point")
+        t_before = bench("before (object array + validator)", lambda: legacy_metric(metric, xs))
+        t_after = bench("after (float fast path)", lambda: metric.metric(xs))
+        print(f"    speedup: {t_before / t_after:.1f}x")
+
+        print(f"{name}: compact Christoffel symbols at a single point")
+        t_before = bench("before (object array + validator)", lambda: legacy_christoffel_components(metric, xs))
+        t_after = bench("after (float fast path)", lambda: metric.get_christoffel_symbols(xs, compact=True))
+        print(f"    speedup: {t_before / t_after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Benchmark of Radau with the analytic Jacobian of the geodesic equations
+against the finite-difference estimate SciPy uses without ``jac``.
+
+Integrates a stiff, near-horizon Kerr orbit and a far-field Schwarzschild
+orbit, and reports wall time and the number of right-hand side evaluations.
+
+Run from the repository root:
+
+    python benchmarks/bench_radau_jacobian.py
+"""
+
+import time
+
+import numpy
+from scipy.integrate import solve_ivp
+
+from relatipy.numeric.coordinates import BoyerLindquist, Spherical
+from relatipy.numeric.metrics import Kerr, Schwarzschild
+
+
+def run(geodesic, ys0, taus, jac):
+    start = time.perf_counter()
+    sol = solve_ivp(
+        geodesic.model_geodesic, (taus[0], taus[-1]), ys0, t_eval=taus, method="Radau", jac=jac
+    )
+    return time.perf_counter() - start, sol
+
+
+def main():
+    cases = [
+        ("Kerr a=0.99, r=2.2 M", Kerr(1.0, 0.99), BoyerLindquist([0, 2.2, numpy.pi / 2, 0], [0, 0, 0.5], a=0.99), 200),
+        ("Schwarzschild, r=60 M", Schwarzschild(1.0), Spherical([0, 60.0, numpy.pi / 2, 0], [0, 0, 0.12]), 20000),
+    ]
+
+    for label, metric, coordinate, tau_max in cases:
+        geodesic = metric.geodesic
+        ys0 = metric.get_4state_vector(coordinate)
+        taus = numpy.linspace(0, tau_max, 200)
+
+        t_fd, sol_fd = run(geodesic, ys0, taus, None)
+        t_an, sol_an = run(geodesic, ys0, taus, geodesic.jacobian_geodesic)
+
+        print(label)
+        print(f"    finite differences  {t_fd:8.3f} s  nfev={sol_fd.nfev:6d}  njev={sol_fd.njev}")
+        print(f"    analytic Jacobian   {t_an:8.3f} s  nfev={sol_an.nfev:6d}  njev={sol_an.njev}")
+        print(f"    speedup: {t_fd / t_an:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Micro-benchmark of the conversion of metrics and Christoffel symbols to SI.
+
+Compares the former per-element loop over the indices, run once per point,
+with the cached scale tensors broadcast over a batch of N points.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_si_scaling.py
+"""
+
+import timeit
+from itertools import product
+
+import numpy
+
+from relatipy.numeric.constants import _c_SI
+from relatipy.numeric.metrics import Kerr
+
+
+def loop_metric_to_si(g_geom):
+    g_si = numpy.zeros_like(g_geom)
+    for mu, nu in product(range(4), repeat=2):
+        g_si[mu, nu] = (_c_SI ** ((mu == 0) + (nu == 0))) * g_geom[mu, nu]
+    return g_si
+
+
+def loop_christoffel_to_si(Gamma_geom):
+    Gamma_si = numpy.zeros_like(Gamma_geom)
+    for rho in range(4):
+        for mu, nu in product(range(4), repeat=2):
+            exponent = (mu == 0) + (nu == 0) - (rho == 0)
+            Gamma_si[rho, mu, nu] = (_c_SI ** exponent) * Gamma_geom[rho, mu, nu]
+    return Gamma_si
+
+
+def bench(label, func, number):
+    seconds = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f"    {label:<42s} {seconds * 1e3:10.3f} ms")
+    return seconds
+
+
+def main(N=10_000):
+    rng = numpy.random.default_rng(0)
+    kerr = Kerr(1.0, 0.9)
+    xs = numpy.column_stack(
+        [numpy.zeros(N), rng.uniform(5, 50, N), rng.uniform(0.1, 3.0, N), rng.uniform(0, 6, N)]
+    )
+    metrics = kerr._metric_dimensionless(xs)
+    christoffels = kerr._get_christoffel_symbols(xs)
+
+    print(f"Metric to SI, N={N}")
+    t_loop = bench("python loop per point", lambda: numpy.array([loop_metric_to_si(g) for g in metrics]), 1)
+    t_scale = bench("broadcast scale tensor", lambda: kerr._metric_geom_to_si(metrics), 20)
+    t_geom = bench("metric(), dimensionless", lambda: kerr.metric(xs.T), 20)
+    t_si = bench("metric(), SI", lambda: kerr.metric(xs.T, dimensionless=False), 20)
+    print(f"    speedup: {t_loop / t_scale:.0f}x, SI overhead: {t_si / t_geom:.2f}x")
+
+    print(f"Christoffel symbols to SI, N={N}")
+    t_loop = bench("python loop per point", lambda: numpy.array([loop_christoffel_to_si(G) for G in christoffels]), 1)
+    t_scale = bench("broadcast scale tensor", lambda: kerr._christoffel_dimensionless_to_si(christoffels), 20)
+    t_geom = bench("get_christoffel_symbols(), dimensionless", lambda: kerr.get_christoffel_symbols(xs), 5)
+    t_si = bench("get_christoffel_symbols(), SI", lambda: kerr.get_christoffel_symbols(xs, dimensionless=False), 5)
+    print(f"    speedup: {t_loop / t_scale:.0f}x, SI overhead: {t_si / t_geom:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Benchmark of the on-disk cache of the symbolic Kerr Christoffel symbols.
+
+Times the first call of ``Kerr().christoffel_symbols()``, which simplifies
+the components and stores them, against a new ``Kerr`` object that loads
+them from the cache. A temporary cache directory is used, so the user cache
+is left untouched.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_symbolic_cache.py
+"""
+
+import tempfile
+import time
+
+from relatipy.symbolic.cache import SymbolicCache
+from relatipy.symbolic.metrics import Kerr
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = SymbolicCache(directory)
+
+        start = time.perf_counter()
+        cold = Kerr(cache=cache).christoffel_symbols()
+        t_cold = time.perf_counter() - start
+
+        start = time.perf_counter()
+        warm = Kerr(cache=cache).christoffel_symbols()
+        t_warm = time.perf_counter() - start
+
+        assert warm.tensor() == cold.tensor()
+        print("Kerr Christoffel symbols")
+        print(f"    computed and stored  {t_cold:10.3f} s")
+        print(f"    loaded from cache    {t_warm:10.3f} s ({cache.size() / 1024:.0f} KiB)")
+        print(f"    speedup: {t_cold / t_warm:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark of the simplification of the symbolic Kerr Christoffel symbols.
+
+Compares the former loop, which simplified the 64 components one after the
+other, with ``simplify_christoffel_symbols``, which only simplifies the 40
+independent ones, first in this process and then over a process pool with
+one worker per CPU.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_symbolic_simplification.py
+"""
+
+import os
+import time
+from itertools import product
+
+import numpy
+
+from relatipy.symbolic.metrics import Kerr
+from relatipy.symbolic.simplification import simplify, simplify_christoffel_symbols
+
+
+def legacy_simplify(christoffel):
+    result = numpy.zeros((4, 4, 4), dtype=object)
+    for mu, nu, sigma in product(range(4), repeat=3):
+        result[mu, nu, sigma] = simplify(christoffel[mu][nu][sigma])
+    return result
+
+
+def bench(label, func):
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    print(f"    {label:<36s} {seconds:8.2f} s")
+    return seconds, result
+
+
+def main():
+    import einsteinpy.symbolic as es
+
+    christoffel = es.ChristoffelSymbols.from_metric(Kerr(cache=None).metric()).tensor().tolist()
+    processes = os.cpu_count()
+
+    print("Kerr Christoffel symbols")
+    t_before, before = bench("64 components, serial", lambda: legacy_simplify(christoffel))
+    t_symmetric, after = bench("40 components, serial", lambda: simplify_christoffel_symbols(christoffel, 1))
+    print(f"    speedup: {t_before / t_symmetric:.2f}x")
+    assert (before == after).all()
+
+    if processes > 1:
+        t_parallel, after = bench(f"40 components, {processes} processes", lambda: simplify_christoffel_symbols(christoffel))
+        print(f"    speedup: {t_before / t_parallel:.2f}x")
+        assert (before == after).all()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Micro-benchmark of the conversion of astropy Quantity arrays to geometric
+units by the Validator.
+
+Compares the former element-wise path (``.si`` and a unit lookup for every
+element) with the vectorized conversion of the whole array.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_validator.py
+"""
+
+import timeit
+
+import numpy
+from astropy import units as u
+
+from relatipy.numeric.utils.dimensions import validator
+
+
+def elementwise(vector):
+    return [validator.validate_length(x.si) for x in vector]
+
+
+def bench(label, func, number):
+    seconds = min(timeit.repeat(func, number=number, repeat=3)) / number
+    print(f"    {label:<28s} {seconds * 1e3:10.3f} ms")
+    return seconds
+
+
+def main(N=100_000):
+    radii = numpy.linspace(1, 100, N) * u.km
+    assert numpy.allclose(elementwise(radii[:10]), validator.validate_vector(radii[:10]))
+
+    print(f"{N} radii in km")
+    t_elementwise = bench("per element", lambda: elementwise(radii), 1)
+    t_vectorized = bench("whole array", lambda: validator.validate_vector(radii), 20)
+    print(f"    speedup: {t_elementwise / t_vectorized:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,9 +6,11 @@ import os
 this_dir = os.path.dirname(__file__)  # carpeta donde está este .py
 template_path_metric = os.path.join(this_dir, "metric_template.txt")
 template_path_coordinates = os.path.join(this_dir, "coordinate_template.txt")
+template_path_christoffel_derivatives = os.path.join(this_dir, "christoffel_derivatives_template.txt")
 
 template_metric = open(template_path_metric).read()
 template_coordinates = open(template_path_coordinates).read()
+template_christoffel_derivatives = open(template_path_christoffel_derivatives).read()
 
 
 def make_valid_varname(name):
@@ -248,4 +250,62 @@ def export_christoffel_symbols_to_code(metric):
         'gamma_txt': gamma_txt
     })
 
-    return txt
\ No newline at end of file
+    return txt
+
+
+def export_christoffel_derivatives_to_code(christoffel_symbols, nonzero):
+    """
+    Exporta las derivadas de los símbolos de Christoffel no nulos a código Python.
+
+    Las derivadas se calculan sobre los símbolos sin simplificar (simplificar
+    las 64 componentes tarda minutos) y las subexpresiones comunes se eliminan
+    con `sp.cse`. El código generado es vectorizado: acepta xs de forma (4,) o (N, 4).
+
+    Args:
+        christoffel_symbols: Símbolos de Christoffel simbólicos (4, 4, 4), por
+            ejemplo `es.ChristoffelSymbols.from_metric(metric.metric()).tensor()`.
+            Para Schwarzschild basta con sustituir a = 0 en los de Kerr.
+        nonzero: Lista de índices (sigma, mu, nu), con mu <= nu, de las
+            componentes independientes no nulas (`christoffel_nonzero` de la
+            métrica numérica).
+
+    Returns:
+        str: Código Python del método `_get_christoffel_derivatives`.
+    """
+    christoffel_symbols, substitutions = rename_symbols_of_expr(sp.Array(christoffel_symbols))
+    coordinates = sp.symbols("x0 x1 x2 x3")
+
+    derivatives = {}
+    for k, (sigma, mu, nu) in enumerate(nonzero):
+        component = sp.cancel(christoffel_symbols[sigma, mu, nu])
+        for lambda_, coordinate in enumerate(coordinates):
+            derivative = sp.diff(component, coordinate)
+            if derivative != 0:
+                derivatives[(lambda_, k)] = derivative
+
+    replacements, reduced = sp.cse(
+        list(derivatives.values()), symbols=sp.numbered_symbols("v", start=1)
+    )
+
+    auxiliary_variables = ""
+    for symbol, replacement in substitutions.items():
+        if 'x^' not in str(symbol):
+            auxiliary_variables += f"{replacement} = self.{replacement}\n"
+    auxiliary_variables += "\n"
+
+    for symbol, expr in replacements:
+        auxiliary_variables += f"{symbol} = {expr}\n"
+
+    dgamma_txt = ""
+    for (lambda_, k), expr in zip(derivatives.keys(), reduced):
+        dgamma_txt += f"dGamma[..., {lambda_}, {k}] = {expr}\n"
+
+    # Nombres con ceros a la izquierda: v1 -> v0001
+    pad = lambda txt: re.sub(r"\bv(\d+)\b", lambda m: f"v{int(m.group(1)):04d}", txt)
+
+    txt = fill_template(template_christoffel_derivatives, {
+        'auxiliary_variables': pad(auxiliary_variables),
+        'dgamma_txt': pad(dgamma_txt),
+    })
+
+    return txt.replace("$n_components$", str(len(nonzero)))
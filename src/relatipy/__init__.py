@@ -3,11 +3,22 @@
 Exports package version and convenience imports if needed.
 """
 
-__version__ = "0.0.0"
+import importlib
 
-# Expose subpackages for convenience
-from . import numeric
-from . import symbolic
-from . import visualization
+__version__ = "0.1.0"
+
+# Subpackages are imported on first access (PEP 562), so that numeric code
+# does not pay for sympy, einsteinpy or the visualization dependencies.
+_submodules = ("numeric", "symbolic", "visualization")
 
 __all__ = ["__version__", "numeric", "symbolic", "visualization"]
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_submodules))
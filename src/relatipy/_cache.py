@@ -0,0 +1,136 @@
+"""
+User cache directory of relatipy, shared by ``relatipy.symbolic`` and
+``relatipy.numeric`` so that neither imports the other.
+
+``get_cache_dir`` is the root of the caches. The kernel modules generated by
+``relatipy.symbolic.codegen`` are stored under it as ``<key>.py`` in
+``kernels/<relatipy version>``, where the key hashes the metric, its
+coordinates and the sympy version. Kernels generated by another version of
+relatipy are never picked up, and ``clear_kernels`` removes them.
+
+Loading a module only needs NumPy: worker processes that get the key of some
+kernels import them with ``load_kernels`` without running sympy.
+"""
+
+import functools
+import importlib.metadata
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+
+__all__ = [
+    "clear_kernels",
+    "get_cache_dir",
+    "get_kernel_dir",
+    "load_kernels",
+    "store_kernels",
+]
+
+
+def get_cache_dir():
+    """
+    Returns the root directory of the relatipy caches: ``$RELATIPY_CACHE_DIR``,
+    or ``relatipy`` under ``$XDG_CACHE_HOME`` (``~/.cache`` by default).
+    """
+    if "RELATIPY_CACHE_DIR" in os.environ:
+        return os.environ["RELATIPY_CACHE_DIR"]
+
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "relatipy")
+
+
+@functools.cache
+def _get_version():
+    """
+    Returns the version of the installed relatipy distribution, or
+    ``relatipy.__version__`` when running from a source tree.
+    """
+    try:
+        return importlib.metadata.version("relatipy")
+    except importlib.metadata.PackageNotFoundError:
+        from . import __version__
+
+        return __version__
+
+
+def get_kernel_dir():
+    """
+    Returns the directory of the kernels of this version of relatipy.
+    """
+    return os.path.join(get_cache_dir(), "kernels", _get_version())
+
+
+def load_kernels(key):
+    """
+    Imports the kernel module stored under ``key``.
+
+    Parameters
+    ----------
+    key : str
+        Key of the kernels, see ``relatipy.symbolic.codegen.get_kernel_key``.
+
+    Returns
+    -------
+    module or None
+        The kernel module, or None if it is not in the cache.
+    """
+    path = os.path.join(get_kernel_dir(), f"{key}.py")
+    module_name = f"relatipy_kernels_{key}"
+
+    if not os.path.exists(path):
+        return None
+
+    module = sys.modules.get(module_name)
+    if module is not None and getattr(module, "__file__", None) == path:
+        return module
+
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.KERNEL_KEY = key
+
+    sys.modules[module_name] = module
+    return module
+
+
+def store_kernels(key, source):
+    """
+    Writes the source of a kernel module under ``key`` and imports it.
+
+    Parameters
+    ----------
+    key : str
+        Key of the kernels.
+    source : str
+        Source of the module.
+
+    Returns
+    -------
+    module
+    """
+    directory = get_kernel_dir()
+    os.makedirs(directory, exist_ok=True)
+
+    # Written aside and renamed, so other processes never import half a module
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as file:
+            file.write(source)
+        os.replace(tmp_path, os.path.join(directory, f"{key}.py"))
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    sys.modules.pop(f"relatipy_kernels_{key}", None)
+    return load_kernels(key)
+
+
+def clear_kernels(all_versions=False):
+    """
+    Removes the cached kernels of this version of relatipy, or of every
+    version with ``all_versions=True``.
+    """
+    directory = os.path.dirname(get_kernel_dir()) if all_versions else get_kernel_dir()
+    shutil.rmtree(directory, ignore_errors=True)
@@ -5,11 +5,10 @@ This module provides numerical implementations for general relativity calculatio
 including coordinate systems, metrics, geodesics, and physical constants.
 """
 
-# Import submódulos
-from . import constants
-from . import coordinates
-from . import metrics
-from . import geodesic
+import importlib
+
+# Submódulos: se importan al primer acceso (PEP 562)
+_submodules = ("constants", "coordinates", "metrics", "geodesic", "camera", "kernels")
 
 # Import constants at module level for convenience
 from .constants import _c, _G
@@ -20,7 +19,19 @@ __all__ = [
     "coordinates",
     "metrics",
     "geodesic",
+    "camera",
+    "kernels",
     # Constants for convenience
     "_c",
     "_G",
 ]
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_submodules))
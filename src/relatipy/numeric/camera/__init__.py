@@ -0,0 +1,10 @@
+from .camera import Camera, CameraImage, FAILED, ESCAPED, CAPTURED, DISK
+
+__all__ = [
+    "Camera",
+    "CameraImage",
+    "FAILED",
+    "ESCAPED",
+    "CAPTURED",
+    "DISK",
+]
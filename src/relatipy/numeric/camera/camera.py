@@ -0,0 +1,189 @@
+import numpy
+
+from ..geodesic.events import EscapeEvent, HorizonEvent
+
+# Outcome of every pixel of a CameraImage
+FAILED = -1
+ESCAPED = 0
+CAPTURED = 1
+DISK = 2
+
+
+class CameraImage:
+    """
+    Per-pixel outcome of the rays traced by a ``Camera``.
+
+    Attributes
+    ----------
+    status : numpy.ndarray of shape (ny, nx)
+        ESCAPED, CAPTURED, DISK or FAILED for every pixel.
+    disk_radius : numpy.ndarray of shape (ny, nx)
+        Boyer-Lindquist radius where the ray hit the disk, NaN elsewhere.
+    alphas, betas : numpy.ndarray of shape (ny, nx)
+        Image plane coordinates of the pixels, in dimensionless units.
+    nfev : int
+        Number of evaluations of the geodesic equations, one per ray.
+    """
+
+    def __init__(self, status, disk_radius, alphas, betas, nfev):
+        self.status = status
+        self.disk_radius = disk_radius
+        self.alphas = alphas
+        self.betas = betas
+        self.nfev = nfev
+
+    @property
+    def shadow(self):
+        """Boolean mask of the pixels whose rays fall into the black hole."""
+        return self.status == CAPTURED
+
+    def __repr__(self):
+        ny, nx = self.status.shape
+        counts = {name: int(numpy.sum(self.status == status)) for name, status in
+                  (("escaped", ESCAPED), ("captured", CAPTURED), ("disk", DISK), ("failed", FAILED))}
+        return f"CameraImage({nx}x{ny}, " + ", ".join(f"{name}={count}" for name, count in counts.items()) + ")"
+
+
+class Camera:
+    """
+    Distant observer that traces the rays of its pixels back into a Kerr
+    spacetime.
+
+    Every pixel is a point (alpha, beta) of the observer's image plane, mapped
+    to the constants of motion of the ray that reaches it (Bardeen, 1973):
+    lambda = -alpha sin(i), eta = beta^2 + cos(i)^2 (alpha^2 - a^2). The rays
+    start at the observer moving inwards and are integrated together with
+    ``Geodesic.get_null_paths``.
+
+    Parameters
+    ----------
+    metric : Kerr
+        Kerr metric with a horizon, |a| <= M (``Kerr(mass, 0)`` for a
+        Schwarzschild black hole).
+    inclination : float
+        Angle between the line of sight and the spin axis, in radians, in (0, pi).
+    distance : float
+        Boyer-Lindquist radius of the observer in dimensionless units.
+    fov : float
+        Horizontal field of view in radians.
+    resolution : int or tuple of int
+        Number of pixels (nx, ny), or nx = ny.
+    disk : DiskEvent, optional
+        Thin equatorial disk. Without it the image only tells the shadow apart.
+    """
+
+    def __init__(self, metric, inclination, distance, fov, resolution, disk=None):
+        if not 0 < inclination < numpy.pi:
+            raise ValueError(f"The inclination must be in (0, pi), got {inclination}.")
+        if metric.horizon_radius is None:
+            raise ValueError("The camera needs a black hole, the metric has no event horizon (|a| > M).")
+
+        self.metric = metric
+        self.inclination = inclination
+        self.distance = distance
+        self.fov = fov
+        self.resolution = (resolution, resolution) if numpy.isscalar(resolution) else tuple(resolution)
+        self.disk = disk
+
+    def get_image_plane(self):
+        """
+        Returns the image plane coordinates (alphas, betas) of the pixel
+        centers, each of shape (ny, nx). Alpha grows to the right and beta
+        upwards, so row 0 is the top of the image.
+        """
+        nx, ny = self.resolution
+        half_width = self.distance * numpy.tan(self.fov / 2)
+        half_height = half_width * ny / nx
+
+        alphas = ((numpy.arange(nx) + 0.5) / nx * 2 - 1) * half_width
+        betas = (1 - (numpy.arange(ny) + 0.5) / ny * 2) * half_height
+        return numpy.meshgrid(alphas, betas)
+
+    def get_initial_conditions(self, alphas, betas):
+        """
+        Returns the initial positions and 4-momenta of the rays of the given
+        image plane points, both of shape (N, 4).
+
+        Parameters
+        ----------
+        alphas, betas : array of shape (N,)
+            Image plane coordinates.
+        """
+        a = self.metric.a
+        sin_i, cos_i = numpy.sin(self.inclination), numpy.cos(self.inclination)
+
+        lambdas = -alphas * sin_i
+        etas = betas**2 + cos_i**2 * (alphas**2 - a**2)
+
+        xs = numpy.zeros((len(alphas), 4))
+        xs[:, 1] = self.distance
+        xs[:, 2] = self.inclination
+
+        # Rays above the image center leave the observer towards the north pole
+        sign_theta = numpy.where(betas > 0, -1, 1)
+        ks = self.metric.get_null_4momentum_from_impact_parameters(xs, lambdas, etas, sign_r=-1, sign_theta=sign_theta)
+        return xs, ks
+
+    def render(self, rtol=1e-5, atol=1e-7, batch_size=65536):
+        """
+        Traces the rays of every pixel.
+
+        The rays are integrated with the adaptive lock-step "DOPRI5" bundle
+        integrator, so every ray controls its own step and leaves the batch
+        as soon as it escapes, falls in or hits the disk. The integration
+        variable is s, with d lambda = (r - r_+) ds (see ``radial_steps`` in
+        ``Geodesic.get_null_paths``).
+
+        Parameters
+        ----------
+        rtol, atol : float
+            Relative and absolute tolerances of every ray.
+        batch_size : int
+            Number of rays integrated together, it bounds the memory.
+
+        Returns
+        -------
+        CameraImage
+        """
+        alphas, betas = self.get_image_plane()
+        escape_radius = 1.01 * self.distance
+        # In s the radius changes exponentially: going in and out costs about
+        # 2 log(distance), the rest is left for orbits near the photon ring.
+        s_max = 2 * numpy.log(self.distance) + 8 * numpy.pi
+        events = [self.disk] if self.disk is not None else []
+
+        status = numpy.empty(alphas.size, dtype=int)
+        disk_radius = numpy.full(alphas.size, numpy.nan)
+        nfev = 0
+
+        for start in range(0, alphas.size, batch_size):
+            batch = slice(start, start + batch_size)
+            xs, ks = self.get_initial_conditions(alphas.ravel()[batch], betas.ravel()[batch])
+            result = self.metric.geodesic.get_null_paths(
+                xs, ks, [0, s_max], escape_radius=escape_radius, events=events, method="DOPRI5",
+                radial_steps=True, rtol=rtol, atol=atol,
+            )
+            nfev += result.nfev
+            status[batch] = self._classify(result)
+
+            hits = status[batch] == DISK
+            disk_radius[batch][hits] = result.y_stop[hits, 1]
+
+        shape = alphas.shape
+        return CameraImage(status.reshape(shape), disk_radius.reshape(shape), alphas, betas, nfev)
+
+    def _classify(self, result):
+        """
+        Returns the pixel outcome of every ray of a ``BundleResult``.
+        """
+        outcomes = numpy.array([
+            ESCAPED if isinstance(event, EscapeEvent) else CAPTURED if isinstance(event, HorizonEvent) else DISK
+            for event in result.events
+        ])
+
+        status = numpy.full(len(result.status), FAILED)
+        stopped = result.status == 1
+        status[stopped] = outcomes[result.event[stopped]]
+        # Rays still running at the end are trapped near the photon ring
+        status[result.status == 0] = CAPTURED
+        return status
@@ -11,6 +11,8 @@ from .cartesian import Cartesian
 from .spherical import Spherical
 from .boyer_lindquist import BoyerLindquist
 from .cilindrical import Cylindrical
+from .batch import CoordinateBatch
+from .conversions import conversions, get_conversion_path, register_conversion
 
 # Dictionary mapping coordinate system names to their classes
 coordinate_systems = {
@@ -27,5 +29,9 @@ __all__ = [
     "Spherical",
     "BoyerLindquist",
     "Cylindrical",
+    "CoordinateBatch",
     "coordinate_systems",
+    "conversions",
+    "get_conversion_path",
+    "register_conversion",
 ]
@@ -1,4 +1,3 @@
-from curses import echo
 from numpy import array, zeros_like, concatenate, asarray, ones, einsum
 from itertools import product
 
@@ -6,6 +5,11 @@ from ..constants import _c
 from ..utils.dimensions import validator
 
 class CoordinateBase:
+    # No per-instance __dict__: sweeps create millions of these objects.
+    # Only the given velocity form is stored, the other one and the state
+    # vector are derived on first access.
+    __slots__ = ("name_metric", "kwargs", "xs", "_vs", "_dxs_dt", "_state_vector")
+
     def __init__(
         self, xs, vels=None, from_dxs_dt=False, system_name="CoordinateBase", **kwargs
     ):
@@ -15,8 +19,6 @@ class CoordinateBase:
         vels = validator.validate_vector(vels)
 
         self.kwargs = kwargs
-        for key, value in kwargs.items():
-            setattr(self, key, value)
 
         if len(xs) != 4:
             raise ValueError(
@@ -26,19 +28,35 @@ class CoordinateBase:
             )
 
         self.xs = array(xs)
+        self._state_vector = None
 
         if vels is None:
-            self.vels = zeros_like(xs[1:])
-            self.dxs_dt = zeros_like(xs[1:])
+            self._vs = zeros_like(self.xs[1:], dtype=float)
+            self._dxs_dt = zeros_like(self.xs[1:], dtype=float)
+        elif not from_dxs_dt:
+            self._vs = array(vels)
+            self._dxs_dt = None
         else:
-            if not from_dxs_dt:
-                self.vs = vels
-                self.dxs_dt = self._get_dxs_dt_from_vs()
-            else:
-                self.dxs_dt = vels
-                self.vs = self._get_vs_from_dxs_dt()
-
-        self.state_vector = concatenate((self.xs, self.vs))
+            self._vs = None
+            self._dxs_dt = array(vels)
+
+    @property
+    def vs(self):
+        if self._vs is None:
+            self._vs = self._get_vs_from_dxs_dt()
+        return self._vs
+
+    @property
+    def dxs_dt(self):
+        if self._dxs_dt is None:
+            self._dxs_dt = self._get_dxs_dt_from_vs()
+        return self._dxs_dt
+
+    @property
+    def state_vector(self):
+        if self._state_vector is None:
+            self._state_vector = concatenate((self.xs, self.vs))
+        return self._state_vector
 
     def convert_to_cartesian(self):
         from .cartesian import Cartesian
@@ -49,31 +67,41 @@ class CoordinateBase:
 
     def convert_to(self, target_system, **kwargs):
         from . import coordinate_systems
+        from .conversions import convert
 
         if target_system not in coordinate_systems:
             raise ValueError(
                 f"Unsupported target coordinate system: {target_system}. Supported systems are: {list(coordinate_systems.keys())}"
             )
 
-        cartesian = self.convert_to_cartesian()
-        if target_system == "Cartesian":
-            return cartesian
+        if target_system == self.name_metric and kwargs == self.kwargs:
+            return self
 
-        target_class = coordinate_systems[target_system]
-        return target_class._convert_from_cartesian(cartesian.xs, cartesian.vs, **kwargs)
+        xs, vs = convert(self.xs, self.vs, self.name_metric, target_system, self.kwargs, kwargs)
+        return coordinate_systems[target_system](xs, vels=vs, from_dxs_dt=False, **kwargs)
 
     # Numerical methods
     def _get_vs_from_dxs_dt(self):
+        return self._vs_from_dxs_dt(self.xs, self.dxs_dt, **self.kwargs)
+
+    def _get_dxs_dt_from_vs(self):
+        return self._dxs_dt_from_vs(self.xs, self.vs, **self.kwargs)
+
+    # Statics & numerical methods
+    # They work on a single point, xs (4,) and vs (3,), or on N points stored
+    # as arrays of shape (4, N) and (3, N), see CoordinateBatch.
+    @staticmethod
+    def _vs_from_dxs_dt(xs, dxs_dt, **kwargs):
         raise NotImplementedError(
-            "Subclasses must implement get_vs_from_dxs_dt method."
+            "Subclasses must implement _vs_from_dxs_dt static method."
         )
 
-    def _get_dxs_dt_from_vs(self):
+    @staticmethod
+    def _dxs_dt_from_vs(xs, vs, **kwargs):
         raise NotImplementedError(
-            "Subclasses must implement get_dxs_dt_from_vs method."
+            "Subclasses must implement _dxs_dt_from_vs static method."
         )
 
-    # Statics & numerical methods
     @staticmethod
     def _convert_to_cartesian(xs, vs, **kwargs):
         raise NotImplementedError(
@@ -0,0 +1,118 @@
+import numpy
+
+from ..utils.dimensions import validator
+
+
+class CoordinateBatch:
+    """
+    N points of a coordinate system stored as arrays.
+
+    Unlike the coordinate objects, which hold one event each, a batch keeps
+    the positions and velocities of all its points in two contiguous arrays
+    and converts them with the static array functions of the coordinate
+    system, so no Python work is done per point.
+
+    Parameters
+    ----------
+    system_name : str
+        Name of the coordinate system, a key of ``coordinate_systems``.
+    xs : array of shape (4, N)
+        Positions [x0, x1, x2, x3] of the N points.
+    vels : array of shape (3, N), optional
+        Velocities of the N points, zero by default.
+    from_dxs_dt : bool
+        If True, ``vels`` are the coordinate velocities dx^i/dt, otherwise
+        the physical velocities vs.
+    **kwargs
+        Parameters of the coordinate system, e.g. the spin ``a`` of
+        Boyer-Lindquist coordinates.
+    """
+
+    def __init__(self, system_name, xs, vels=None, from_dxs_dt=False, **kwargs):
+        from . import coordinate_systems
+
+        if system_name not in coordinate_systems or system_name == "CoordinateBase":
+            raise ValueError(
+                f"Unsupported coordinate system: {system_name}. Supported systems are: {list(coordinate_systems.keys())[1:]}"
+            )
+
+        self.name_metric = system_name
+        self.system = coordinate_systems[system_name]
+        self.kwargs = kwargs
+
+        # The validator walks the 4 (and 3) rows, never the N points
+        xs = numpy.ascontiguousarray(validator.validate_vector(xs), dtype=float)
+        if xs.ndim != 2 or xs.shape[0] != 4:
+            raise ValueError(f"xs must have shape (4, N), got shape {xs.shape}")
+
+        if vels is None:
+            vels = numpy.zeros((3, xs.shape[1]))
+        vels = numpy.ascontiguousarray(validator.validate_vector(vels), dtype=float)
+        if vels.shape != (3, xs.shape[1]):
+            raise ValueError(f"vels must have shape (3, {xs.shape[1]}), got shape {vels.shape}")
+
+        self.xs = xs
+        if from_dxs_dt:
+            self.dxs_dt = vels
+            self.vs = numpy.ascontiguousarray(self.system._vs_from_dxs_dt(xs, vels, **kwargs))
+        else:
+            self.vs = vels
+            self.dxs_dt = numpy.ascontiguousarray(self.system._dxs_dt_from_vs(xs, vels, **kwargs))
+
+    @classmethod
+    def from_coordinates(cls, coordinates):
+        """
+        Stacks coordinate objects of the same system into a batch.
+
+        Parameters
+        ----------
+        coordinates : list of CoordinateBase
+            Single events of one coordinate system with the same parameters.
+        """
+        first = coordinates[0]
+        if any(c.name_metric != first.name_metric or c.kwargs != first.kwargs for c in coordinates):
+            raise ValueError("All the coordinates of a batch must share the coordinate system and its parameters.")
+
+        xs = numpy.array([c.xs for c in coordinates], dtype=float).T
+        vs = numpy.array([c.vs for c in coordinates], dtype=float).T
+        return cls(first.name_metric, xs, vs, from_dxs_dt=False, **first.kwargs)
+
+    @property
+    def state_vector(self):
+        """Positions and velocities as an array of shape (7, N)."""
+        return numpy.concatenate((self.xs, self.vs))
+
+    def convert_to_cartesian(self):
+        xs_p, vs_p = self.system._convert_to_cartesian(self.xs, self.vs, **self.kwargs)
+        return CoordinateBatch("Cartesian", xs_p, vs_p, from_dxs_dt=False)
+
+    def convert_to(self, target_system, **kwargs):
+        from . import coordinate_systems
+        from .conversions import convert
+
+        if target_system not in coordinate_systems:
+            raise ValueError(
+                f"Unsupported target coordinate system: {target_system}. Supported systems are: {list(coordinate_systems.keys())}"
+            )
+
+        if target_system == self.name_metric and kwargs == self.kwargs:
+            return self
+
+        xs, vs = convert(self.xs, self.vs, self.name_metric, target_system, self.kwargs, kwargs)
+        return CoordinateBatch(target_system, xs, vs, from_dxs_dt=False, **kwargs)
+
+    # Magic methods
+    def __len__(self):
+        return self.xs.shape[1]
+
+    def __getitem__(self, index):
+        """
+        Returns the point ``index`` as a coordinate object, or a sub-batch
+        for slices and index arrays.
+        """
+        if isinstance(index, (int, numpy.integer)):
+            return self.system(self.xs[:, index], vels=self.vs[:, index], from_dxs_dt=False, **self.kwargs)
+        return CoordinateBatch(self.name_metric, self.xs[:, index], self.vs[:, index], from_dxs_dt=False, **self.kwargs)
+
+    def __repr__(self):
+        return f"CoordinateBatch({self.name_metric}, N={len(self)})"
@@ -1,29 +1,31 @@
 import numpy
 from numpy import sin, cos, sqrt, arctan2, arccos
 from .base import CoordinateBase
+from .cilindrical import Cylindrical
 
 
 class BoyerLindquist(CoordinateBase):
+    __slots__ = ()
+
     def __init__(self, xs, vels=None, a=None, from_dxs_dt=False):
-        super().__init__(
-            xs, vels=vels, from_dxs_dt=from_dxs_dt, system_name="BoyerLindquist", a=a
-        )
-        if self.a is None:
+        if a is None:
             raise ValueError(
                 "The spin parameter 'a' must be provided for Boyer-Lindquist coordinates."
             )
+        super().__init__(
+            xs, vels=vels, from_dxs_dt=from_dxs_dt, system_name="BoyerLindquist", a=a
+        )
+
+    @property
+    def a(self):
+        return self.kwargs["a"]
 
-    def _get_dxs_dt_from_vs(self):
+    @staticmethod
+    def _dxs_dt_from_vs(xs, vs, a):
         # Matrix(
         # [[x1_prime_dot*sqrt(a**2*cos(x2)**2 + x1**2)/sqrt(a**2 + x1**2)],
         # [x2_prime_dot*sqrt(a**2*cos(x2)**2 + x1**2)],
         # [x3_prime_dot*sqrt(a**2 + x1**2)*sin(x2)]])
-        a = self.a
-        xs = self.xs
-        vs = self.vs
-
-
-        print(self.a)
         sqrt_cos = sqrt(a**2 * cos(xs[2]) ** 2 + xs[1] ** 2)
         sqrt_a = sqrt(a**2 + xs[1] ** 2)
         sin_x2 = sin(xs[2])
@@ -34,14 +36,12 @@ class BoyerLindquist(CoordinateBase):
 
         return numpy.array([dx1_dt, dx2_dt, dx3_dt])
 
-    def _get_vs_from_dxs_dt(self):
+    @staticmethod
+    def _vs_from_dxs_dt(xs, dxs_dt, a):
         # Matrix(
         # [[x1_prime_dot*sqrt(a**2*cos(x2)**2 + x1**2)/sqrt(a**2 + x1**2)],
         # [x2_prime_dot*sqrt(a**2*cos(x2)**2 + x1**2)],
         # [x3_prime_dot*sqrt(a**2 + x1**2)*sin(x2)]])
-        a = self.a
-        xs = self.xs
-        dxs_dt = self.dxs_dt
 
         sqrt_cos = sqrt(a**2 * cos(xs[2]) ** 2 + xs[1] ** 2)
         sqrt_a = sqrt(a**2 + xs[1] ** 2)
@@ -55,10 +55,10 @@ class BoyerLindquist(CoordinateBase):
 
     @staticmethod
     def _convert_to_cartesian(xs, vs, a):
-        xs_p = numpy.zeros_like(xs)
-        vs_p = numpy.zeros_like(vs)
+        xs_p = numpy.zeros_like(xs, dtype=float)
+        vs_p = numpy.zeros_like(vs, dtype=float)
 
-        xs[0] = xs_p[0]
+        xs_p[0] = xs[0]
 
         xa = sqrt(xs[1] ** 2 + a**2)
         sin_norm = xa * sin(xs[2])
@@ -83,8 +83,8 @@ class BoyerLindquist(CoordinateBase):
     @staticmethod
     def _convert_from_cartesian(xs_p, vs_p, a):
 
-        xs = numpy.zeros_like(xs_p)
-        vs = numpy.zeros_like(vs_p)
+        xs = numpy.zeros_like(xs_p, dtype=float)
+        vs = numpy.zeros_like(vs_p, dtype=float)
 
         xs[0] = xs_p[0]
 
@@ -110,8 +110,60 @@ class BoyerLindquist(CoordinateBase):
             (vs_p[1] * xs_p[1] - vs_p[0] * xs_p[2]) / (xs_p[1] ** 2)
         )
 
-        coordinate = BoyerLindquist(xs, vels=vs, from_dxs_dt=False, a=a)
-        return coordinate
+        return xs, vs
+
+    @staticmethod
+    def _convert_to_cylindrical(xs, vs, a):
+        # Boyer-Lindquist coordinates are oblate spheroidal: rho = sqrt(r^2 + a^2) sin(theta),
+        # z = r cos(theta) and phi is shared, so no Cartesian trigonometry is needed.
+        xs_c = numpy.zeros_like(xs, dtype=float)
+        vs_c = numpy.zeros_like(vs, dtype=float)
+
+        r, sin_x2, cos_x2 = xs[1], sin(xs[2]), cos(xs[2])
+        xa = sqrt(r**2 + a**2)
+
+        xs_c[0] = xs[0]
+        xs_c[1] = xa * sin_x2   # rho
+        xs_c[2] = xs[3]         # phi
+        xs_c[3] = r * cos_x2    # z
+
+        vs_c[0] = r * sin_x2 / xa * vs[0] + xa * cos_x2 * vs[1]
+        vs_c[1] = xs_c[1] * vs[2]
+        vs_c[2] = cos_x2 * vs[0] - r * sin_x2 * vs[1]
+
+        return xs_c, vs_c
+
+    @staticmethod
+    def _convert_from_cylindrical(xs_c, vs_c, a):
+        xs = numpy.zeros_like(xs_c, dtype=float)
+        vs = numpy.zeros_like(vs_c, dtype=float)
+
+        rho, z = xs_c[1], xs_c[3]
+        w = rho**2 + z**2 - a**2
+        r = sqrt(0.5 * (w + sqrt(w**2 + 4 * a**2 * z**2)))
+        xa = sqrt(r**2 + a**2)
+
+        xs[0] = xs_c[0]
+        xs[1] = r
+        xs[2] = arctan2(r * rho, xa * z)
+        xs[3] = xs_c[2]
+
+        # Inverse of the Jacobian of (r, theta) -> (rho, z)
+        sin_x2, cos_x2 = sin(xs[2]), cos(xs[2])
+        Sigma = r**2 + a**2 * cos_x2**2
+        vs[0] = xa * (r * sin_x2 * vs_c[0] + xa * cos_x2 * vs_c[2]) / Sigma
+        vs[1] = (xa * cos_x2 * vs_c[0] - r * sin_x2 * vs_c[2]) / Sigma
+        vs[2] = vs_c[1] / rho
+
+        return xs, vs
+
+    @staticmethod
+    def _convert_to_spherical(xs, vs, a):
+        return Cylindrical._convert_to_spherical(*BoyerLindquist._convert_to_cylindrical(xs, vs, a))
+
+    @staticmethod
+    def _convert_from_spherical(xs_s, vs_s, a):
+        return BoyerLindquist._convert_from_cylindrical(*Cylindrical._convert_from_spherical(xs_s, vs_s), a)
 
     def _get_Q(self, metric):
         "Obtener la constante de Carter Q"
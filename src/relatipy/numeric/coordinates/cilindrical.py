@@ -4,29 +4,33 @@ from .base import CoordinateBase
 
 
 class Cylindrical(CoordinateBase):
+    __slots__ = ()
+
     def __init__(self, xs, vels=None, from_dxs_dt=False):
         super().__init__(
             xs, vels=vels, from_dxs_dt=from_dxs_dt, system_name="Cylindrical"
         )
 
-    def _get_vs_from_dxs_dt(self):
+    @staticmethod
+    def _vs_from_dxs_dt(xs, dxs_dt):
         # v_rho = rho_dot, v_phi = rho * phi_dot, v_z = z_dot
-        v_rho = self.dxs_dt[0]
-        v_phi = self.dxs_dt[1] * self.xs[1]
-        v_z   = self.dxs_dt[2]
+        v_rho = dxs_dt[0]
+        v_phi = dxs_dt[1] * xs[1]
+        v_z   = dxs_dt[2]
         return numpy.array([v_rho, v_phi, v_z])
 
-    def _get_dxs_dt_from_vs(self):
+    @staticmethod
+    def _dxs_dt_from_vs(xs, vs):
         # drho/dt = v_rho, dphi/dt = v_phi / rho, dz/dt = v_z
-        drho_dt = self.vs[0]
-        dphi_dt = self.vs[1] / self.xs[1]
-        dz_dt   = self.vs[2]
+        drho_dt = vs[0]
+        dphi_dt = vs[1] / xs[1]
+        dz_dt   = vs[2]
         return numpy.array([drho_dt, dphi_dt, dz_dt])
 
     @staticmethod
     def _convert_to_cartesian(xs, vs):
-        xs_p = numpy.zeros_like(xs)
-        vs_p = numpy.zeros_like(vs)
+        xs_p = numpy.zeros_like(xs, dtype=float)
+        vs_p = numpy.zeros_like(vs, dtype=float)
 
         rho, phi, z = xs[1], xs[2], xs[3]
         sin_phi = sin(phi)
@@ -48,8 +52,8 @@ class Cylindrical(CoordinateBase):
 
     @staticmethod
     def _convert_from_cartesian(xs_p, vs_p):
-        xs = numpy.zeros_like(xs_p)
-        vs = numpy.zeros_like(vs_p)
+        xs = numpy.zeros_like(xs_p, dtype=float)
+        vs = numpy.zeros_like(vs_p, dtype=float)
 
         xs[0] = xs_p[0]
         xs[1] = sqrt(xs_p[1] ** 2 + xs_p[2] ** 2)  # rho
@@ -66,5 +70,45 @@ class Cylindrical(CoordinateBase):
         # v_z = vz
         vs[2] = vs_p[2]
 
-        coordinate = Cylindrical(xs, vels=vs, from_dxs_dt=False)
-        return coordinate
\ No newline at end of file
+        return xs, vs
+
+    @staticmethod
+    def _convert_to_spherical(xs, vs):
+        xs_s = numpy.zeros_like(xs, dtype=float)
+        vs_s = numpy.zeros_like(vs, dtype=float)
+
+        rho, z = xs[1], xs[3]
+        R_2 = rho**2 + z**2
+
+        xs_s[0] = xs[0]
+        xs_s[1] = sqrt(R_2)          # r
+        xs_s[2] = arctan2(rho, z)    # theta
+        xs_s[3] = xs[2]              # phi
+
+        # dr/dt = (rho*v_rho + z*v_z)/r, dtheta/dt = (z*v_rho - rho*v_z)/r^2, dphi/dt = v_phi/rho
+        vs_s[0] = (rho * vs[0] + z * vs[2]) / xs_s[1]
+        vs_s[1] = (z * vs[0] - rho * vs[2]) / R_2
+        vs_s[2] = vs[1] / rho
+
+        return xs_s, vs_s
+
+    @staticmethod
+    def _convert_from_spherical(xs_s, vs_s):
+        xs = numpy.zeros_like(xs_s, dtype=float)
+        vs = numpy.zeros_like(vs_s, dtype=float)
+
+        r = xs_s[1]
+        sin_t = sin(xs_s[2])
+        cos_t = cos(xs_s[2])
+
+        xs[0] = xs_s[0]
+        xs[1] = r * sin_t   # rho
+        xs[2] = xs_s[3]     # phi
+        xs[3] = r * cos_t   # z
+
+        # v_rho = sin(theta)*dr + r*cos(theta)*dtheta, v_phi = rho*dphi, v_z = cos(theta)*dr - r*sin(theta)*dtheta
+        vs[0] = sin_t * vs_s[0] + r * cos_t * vs_s[1]
+        vs[1] = xs[1] * vs_s[2]
+        vs[2] = cos_t * vs_s[0] - r * sin_t * vs_s[1]
+
+        return xs, vs
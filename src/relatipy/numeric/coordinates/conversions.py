@@ -0,0 +1,142 @@
+"""
+Registry of the conversions between coordinate systems.
+
+Every conversion is an edge (source, target) with a cost and a function
+``func(xs, vs, **kwargs) -> (xs, vs)`` that works on a single point, xs (4,)
+and vs (3,), or on N points stored as arrays of shape (4, N) and (3, N). The
+kwargs of an edge are the parameters of its ends, e.g. the spin ``a`` of
+Boyer-Lindquist coordinates.
+
+``convert`` follows the cheapest chain of edges between two systems. The
+conversions through Cartesian coordinates cost 2 and the direct ones cost 1,
+so e.g. Spherical -> BoyerLindquist skips the Cartesian trigonometry. The
+direct ones share the meridional plane (rho, z) of the axisymmetric systems
+and keep phi as it is.
+"""
+
+import heapq
+from functools import lru_cache
+
+from .boyer_lindquist import BoyerLindquist
+from .cilindrical import Cylindrical
+from .spherical import Spherical
+
+# (source, target) -> (func, cost)
+conversions = {}
+
+
+def register_conversion(source, target, func, cost=1):
+    """
+    Registers a direct conversion from ``source`` to ``target``.
+
+    Parameters
+    ----------
+    source, target : str
+        Names of the coordinate systems, keys of ``coordinate_systems``.
+    func : callable
+        ``func(xs, vs, **kwargs)`` returning the converted (xs, vs).
+    cost : float
+        Relative cost of the conversion, used to choose among paths.
+    """
+    conversions[(source, target)] = (func, cost)
+    get_conversion_path.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def get_conversion_path(source, target):
+    """
+    Returns the cheapest chain of systems from ``source`` to ``target``.
+
+    Returns
+    -------
+    tuple of str
+        Systems visited, starting with ``source`` and ending with ``target``.
+    """
+    if source == target:
+        return (source,)
+
+    costs = {source: 0}
+    previous = {}
+    queue = [(0, source)]
+    while queue:
+        cost, system = heapq.heappop(queue)
+        if system == target:
+            break
+        if cost > costs[system]:
+            continue
+        for (edge_source, edge_target), (_, edge_cost) in conversions.items():
+            if edge_source != system:
+                continue
+            new_cost = cost + edge_cost
+            if new_cost < costs.get(edge_target, float("inf")):
+                costs[edge_target] = new_cost
+                previous[edge_target] = system
+                heapq.heappush(queue, (new_cost, edge_target))
+
+    if target not in previous:
+        raise ValueError(f"There is no conversion from {source} to {target}.")
+
+    path = [target]
+    while path[-1] != source:
+        path.append(previous[path[-1]])
+    return tuple(reversed(path))
+
+
+def convert(xs, vs, source, target, source_kwargs=None, target_kwargs=None):
+    """
+    Converts positions and velocities between two coordinate systems.
+
+    Parameters
+    ----------
+    xs : array of shape (4,) or (4, N)
+        Positions in the ``source`` system.
+    vs : array of shape (3,) or (3, N)
+        Velocities in the ``source`` system.
+    source, target : str
+        Names of the coordinate systems.
+    source_kwargs, target_kwargs : dict, optional
+        Parameters of the source and target systems.
+
+    Returns
+    -------
+    tuple
+        (xs, vs) in the ``target`` system. With the same system and
+        parameters at both ends the inputs are returned as they are.
+    """
+    source_kwargs = source_kwargs or {}
+    target_kwargs = target_kwargs or {}
+
+    if source == target and source_kwargs == target_kwargs:
+        return xs, vs
+
+    # Parametrized systems at both ends with different parameters (e.g. two
+    # spins) have no direct edge: go through their neighbours.
+    path = get_conversion_path(source, target) if source != target else _get_roundtrip_path(source)
+
+    for i, (edge_source, edge_target) in enumerate(zip(path[:-1], path[1:])):
+        func, _ = conversions[(edge_source, edge_target)]
+        kwargs = {**(source_kwargs if i == 0 else {}), **(target_kwargs if i == len(path) - 2 else {})}
+        xs, vs = func(xs, vs, **kwargs)
+
+    return xs, vs
+
+
+def _get_roundtrip_path(system):
+    neighbours = [(cost, target) for (source, target), (_, cost) in conversions.items() if source == system]
+    if not neighbours:
+        raise ValueError(f"There is no conversion from {system} to {system}.")
+    _, neighbour = min(neighbours)
+    return (system, neighbour, system)
+
+
+for _system in (Spherical, Cylindrical, BoyerLindquist):
+    _name = _system.__name__
+    register_conversion(_name, "Cartesian", _system._convert_to_cartesian, cost=2)
+    register_conversion("Cartesian", _name, _system._convert_from_cartesian, cost=2)
+
+register_conversion("Spherical", "BoyerLindquist", BoyerLindquist._convert_from_spherical)
+register_conversion("BoyerLindquist", "Spherical", BoyerLindquist._convert_to_spherical)
+register_conversion("Cylindrical", "BoyerLindquist", BoyerLindquist._convert_from_cylindrical)
+register_conversion("BoyerLindquist", "Cylindrical", BoyerLindquist._convert_to_cylindrical)
+register_conversion("Spherical", "Cylindrical", Cylindrical._convert_from_spherical)
+register_conversion("Cylindrical", "Spherical", Cylindrical._convert_to_spherical)
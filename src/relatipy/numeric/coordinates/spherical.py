@@ -4,30 +4,34 @@ from .base import CoordinateBase
 
 
 class Spherical(CoordinateBase):
+    __slots__ = ()
+
     def __init__(self, xs, vels=None, from_dxs_dt=False):
         super().__init__(
             xs, vels=vels, from_dxs_dt=from_dxs_dt, system_name="Spherical"
         )
 
-    def _get_vs_from_dxs_dt(self):
+    @staticmethod
+    def _vs_from_dxs_dt(xs, dxs_dt):
         # [[x1_prime_dot], [x1*x2_prime_dot], [x1*x3_prime_dot*sin(x2)]]
-        x1_prime_dot = self.dxs_dt[0]
-        x2_prime_dot = self.dxs_dt[1] * self.xs[1]
-        x3_prime_dot = self.dxs_dt[2] * self.xs[1] * sin(self.xs[2])
+        x1_prime_dot = dxs_dt[0]
+        x2_prime_dot = dxs_dt[1] * xs[1]
+        x3_prime_dot = dxs_dt[2] * xs[1] * sin(xs[2])
 
         return numpy.array([x1_prime_dot, x2_prime_dot, x3_prime_dot])
 
-    def _get_dxs_dt_from_vs(self):
+    @staticmethod
+    def _dxs_dt_from_vs(xs, vs):
         # [[x1_prime_dot], [x1*x2_prime_dot], [x1*x3_prime_dot*sin(x2)]]
-        dx1_dt = self.vs[0]
-        dx2_dt = self.vs[1] / self.xs[1]
-        dx3_dt = self.vs[2] / (self.xs[1] * sin(self.xs[2]))
+        dx1_dt = vs[0]
+        dx2_dt = vs[1] / xs[1]
+        dx3_dt = vs[2] / (xs[1] * sin(xs[2]))
         return numpy.array([dx1_dt, dx2_dt, dx3_dt])
 
     @staticmethod
     def _convert_to_cartesian(xs, vs):
-        xs_p = numpy.zeros_like(xs)
-        vs_p = numpy.zeros_like(vs)
+        xs_p = numpy.zeros_like(xs, dtype=float)
+        vs_p = numpy.zeros_like(vs, dtype=float)
 
         xs_p[0] = xs[0]
         xs_p[1] = xs[1] * sin(xs[2]) * cos(xs[3])
@@ -60,8 +64,8 @@ class Spherical(CoordinateBase):
 
     @staticmethod
     def _convert_from_cartesian(xs_p, vs_p):
-        xs = numpy.zeros_like(xs_p)
-        vs = numpy.zeros_like(vs_p)
+        xs = numpy.zeros_like(xs_p, dtype=float)
+        vs = numpy.zeros_like(vs_p, dtype=float)
 
         xs[0] = xs_p[0]
         xs[1] = sqrt(xs_p[1] ** 2 + xs_p[2] ** 2 + xs_p[3] ** 2)
@@ -85,6 +89,4 @@ class Spherical(CoordinateBase):
 
         vs[2] = (-sin_x3 * vs_p[0] + cos_x3 * vs_p[1]) / (xs[1] * sin_x2)
 
-        coordinate = Spherical(xs, vels=vs, from_dxs_dt=False)
-
-        return coordinate
+        return xs, vs
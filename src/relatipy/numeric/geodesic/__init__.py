@@ -1,3 +1,19 @@
 from .geodesic import Geodesic
+from .events import GeodesicEvent, HorizonEvent, EscapeEvent, EquatorialPlaneEvent, DiskEvent
+from .integrators import BundleResult, IntegrationResult, bundle_integrators, integrate_bundle, integrators
+from .parallel import get_paths_parallel
 
-__all__ = ["Geodesic"]
\ No newline at end of file
+__all__ = [
+    "Geodesic",
+    "GeodesicEvent",
+    "HorizonEvent",
+    "EscapeEvent",
+    "EquatorialPlaneEvent",
+    "DiskEvent",
+    "IntegrationResult",
+    "BundleResult",
+    "integrate_bundle",
+    "bundle_integrators",
+    "integrators",
+    "get_paths_parallel",
+]
\ No newline at end of file
@@ -0,0 +1,128 @@
+import numpy
+
+
+class GeodesicEvent:
+    """
+    Base class of the events that can stop or be recorded during a geodesic
+    integration.
+
+    Events follow the ``solve_ivp`` convention: they are callables
+    event(tau, ys) whose zeros mark the crossing, with the attributes
+    ``terminal`` (stop the integration) and ``direction`` (only count zeros
+    crossed from negative to positive if 1, from positive to negative if -1,
+    both if 0). ``ys`` may be a single state of shape (8,) or an array of
+    shape (N, 8), in the coordinates of the metric.
+    """
+
+    terminal = True
+    direction = 0
+
+    def __call__(self, tau, ys):
+        raise NotImplementedError("Subclasses must implement __call__ method.")
+
+    def accept(self, tau, ys):
+        """
+        Returns whether the crossings located at (tau, ys) count as events.
+
+        Only ``integrate_bundle`` filters the crossings, the other backends
+        count every zero of the event.
+        """
+        return numpy.ones(numpy.shape(ys)[:-1], dtype=bool)
+
+
+class HorizonEvent(GeodesicEvent):
+    """
+    Crossing of the surface r = r_+ + epsilon while falling into the black hole.
+
+    Parameters
+    ----------
+    metric : BaseMetric
+        Metric with an event horizon (``horizon_radius`` not None), written in
+        coordinates whose x^1 is the radius (Spherical, BoyerLindquist).
+    epsilon : float
+        Distance to the horizon where the event is triggered, it keeps the
+        integrator away from the coordinate singularity.
+    terminal : bool
+        Whether the integration stops at the crossing.
+    """
+
+    direction = -1
+
+    def __init__(self, metric, epsilon=1e-3, terminal=True):
+        if metric.horizon_radius is None:
+            raise ValueError(f"{type(metric).__name__} metric has no event horizon.")
+
+        self.radius = metric.horizon_radius + epsilon
+        self.terminal = terminal
+
+    def __call__(self, tau, ys):
+        return ys[..., 1] - self.radius
+
+
+class EscapeEvent(GeodesicEvent):
+    """
+    Crossing of the sphere r = radius moving outwards.
+
+    Parameters
+    ----------
+    radius : float
+        Escape radius in dimensionless units.
+    terminal : bool
+        Whether the integration stops at the crossing.
+    """
+
+    direction = 1
+
+    def __init__(self, radius, terminal=True):
+        self.radius = radius
+        self.terminal = terminal
+
+    def __call__(self, tau, ys):
+        return ys[..., 1] - self.radius
+
+
+class EquatorialPlaneEvent(GeodesicEvent):
+    """
+    Crossing of the equatorial plane theta = pi / 2, recorded by default.
+
+    Parameters
+    ----------
+    terminal : bool
+        Whether the integration stops at the crossing.
+    direction : int
+        1 for crossings from the southern to the northern hemisphere, -1 for
+        the opposite, 0 for both.
+    """
+
+    def __init__(self, terminal=False, direction=0):
+        self.terminal = terminal
+        self.direction = direction
+
+    def __call__(self, tau, ys):
+        return numpy.cos(ys[..., 2])
+
+
+class DiskEvent(EquatorialPlaneEvent):
+    """
+    Crossing of a thin equatorial disk inner_radius <= r <= outer_radius.
+
+    Crossings of the equatorial plane outside the disk are rejected by
+    ``accept``, so in ray bundles the rays go on through the plane.
+
+    Parameters
+    ----------
+    inner_radius : float
+        Inner edge of the disk in dimensionless units, e.g. the ISCO.
+    outer_radius : float
+        Outer edge of the disk in dimensionless units.
+    terminal : bool
+        Whether the integration stops at the disk.
+    """
+
+    def __init__(self, inner_radius, outer_radius, terminal=True):
+        super().__init__(terminal=terminal)
+        self.inner_radius = inner_radius
+        self.outer_radius = outer_radius
+
+    def accept(self, tau, ys):
+        return (ys[..., 1] >= self.inner_radius) & (ys[..., 1] <= self.outer_radius)
@@ -1,29 +1,147 @@
 import numpy
-from itertools import product
-from scipy.integrate import solve_ivp
 
 from ..coordinates import coordinate_systems
+from ..coordinates.conversions import convert as convert_coordinates
+from .events import EscapeEvent, HorizonEvent
+from .integrators import integrate, integrate_bundle
+from .parallel import get_paths_parallel
 
 
 class Geodesic:
     def __init__(self, metric):
         self.metric = metric
         self.valid_coordinate = self.metric.valid_coordinate
+        # IntegrationResult of the last integration (nfev, njev, status, ...)
+        self.last_result = None
 
     def model_geodesic(self, tau, ys0):
-        xs0 = ys0[:4]
-        us0 = ys0[4:]
+        """
+        Right-hand side of the geodesic equations.
+
+        Parameters
+        ----------
+        tau : float
+            Proper time.
+        ys0 : array of shape (8,) or (N, 8)
+            States [x0, x1, x2, x3, u0, u1, u2, u3] of one or N particles.
+        """
+        xs0 = ys0[..., :4]
+        us0 = ys0[..., 4:]
+
+        Gammas, _ = self.metric.get_christoffel_symbols(xs0, compact=True)
+        as_ = self._get_acceleration_from_components(Gammas, us0)
 
-        as_ = numpy.zeros(4)
+        return numpy.concatenate([us0, as_], axis=-1)
 
-        chris = self.metric.get_christoffel_symbols(xs0)
+    def model_geodesic_batch(self, tau, ys0):
+        """
+        Right-hand side of the geodesic equations for N particles at once.
 
-        for sigma, mu, nu in product(range(4), repeat=3):
-            as_[sigma] -= chris[sigma, mu, nu] * us0[mu] * us0[nu]
+        Parameters
+        ----------
+        tau : float
+            Proper time.
+        ys0 : array of shape (8 * N,)
+            Flattened states [x0, x1, x2, x3, u0, u1, u2, u3] of the N particles.
+        """
+        # One metric call for the whole batch: (N, 4) -> (N, 4, 4, 4)
+        return self.model_geodesic(tau, ys0.reshape(-1, 8)).ravel()
+
+    def jacobian_geodesic(self, tau, ys0):
+        """
+        Analytic Jacobian of the right-hand side of the geodesic equations.
+
+        Parameters
+        ----------
+        tau : float
+            Proper time.
+        ys0 : array of shape (8,) or (N, 8)
+            States [x0, x1, x2, x3, u0, u1, u2, u3] of one or N particles.
+
+        Returns
+        -------
+        numpy.ndarray of shape (8, 8) or (N, 8, 8)
+        """
+        xs0 = ys0[..., :4]
+        us0 = ys0[..., 4:]
+
+        _, mus, nus, weights = self.metric.christoffel_contraction
+        Gammas, _ = self.metric.get_christoffel_symbols(xs0, compact=True)  # (..., K)
+        dGammas = self.metric.get_christoffel_derivatives(xs0)  # (..., 4, K)
+
+        us_mu = numpy.take(us0, mus, axis=-1)
+        us_nu = numpy.take(us0, nus, axis=-1)
+
+        # d a^sigma / d x^lambda = -dGamma^sigma_{mu nu}/dx^lambda u^mu u^nu
+        das_dxs = -((dGammas * (us_mu * us_nu)[..., None, :]) @ weights)  # (..., lambda, sigma)
+
+        # d a^sigma / d u^kappa = -Gamma^sigma_{mu nu} (delta^mu_kappa u^nu + u^mu delta^nu_kappa)
+        kappas = numpy.arange(4)[:, None]
+        dus = (kappas == mus) * us_nu[..., None, :] + (kappas == nus) * us_mu[..., None, :]
+        das_dus = -((Gammas[..., None, :] * dus) @ weights)  # (..., kappa, sigma)
+
+        jac = numpy.zeros(ys0.shape[:-1] + (8, 8))
+        jac[..., :4, 4:] = numpy.eye(4)
+        jac[..., 4:, :4] = numpy.swapaxes(das_dxs, -1, -2)
+        jac[..., 4:, 4:] = numpy.swapaxes(das_dus, -1, -2)
+
+        return jac
+
+    def jacobian_geodesic_batch(self, tau, ys0):
+        """
+        Analytic Jacobian of ``model_geodesic_batch`` as a block diagonal
+        sparse matrix of shape (8 * N, 8 * N).
+
+        Parameters
+        ----------
+        tau : float
+            Proper time.
+        ys0 : array of shape (8 * N,)
+            Flattened states of the N particles.
+        """
+        from scipy.sparse import bsr_matrix
 
-        return numpy.concatenate([us0, as_])
+        blocks = self.jacobian_geodesic(tau, ys0.reshape(-1, 8))
+        N = len(blocks)
+        return bsr_matrix((blocks, numpy.arange(N), numpy.arange(N + 1)), shape=(8 * N, 8 * N))
 
-    def get_path(self, initial_conditions, taus):
+    def get_acceleration(self, chris, us):
+        """
+        Returns the geodesic acceleration -Gamma^sigma_{mu nu} u^mu u^nu.
+
+        Only the independent non-zero components listed by the metric are
+        contracted, so a single vectorized operation replaces the loop over
+        the 64 components.
+
+        Parameters
+        ----------
+        chris : array of shape (4, 4, 4) or (N, 4, 4, 4)
+            Christoffel symbols Gamma^sigma_{mu nu}.
+        us : array of shape (4,) or (N, 4)
+            4-velocities.
+        """
+        flat, _, _, _ = self.metric.christoffel_contraction
+
+        # numpy.take on the flattened tensor is much cheaper than fancy indexing
+        Gammas = numpy.take(chris.reshape(chris.shape[:-3] + (64,)), flat, axis=-1)
+        return self._get_acceleration_from_components(Gammas, us)
+
+    def _get_acceleration_from_components(self, Gammas, us):
+        """
+        Returns the geodesic acceleration from the compact Christoffel layout.
+
+        Parameters
+        ----------
+        Gammas : array of shape (K,) or (N, K)
+            Independent non-zero Christoffel components, ordered as the
+            metric's ``christoffel_indices``.
+        us : array of shape (4,) or (N, 4)
+            4-velocities.
+        """
+        _, mus, nus, weights = self.metric.christoffel_contraction
+        return -(Gammas * numpy.take(us, mus, axis=-1) * numpy.take(us, nus, axis=-1)) @ weights
+
+    def get_path(self, initial_conditions, taus, method="Radau", events=None, convert=True, **options):
         """
         Returns the geodesic equations for a test particle in the given metric.
 
@@ -33,6 +151,20 @@ class Geodesic:
             Initial conditions in a specified coordinate system.
         taus : list
             List of proper time values where the solution is evaluated.
+        method : str
+            Integrator backend, see ``integrators.integrators``. The number of
+            right-hand side evaluations is reported in ``last_result.nfev``.
+        events : list of GeodesicEvent, optional
+            Events such as ``HorizonEvent``, ``EscapeEvent`` or
+            ``EquatorialPlaneEvent``. Terminal events stop the path at the
+            last value of ``taus`` before the crossing; the exact crossings
+            are in ``last_result.t_events`` and ``last_result.y_events``.
+        convert : bool
+            If False, the raw 4-state vectors of shape (8, len(taus)) in the
+            coordinates of the metric are returned and the conversion back to
+            the system of ``initial_conditions`` is skipped.
+        **options
+            Options of the integrator backend (``rtol``, ``atol``, ``step``, ...).
         """
         original_coordinate = initial_conditions.name_metric
         original_kwargs = initial_conditions.kwargs
@@ -40,19 +172,246 @@ class Geodesic:
             initial_conditions = initial_conditions.convert_to(self.valid_coordinate, **self.metric.kwargs)
 
         ys0 = self.metric.get_4state_vector(initial_conditions)
-        sol = self._get_path_from_4state_vector(ys0, taus)
+        sol = self._get_path_from_4state_vector(ys0, taus, method, events, **options)
 
-        dxs_dt = self.metric.get_dxs_dt_from_4velocity(sol[4:])
-        ys = coordinate_systems[initial_conditions.name_metric](
-            sol[:4], vels=dxs_dt[1:], from_dxs_dt=True, **initial_conditions.kwargs
+        if not convert:
+            return sol
+
+        return self._get_coordinates_from_4state_vectors(
+            sol, initial_conditions.kwargs, original_coordinate, original_kwargs
         )
 
-        if original_coordinate != initial_conditions.name_metric:
-            ys = ys.convert_to(original_coordinate, **original_kwargs)
+    def _get_coordinates_from_4state_vectors(self, ys, kwargs, target_system, target_kwargs):
+        """
+        Converts a trajectory from 4-state vectors to a coordinate object.
+
+        The conversion runs once over the arrays of all the samples.
+
+        Parameters
+        ----------
+        ys : array of shape (8, T)
+            4-state vectors in the coordinates of the metric.
+        kwargs : dict
+            Parameters of the coordinates of the metric, e.g. the spin.
+        target_system : str
+            Name of the coordinate system of the result.
+        target_kwargs : dict
+            Parameters of the target coordinate system.
+
+        Returns
+        -------
+        CoordinateBase
+            Coordinate object whose xs (4, T) and vs (3, T) hold the trajectory.
+        """
+        xs = ys[:4]
+        dxs_dt = self.metric.get_dxs_dt_from_4velocity(ys[4:])[1:]
+        vs = coordinate_systems[self.valid_coordinate]._vs_from_dxs_dt(xs, dxs_dt, **kwargs)
 
-        return ys
+        xs, vs = convert_coordinates(xs, vs, self.valid_coordinate, target_system, kwargs, target_kwargs)
+        return coordinate_systems[target_system](xs, vels=vs, from_dxs_dt=False, **target_kwargs)
 
-    def _get_path_from_4state_vector(self, ys0, taus):
+    def get_paths(self, initial_conditions, taus, method="Radau", **options):
+        """
+        Integrates the geodesics of N test particles together.
+
+        All the particles share a single ``solve_ivp`` call and the metric is
+        evaluated once per step on the ``(N, 4)`` array of positions. Events
+        are not supported, since they would see the flat state of all the
+        particles; use ``get_paths_parallel`` or ``get_paths_lockstep``.
+
+        Parameters
+        ----------
+        initial_conditions : list of CoordinateSystem or array of shape (N, 8)
+            Initial conditions of the N particles, either as coordinate objects
+            in any coordinate system or as 4-state vectors
+            [x0, x1, x2, x3, u0, u1, u2, u3] in the coordinates of the metric.
+        taus : list
+            List of proper time values where the solutions are evaluated.
+        method : str
+            Integrator backend, see ``integrators.integrators``.
+        **options
+            Options of the integrator backend.
+
+        Returns
+        -------
+        numpy.ndarray of shape (N, 8, len(taus))
+            4-state vectors of every particle in the coordinates of the metric.
+        """
+        ys0 = self._get_4state_vectors(initial_conditions)
+        return self._get_paths_from_4state_vectors(ys0, taus, method, **options)
+
+    def get_paths_parallel(
+        self, initial_conditions, taus, method="Radau", events=None, max_workers=None, chunksize=None, **options
+    ):
+        """
+        Integrates the geodesics of N test particles on a process pool.
+
+        Unlike ``get_paths``, every particle keeps its own step size and its
+        own events, and the chunks of particles run in separate processes.
+
+        Parameters
+        ----------
+        initial_conditions : list of CoordinateSystem or array of shape (N, 8)
+            Initial conditions of the N particles, either as coordinate objects
+            in any coordinate system or as 4-state vectors in the coordinates
+            of the metric.
+        taus : list
+            List of proper time values where the solutions are evaluated.
+        method : str
+            Integrator backend, see ``integrators.integrators``.
+        events : list of GeodesicEvent, optional
+            Events located during the integration of every particle.
+        max_workers : int, optional
+            Number of worker processes, ``os.cpu_count()`` by default.
+        chunksize : int, optional
+            Number of particles sent to a worker at once.
+        **options
+            Options of the integrator backend.
+
+        Returns
+        -------
+        numpy.ndarray of shape (N, 8, len(taus))
+            4-state vectors of every particle in the coordinates of the metric,
+            padded with NaN after a terminal event.
+        """
+        ys0 = self._get_4state_vectors(initial_conditions)
+        return get_paths_parallel(
+            self.metric, ys0, taus, method, events, max_workers=max_workers, chunksize=chunksize, **options
+        )
+
+    def get_null_paths(
+        self, xs, ks, lambdas, escape_radius=1e3, epsilon=1e-3, events=None, method="RK4", radial_steps=False,
+        **options,
+    ):
+        """
+        Integrates a bundle of null geodesics (photons) together.
+
+        The rays advance in lock step (see ``integrators.integrate_bundle``)
+        and the metric is evaluated once per stage on the positions of the
+        rays still running. Each ray retires when it escapes, falls into the
+        horizon or crosses one of ``events``.
+
+        Parameters
+        ----------
+        xs : array of shape (N, 4)
+            Initial positions in the coordinates of the metric.
+        ks : array of shape (N, 4)
+            Initial 4-momenta, see ``BaseMetric.get_null_4momentum`` and
+            ``Kerr.get_null_4momentum_from_impact_parameters``.
+        lambdas : list
+            Values of the affine parameter where the rays are evaluated.
+        escape_radius : float or None
+            Rays crossing this radius outwards have escaped to infinity.
+        epsilon : float
+            Rays closer than epsilon to the horizon are captured. Ignored if
+            the metric has no horizon.
+        events : list of GeodesicEvent, optional
+            Extra terminal events, e.g. ``EquatorialPlaneEvent(terminal=True)``.
+        method : str
+            Bundle integrator, "RK4" (fixed steps) or "DOPRI5" (adaptive step
+            per ray), see ``integrators.bundle_integrators``.
+        radial_steps : bool
+            If True, the rays are integrated in the parameter s with
+            d lambda = (r - r_+) ds, where r_+ is the horizon radius, so
+            ``lambdas`` and ``step`` are values of s. The step of the affine
+            parameter grows with the radius: far away rays take a few long
+            steps, and rays falling in approach the horizon with shrinking
+            steps instead of jumping over it. The metric must have a horizon.
+        **options
+            Options of the bundle integrator: ``step`` for "RK4", ``rtol``,
+            ``atol``, ``max_step``, ... for "DOPRI5".
+
+        Returns
+        -------
+        BundleResult
+            Rays of shape (N, 8, len(lambdas)) in ``y``. ``event`` indexes
+            ``events`` of the result, which lists the escape event, the horizon
+            event and then the extra ``events``, in this order, when present.
+        """
+        ys0 = numpy.concatenate([numpy.atleast_2d(xs), numpy.atleast_2d(ks)], axis=-1).astype(float)
+
+        terminal_events = []
+        if escape_radius is not None:
+            terminal_events.append(EscapeEvent(escape_radius))
+        if self.metric.horizon_radius is not None:
+            terminal_events.append(HorizonEvent(self.metric, epsilon))
+        terminal_events.extend(events or [])
+
+        fun = self.model_geodesic
+        if radial_steps:
+            if self.metric.horizon_radius is None:
+                raise ValueError(f"radial_steps needs an event horizon, the {type(self.metric).__name__} metric has none.")
+            r_0 = self.metric.horizon_radius
+
+            def fun(s, ys):
+                return self.model_geodesic(s, ys) * (ys[..., 1:2] - r_0)
+
+        self.last_result = integrate_bundle(fun, lambdas, ys0, events=terminal_events, method=method, **options)
+        return self.last_result
+
+    def get_paths_lockstep(self, initial_conditions, taus, method="DOPRI5", events=None, **options):
+        """
+        Integrates the geodesics of N test particles in lock step.
+
+        Unlike ``get_paths``, every particle controls its own step size and
+        leaves the active set when it finishes or crosses a terminal event, so
+        the metric is evaluated once per stage on the ``(M, 4)`` positions of
+        the M particles still running.
+
+        Parameters
+        ----------
+        initial_conditions : list of CoordinateSystem or array of shape (N, 8)
+            Initial conditions of the N particles, either as coordinate objects
+            in any coordinate system or as 4-state vectors in the coordinates
+            of the metric.
+        taus : list
+            Increasing proper time values where the solutions are evaluated.
+        method : str
+            Bundle integrator, see ``integrators.bundle_integrators``.
+        events : list of GeodesicEvent, optional
+            Terminal events, e.g. ``HorizonEvent`` or ``EscapeEvent``.
+        **options
+            Options of the bundle integrator (``rtol``, ``atol``, ...).
+
+        Returns
+        -------
+        BundleResult
+            4-state vectors of shape (N, 8, len(taus)) in ``y``, in the
+            coordinates of the metric and NaN after a particle stopped.
+        """
+        ys0 = self._get_4state_vectors(initial_conditions)
+
+        self.last_result = integrate_bundle(self.model_geodesic, taus, ys0, events=events, method=method, **options)
+        return self.last_result
+
+    def _get_4state_vectors(self, initial_conditions):
+        """
+        Returns the 4-state vectors of N particles as an array of shape (N, 8).
+
+        Parameters
+        ----------
+        initial_conditions : list of CoordinateSystem or array of shape (N, 8)
+            Initial conditions of the N particles.
+        """
+        if isinstance(initial_conditions, numpy.ndarray):
+            ys0 = numpy.asarray(initial_conditions, dtype=float)
+            if ys0.ndim != 2 or ys0.shape[1] != 8:
+                raise ValueError(f"4-state vectors must have shape (N, 8), got shape {ys0.shape}")
+            return ys0
+
+        coordinates = [
+            coordinate if coordinate.name_metric == self.valid_coordinate
+            else coordinate.convert_to(self.valid_coordinate, **self.metric.kwargs)
+            for coordinate in initial_conditions
+        ]
+        if not coordinates:
+            return numpy.empty((0, 8))
+
+        xs = numpy.array([coordinate.xs for coordinate in coordinates], dtype=float)
+        dxs_dt = numpy.array([coordinate.dxs_dt for coordinate in coordinates], dtype=float)
+        return self.metric.get_4state_vectors(xs, dxs_dt)
+
+    def _get_path_from_4state_vector(self, ys0, taus, method="Radau", events=None, **options):
         """
         Returns the geodesic equations for a test particle in the given metric.
 
@@ -62,11 +421,53 @@ class Geodesic:
             Initial conditions [x0, x1, x2, x3, u0, u1, u2, u3].
         taus : list
             List of proper time values where the solution is evaluated.
+        method : str
+            Integrator backend, see ``integrators.integrators``.
+        events : list of GeodesicEvent, optional
+            Events located during the integration.
+        """
+        # Without an analytic Jacobian the implicit methods estimate it by finite differences
+        jac = self.jacobian_geodesic if self.metric.has_christoffel_derivatives else None
+
+        self.last_result = integrate(self.model_geodesic, taus, ys0, method=method, jac=jac, events=events, **options)
+        if self.last_result.status == -1:
+            print("WARNING: Integration failed.")
+
+        return self.last_result.y
+
+    def _get_paths_from_4state_vectors(self, ys0, taus, method="Radau", **options):
+        """
+        Integrates N geodesics as a single system of 8 * N equations.
+
+        Parameters
+        ----------
+        ys0 : array of shape (N, 8)
+            Initial conditions [x0, x1, x2, x3, u0, u1, u2, u3] of each particle.
+        taus : list
+            List of proper time values where the solutions are evaluated.
+        method : str
+            Integrator backend, see ``integrators.integrators``.
         """
-        t_span = (taus[0], taus[-1])
+        if options.get("events"):
+            raise ValueError(
+                "Events are not supported when N particles share one solve, "
+                "use get_paths_parallel or get_paths_lockstep instead."
+            )
+
+        N = len(ys0)
+
+        jac = None
+        if self.metric.has_christoffel_derivatives:
+            jac = self.jacobian_geodesic_batch
+        elif method in ("Radau", "BDF"):
+            # Particles are independent, so the Jacobian is block diagonal and
+            # it only takes 8 extra evaluations to estimate it, not 8 * N.
+            from scipy.sparse import identity, kron
+
+            options.setdefault("jac_sparsity", kron(identity(N, format="csr"), numpy.ones((8, 8)), format="csr"))
 
-        sol = solve_ivp(self.model_geodesic, t_span, ys0, t_eval=taus, method="Radau")
-        if sol.status == -1:
+        self.last_result = integrate(self.model_geodesic_batch, taus, ys0.ravel(), method=method, jac=jac, **options)
+        if self.last_result.status == -1:
             print("WARNING: Integration failed.")
 
-        return sol.y
+        return self.last_result.y.reshape(N, 8, -1)
@@ -0,0 +1,688 @@
+import numpy
+
+# SciPy methods that use the Jacobian of the right-hand side
+IMPLICIT_METHODS = ("Radau", "BDF", "LSODA")
+SCIPY_METHODS = ("RK23", "RK45", "DOP853") + IMPLICIT_METHODS
+
+
+class IntegrationResult:
+    """
+    Output of an integrator backend.
+
+    Attributes
+    ----------
+    t : numpy.ndarray of shape (T,)
+        Values of the independent variable where the solution was stored.
+    y : numpy.ndarray of shape (n, T)
+        Solution at ``t``.
+    nfev : int
+        Number of evaluations of the right-hand side.
+    njev : int
+        Number of evaluations of the Jacobian.
+    status : int
+        0 if the end of the interval was reached, 1 if a terminal event
+        stopped the integration, -1 if the integration failed.
+    message : str
+        Description of the termination reason.
+    t_events : list of numpy.ndarray
+        For every event, the values of the independent variable at its crossings.
+    y_events : list of numpy.ndarray
+        For every event, the states at its crossings.
+    """
+
+    def __init__(self, t, y, nfev, njev=0, status=0, message="", t_events=None, y_events=None):
+        self.t = t
+        self.y = y
+        self.nfev = nfev
+        self.njev = njev
+        self.status = status
+        self.message = message
+        self.t_events = t_events if t_events is not None else []
+        self.y_events = y_events if y_events is not None else []
+
+    def __repr__(self):
+        return f"IntegrationResult(status={self.status}, nfev={self.nfev}, njev={self.njev}, n_points={len(self.t)})"
+
+
+def integrate(fun, taus, ys0, method="Radau", jac=None, events=None, **options):
+    """
+    Integrates ys' = fun(tau, ys) and returns the solution at ``taus``.
+
+    Parameters
+    ----------
+    fun : callable
+        Right-hand side fun(tau, ys) -> array with the shape of ys.
+    taus : list
+        Values of the independent variable where the solution is evaluated.
+    ys0 : array of shape (n,)
+        Initial state.
+    method : str
+        One of ``integrators``: the SciPy methods "RK23", "RK45", "DOP853",
+        "Radau", "BDF", "LSODA", the fixed-step "RK4" or the symplectic
+        "implicit_midpoint".
+    jac : callable, optional
+        Jacobian jac(tau, ys), used by the implicit SciPy methods.
+    events : list of callable, optional
+        Events event(tau, ys) with the ``solve_ivp`` conventions (``terminal``
+        and ``direction`` attributes). Their crossings are located by root
+        refinement and reported in ``t_events`` and ``y_events``.
+    **options
+        Extra options of the backend (``rtol``, ``atol``, ``step``, ...).
+    """
+    if method not in integrators:
+        raise ValueError(f"Unsupported integrator: {method}. Supported integrators are: {list(integrators.keys())}")
+
+    return integrators[method](fun, taus, ys0, jac=jac, events=events, method=method, **options)
+
+
+def _integrate_scipy(fun, taus, ys0, jac=None, events=None, method="Radau", **options):
+    from scipy.integrate import solve_ivp
+
+    if method in IMPLICIT_METHODS and jac is not None:
+        options["jac"] = jac
+
+    sol = solve_ivp(fun, (taus[0], taus[-1]), ys0, t_eval=taus, method=method, events=events, **options)
+
+    t_events = sol.t_events if events else []
+    y_events = sol.y_events if events else []
+    return IntegrationResult(sol.t, sol.y, sol.nfev, sol.njev, sol.status, sol.message, t_events, y_events)
+
+
+def _hermite(s, h, y0, f0, y1, f1):
+    """
+    Cubic Hermite interpolation between (y0, f0) and (y1, f1) at s in [0, 1].
+    """
+    s2, s3 = s * s, s * s * s
+    return (2 * s3 - 3 * s2 + 1) * y0 + (s3 - 2 * s2 + s) * h * f0 + (3 * s2 - 2 * s3) * y1 + (s3 - s2) * h * f1
+
+
+class _EventTracker:
+    """
+    Detects the events crossed by a fixed-step integrator and locates them by
+    bisection on the cubic Hermite interpolant of the step.
+    """
+
+    def __init__(self, events, t, y):
+        self.events = events or []
+        self.values = [event(t, y) for event in self.events]
+        self.t_events = [[] for _ in self.events]
+        self.y_events = [[] for _ in self.events]
+        self.nfev = 0
+
+    def update(self, fun, t0, y0, f0, t1, y1):
+        """
+        Checks the step from (t0, y0) to (t1, y1).
+
+        Returns
+        -------
+        tuple or None
+            (t, y) of the first terminal event crossed in the step, else None.
+        """
+        values = [event(t1, y1) for event in self.events]
+
+        crossed = []
+        for i, event in enumerate(self.events):
+            upwards = self.values[i] < 0 <= values[i]
+            downwards = self.values[i] > 0 >= values[i]
+            if (upwards and event.direction >= 0) or (downwards and event.direction <= 0):
+                crossed.append(i)
+
+        self.values = values
+        if not crossed:
+            return None
+
+        h = t1 - t0
+        if f0 is None:
+            f0 = fun(t0, y0)
+            self.nfev += 1
+        f1 = fun(t1, y1)
+        self.nfev += 1
+
+        roots = []
+        for i in crossed:
+            event = self.events[i]
+            value_0 = event(t0, y0)
+            s_low, s_high = 0.0, 1.0
+            for _ in range(60):
+                s_mid = (s_low + s_high) / 2
+                value = event(t0 + s_mid * h, _hermite(s_mid, h, y0, f0, y1, f1))
+                if (value < 0) == (value_0 < 0) and value != 0:
+                    s_low = s_mid
+                else:
+                    s_high = s_mid
+            roots.append((s_high, i))
+
+        for s_root, i in sorted(roots):
+            t_root = t0 + s_root * h
+            y_root = _hermite(s_root, h, y0, f0, y1, f1)
+            self.t_events[i].append(t_root)
+            self.y_events[i].append(y_root)
+            if self.events[i].terminal:
+                return t_root, y_root
+
+        return None
+
+    def result_events(self):
+        t_events = [numpy.array(t) for t in self.t_events]
+        y_events = [numpy.array(y) for y in self.y_events]
+        return t_events, y_events
+
+
+def _substeps(taus, step):
+    """
+    Yields (tau, h, n) for every output interval, where the interval starting
+    at tau is split into n steps of size h no larger than ``step``.
+    """
+    for tau_0, tau_1 in zip(taus[:-1], taus[1:]):
+        delta = tau_1 - tau_0
+        n = 1 if step is None else max(1, int(numpy.ceil(abs(delta) / step - 1e-12)))
+        yield tau_0, delta / n, n
+
+
+# Times a fixed step may be halved when it fails or leaves the state non-finite
+_MAX_HALVINGS = 30
+
+
+def _advance(stepper, fun, t, y, h, tracker, depth=0):
+    """
+    Advances one fixed step and checks the events crossed on the way.
+
+    A step that fails, or that jumps over a singularity and returns a
+    non-finite state, is retried as two half steps, so events such as the
+    horizon crossing are still located before the singularity.
+
+    Returns
+    -------
+    tuple
+        (y_new, nfev, event) where y_new is None if the step failed even
+        after halving, and event is the (t, y) of a terminal event, else None.
+    """
+    y_new, f0, nfev = stepper(fun, t, y, h)
+    if y_new is not None and not numpy.all(numpy.isfinite(y_new)):
+        y_new = None
+
+    if y_new is None and depth < _MAX_HALVINGS:
+        y_half, nfev_half, event = _advance(stepper, fun, t, y, h / 2, tracker, depth + 1)
+        nfev += nfev_half
+        if y_half is None or event is not None:
+            return y_half, nfev, event
+
+        y_new, nfev_half, event = _advance(stepper, fun, t + h / 2, y_half, h / 2, tracker, depth + 1)
+        return y_new, nfev + nfev_half, event
+
+    if y_new is None or not tracker.events:
+        return y_new, nfev, None
+
+    return y_new, nfev, tracker.update(fun, t, y, f0, t + h, y_new)
+
+
+def _integrate_fixed_step(stepper, fun, taus, ys0, step=None, events=None):
+    """
+    Drives a fixed-step method over the output grid ``taus``.
+
+    Parameters
+    ----------
+    stepper : callable
+        stepper(fun, t, y, h) -> (y_new, f0, nfev) advances one step, y_new
+        is None if the step failed, f0 is fun(t, y) if it was computed, else None.
+    step : float, optional
+        Maximum step size. Defaults to the spacing of ``taus``.
+    """
+    taus = numpy.asarray(taus, dtype=float)
+    ys = numpy.empty((len(ys0), len(taus)))
+    ys[:, 0] = y = numpy.asarray(ys0, dtype=float)
+    nfev = 0
+
+    tracker = _EventTracker(events, taus[0], y)
+
+    for i, (tau, h, n) in enumerate(_substeps(taus, step)):
+        for j in range(n):
+            t = tau + j * h
+            y_new, step_nfev, event = _advance(stepper, fun, t, y, h, tracker)
+            nfev += step_nfev
+
+            if y_new is None or event is not None:
+                t_events, y_events = tracker.result_events()
+                status, message = (1, "A termination event occurred.") if event is not None else (-1, f"Step failed at tau={t}.")
+                return IntegrationResult(
+                    taus[: i + 1], ys[:, : i + 1], nfev + tracker.nfev, status=status,
+                    message=message, t_events=t_events, y_events=y_events,
+                )
+            y = y_new
+        ys[:, i + 1] = y
+
+    t_events, y_events = tracker.result_events()
+    return IntegrationResult(
+        taus, ys, nfev + tracker.nfev,
+        message="The solver successfully reached the end of the integration interval.",
+        t_events=t_events if events else [], y_events=y_events if events else [],
+    )
+
+
+def _rk4_step(fun, t, y, h):
+    k1 = fun(t, y)
+    k2 = fun(t + h / 2, y + h / 2 * k1)
+    k3 = fun(t + h / 2, y + h / 2 * k2)
+    k4 = fun(t + h, y + h * k3)
+    return y + h / 6 * (k1 + 2 * k2 + 2 * k3 + k4), k1, 4
+
+
+def _reject_options(method, options):
+    # The fixed-step backends would silently ignore e.g. rtol and atol
+    if options:
+        raise TypeError(f"Unsupported options for the {method} integrator: {sorted(options)}")
+
+
+def _integrate_rk4(fun, taus, ys0, step=None, events=None, jac=None, method="RK4", **options):
+    """
+    Classic fixed-step fourth order Runge-Kutta.
+
+    Parameters
+    ----------
+    step : float, optional
+        Maximum step size. Defaults to the spacing of ``taus``.
+    """
+    _reject_options(method, options)
+    return _integrate_fixed_step(_rk4_step, fun, taus, ys0, step, events)
+
+
+def _integrate_implicit_midpoint(
+    fun, taus, ys0, step=None, events=None, tol=1e-12, max_iter=50, jac=None, method="implicit_midpoint", **options
+):
+    """
+    Implicit midpoint rule y_{n+1} = y_n + h f((y_n + y_{n+1}) / 2).
+
+    It is symplectic and time-symmetric, so the conserved quantities of the
+    geodesic (energy, angular momentum, normalization) do not drift on long
+    runs. The implicit equation is solved by fixed-point iteration.
+
+    Parameters
+    ----------
+    step : float, optional
+        Maximum step size. Defaults to the spacing of ``taus``.
+    tol : float
+        Relative tolerance of the fixed-point iteration.
+    max_iter : int
+        Maximum number of fixed-point iterations per step.
+    """
+    _reject_options(method, options)
+
+    def midpoint_step(fun, t, y, h):
+        t_mid = t + h / 2
+        k = fun(t_mid, y)
+        for iteration in range(max_iter):
+            k_new = fun(t_mid, y + h / 2 * k)
+            converged = numpy.all(numpy.abs(k_new - k) * abs(h) <= tol * (1 + numpy.abs(y)))
+            k = k_new
+            if converged:
+                return y + h * k, None, iteration + 2
+        return None, None, max_iter + 1
+
+    return _integrate_fixed_step(midpoint_step, fun, taus, ys0, step, events)
+
+
+class BundleResult:
+    """
+    Output of ``integrate_bundle`` for N independent systems.
+
+    Attributes
+    ----------
+    t : numpy.ndarray of shape (T,)
+        Values of the independent variable where the solutions were stored.
+    y : numpy.ndarray of shape (N, n, T)
+        Solutions at ``t``, NaN after the point where each system stopped.
+    nfev : int
+        Number of evaluations of the right-hand side, counting one per system.
+    status : numpy.ndarray of shape (N,)
+        0 if the end of the interval was reached, 1 if a terminal event
+        stopped the system, -1 if its integration failed.
+    event : numpy.ndarray of shape (N,)
+        Index in ``events`` of the event that stopped each system, -1 if none.
+    t_stop : numpy.ndarray of shape (N,)
+        Value of the independent variable where each system stopped.
+    y_stop : numpy.ndarray of shape (N, n)
+        State where each system stopped: the located event crossing, the last
+        finite state before a failure or the final state.
+    events : list of callable
+        Terminal events of the integration.
+    """
+
+    def __init__(self, t, y, nfev, status, event, t_stop, y_stop, events):
+        self.t = t
+        self.y = y
+        self.nfev = nfev
+        self.status = status
+        self.event = event
+        self.t_stop = t_stop
+        self.y_stop = y_stop
+        self.events = events
+
+    def __repr__(self):
+        counts = {status: int(numpy.sum(self.status == status)) for status in (0, 1, -1)}
+        return f"BundleResult(n_systems={len(self.status)}, finished={counts[0]}, events={counts[1]}, failed={counts[-1]})"
+
+
+class _Bundle:
+    """
+    Bookkeeping of a lock-step integration of N systems where each one
+    retires on its own when it crosses a terminal event or its step fails.
+    ``step`` advances the systems with the classic RK4.
+    """
+
+    def __init__(self, fun, events, t0, ys0):
+        self.fun = fun
+        self.events = events
+        N = len(ys0)
+        self.nfev = 0
+        self.status = numpy.zeros(N, dtype=int)
+        self.event = numpy.full(N, -1)
+        self.t_stop = numpy.full(N, t0)
+        self.y_stop = numpy.array(ys0, dtype=float)
+
+    def retire(self, ids, status, t, y, event=-1):
+        self.status[ids] = status
+        self.event[ids] = event
+        self.t_stop[ids] = t
+        self.y_stop[ids] = y
+
+    def step(self, ids, t, y, h, depth=0):
+        """
+        Advances the systems ``ids`` from t to t + h.
+
+        Systems whose step is not finite are retried as two half steps, as in
+        ``_advance``. Retired systems get a row of NaN in the returned states.
+        """
+        fun = self.fun
+        k1 = fun(t, y)
+        k2 = fun(t + h / 2, y + h / 2 * k1)
+        k3 = fun(t + h / 2, y + h / 2 * k2)
+        k4 = fun(t + h, y + h * k3)
+        self.nfev += 4 * len(y)
+        y_new = y + h / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+
+        bad = ~numpy.all(numpy.isfinite(y_new), axis=1)
+        good = ~bad
+        if bad.any():
+            if depth < _MAX_HALVINGS:
+                y_half = self.step(ids[bad], t, y[bad], h / 2, depth + 1)
+                alive = ~numpy.isnan(y_half[:, 0])
+                y_half[alive] = self.step(ids[bad][alive], t + h / 2, y_half[alive], h / 2, depth + 1)
+                y_new[bad] = y_half
+            else:
+                self.retire(ids[bad], -1, t, y[bad])
+                y_new[bad] = numpy.nan
+
+        if self.events and good.any():
+            y_new[good] = self._check_events(ids[good], t, y[good], k1[good], h, y_new[good])
+
+        return y_new
+
+    def _check_events(self, ids, t0, y0, f0, h, y1, f1=None):
+        """
+        Retires the systems that cross a terminal event in the step, at the
+        earliest crossing located by bisection on the cubic Hermite interpolant.
+
+        ``t0`` and ``h`` are floats or arrays of shape (M,) when every system
+        has its own step.
+        """
+        t0 = numpy.broadcast_to(t0, (len(ids),))
+        h = numpy.broadcast_to(h, (len(ids),))
+        s_roots = numpy.full(len(ids), numpy.inf)
+        first = numpy.full(len(ids), -1)
+
+        for i, event in enumerate(self.events):
+            value_0 = numpy.asarray(event(t0, y0))
+            value_1 = numpy.asarray(event(t0 + h, y1))
+            upwards = (value_0 < 0) & (value_1 >= 0) & (event.direction >= 0)
+            downwards = (value_0 > 0) & (value_1 <= 0) & (event.direction <= 0)
+            crossed = numpy.flatnonzero(upwards | downwards)
+            if not crossed.size:
+                continue
+
+            if f1 is None:
+                f1 = self.fun(t0 + h, y1)
+                self.nfev += len(y1)
+
+            h_crossed = h[crossed, None]
+            s_low = numpy.zeros(len(crossed))
+            s_high = numpy.ones(len(crossed))
+            sign_0 = value_0[crossed] < 0
+            for _ in range(60):
+                s_mid = (s_low + s_high) / 2
+                y_mid = _hermite(s_mid[:, None], h_crossed, y0[crossed], f0[crossed], y1[crossed], f1[crossed])
+                value = event(t0[crossed] + s_mid * h[crossed], y_mid)
+                same = ((value < 0) == sign_0) & (value != 0)
+                s_low = numpy.where(same, s_mid, s_low)
+                s_high = numpy.where(same, s_high, s_mid)
+
+            # Crossings rejected by the event (e.g. outside a disk) are ignored
+            t_roots = t0[crossed] + s_high * h[crossed]
+            y_roots = _hermite(s_high[:, None], h_crossed, y0[crossed], f0[crossed], y1[crossed], f1[crossed])
+            earlier = s_high < s_roots[crossed]
+            if hasattr(event, "accept"):
+                earlier &= event.accept(t_roots, y_roots)
+            s_roots[crossed[earlier]] = s_high[earlier]
+            first[crossed[earlier]] = i
+
+        stopped = numpy.flatnonzero(first >= 0)
+        if stopped.size:
+            s = s_roots[stopped]
+            y_roots = _hermite(s[:, None], h[stopped, None], y0[stopped], f0[stopped], y1[stopped], f1[stopped])
+            self.retire(ids[stopped], 1, t0[stopped] + s * h[stopped], y_roots, first[stopped])
+            y1 = y1.copy()
+            y1[stopped] = numpy.nan
+
+        return y1
+
+
+def integrate_bundle(fun, taus, ys0, events=None, method="RK4", **options):
+    """
+    Integrates N independent systems ys' = fun(tau, ys) in lock step.
+
+    Every step evaluates ``fun`` once per stage on the states of all the
+    systems still running, and each system retires on its own when it
+    finishes, crosses a terminal event or fails, so a bundle of rays costs one
+    vectorized call per stage instead of one integration per ray.
+
+    Parameters
+    ----------
+    fun : callable
+        Right-hand side fun(tau, ys) with ys of shape (M, n) -> (M, n). With
+        adaptive methods tau is an array of shape (M,), one value per system.
+    taus : list
+        Increasing values of the independent variable where the solutions are
+        evaluated.
+    ys0 : array of shape (N, n)
+        Initial states.
+    events : list of GeodesicEvent, optional
+        Terminal events event(tau, ys) -> (M,) with the ``solve_ivp``
+        ``direction`` attribute. Crossings rejected by ``event.accept`` are
+        ignored.
+    method : str
+        One of ``bundle_integrators``: the fixed-step "RK4" (option ``step``,
+        the maximum step size, by default the spacing of ``taus``) or the
+        adaptive Dormand-Prince "DOPRI5", where every system controls its own
+        step (options ``rtol``, ``atol``, ``first_step``, ``max_step`` and
+        ``max_steps``).
+
+    Returns
+    -------
+    BundleResult
+    """
+    if method not in bundle_integrators:
+        raise ValueError(
+            f"Unsupported bundle integrator: {method}. Supported integrators are: {list(bundle_integrators.keys())}"
+        )
+
+    events = list(events or [])
+    if not all(event.terminal for event in events):
+        raise ValueError("Bundles of systems only support terminal events.")
+
+    taus = numpy.asarray(taus, dtype=float)
+    ys0 = numpy.asarray(ys0, dtype=float)
+    ys = numpy.full(ys0.shape + (len(taus),), numpy.nan)
+    ys[:, :, 0] = ys0
+
+    bundle = _Bundle(fun, events, taus[0], ys0)
+
+    # Steps that overflow near a singularity are expected, they are halved or retired
+    with numpy.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        bundle_integrators[method](bundle, taus, ys, **options)
+
+    return BundleResult(taus, ys, bundle.nfev, bundle.status, bundle.event, bundle.t_stop, bundle.y_stop, events)
+
+
+def _integrate_bundle_rk4(bundle, taus, ys, step=None):
+    """
+    Fixed-step RK4 driver of ``integrate_bundle``, it fills ``ys`` in place.
+    """
+    ids = numpy.arange(len(ys))
+    y = ys[:, :, 0]
+
+    for i, (tau, h, n) in enumerate(_substeps(taus, step)):
+        for j in range(n):
+            if not ids.size:
+                break
+            y = bundle.step(ids, tau + j * h, y, h)
+            alive = ~numpy.isnan(y[:, 0])
+            ids, y = ids[alive], y[alive]
+        ys[ids, :, i + 1] = y
+
+    bundle.retire(ids, 0, taus[-1], y)
+
+
+# Dormand-Prince 5(4) tableau, the same pair as SciPy's RK45
+_DOPRI_C = (1 / 5, 3 / 10, 4 / 5, 8 / 9, 1)
+_DOPRI_A = (
+    (1 / 5,),
+    (3 / 40, 9 / 40),
+    (44 / 45, -56 / 15, 32 / 9),
+    (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+    (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+)
+_DOPRI_B = (35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84)
+_DOPRI_E = (-71 / 57600, 0, 71 / 16695, -71 / 1920, 17253 / 339200, -22 / 525, 1 / 40)
+
+
+def _combine(coefficients, ks):
+    return sum(c * k for c, k in zip(coefficients, ks) if c != 0)
+
+
+def _integrate_bundle_dopri5(
+    bundle, taus, ys, rtol=1e-6, atol=1e-9, first_step=None, max_step=numpy.inf, max_steps=100000
+):
+    """
+    Adaptive Dormand-Prince 5(4) driver of ``integrate_bundle``, it fills
+    ``ys`` in place.
+
+    Every system keeps its own tau, step and next output point. Rejected
+    steps are retried with a smaller step on the next pass while the accepted
+    ones move on, and the outputs are interpolated with the cubic Hermite
+    polynomial of the step (the last stage is the derivative at the new
+    point, so it costs no extra evaluation).
+    """
+    fun = bundle.fun
+    t_end = taus[-1]
+    N = len(ys)
+
+    ids = numpy.arange(N)
+    t = numpy.full(N, taus[0])
+    y = ys[:, :, 0].copy()
+    f = fun(t, y)
+    bundle.nfev += N
+    next_output = numpy.ones(N, dtype=int)
+
+    if first_step is None:
+        scale = atol + rtol * numpy.abs(y)
+        d0 = numpy.sqrt(numpy.mean((y / scale) ** 2, axis=1))
+        d1 = numpy.sqrt(numpy.mean((f / scale) ** 2, axis=1))
+        h = numpy.where((d0 < 1e-5) | (d1 < 1e-5), 1e-6, 0.01 * d0 / d1)
+    else:
+        h = numpy.full(N, float(first_step))
+    h = numpy.minimum(h, max_step)
+
+    for _ in range(max_steps):
+        if not ids.size:
+            break
+
+        last = h >= t_end - t
+        h = numpy.where(last, t_end - t, h)
+        h_column = h[:, None]
+
+        ks = [f]
+        for c, a in zip(_DOPRI_C, _DOPRI_A):
+            ks.append(fun(t + c * h, y + h_column * _combine(a, ks)))
+        y_new = y + h_column * _combine(_DOPRI_B, ks)
+        f_new = fun(t + h, y_new)
+        ks.append(f_new)
+        bundle.nfev += 6 * len(ids)
+
+        scale = atol + rtol * numpy.maximum(numpy.abs(y), numpy.abs(y_new))
+        error = numpy.sqrt(numpy.mean((h_column * _combine(_DOPRI_E, ks) / scale) ** 2, axis=1))
+        finite = numpy.all(numpy.isfinite(y_new), axis=1) & numpy.all(numpy.isfinite(f_new), axis=1)
+        error = numpy.where(finite & numpy.isfinite(error), error, numpy.inf)
+
+        accepted = error <= 1
+        factor = numpy.clip(0.9 * error ** -0.2, 0.2, 10)
+        h_next = numpy.minimum(h * factor, max_step)
+
+        # A step that cannot be reduced any further means a singularity
+        failed = ~accepted & (h <= 10 * numpy.spacing(numpy.abs(t)) + 1e-300)
+        bundle.retire(ids[failed], -1, t[failed], y[failed])
+
+        stopped = numpy.zeros(len(ids), dtype=bool)
+        acc = numpy.flatnonzero(accepted)
+        if acc.size:
+            t_new = numpy.where(last[acc], t_end, t[acc] + h[acc])
+            t_limit = t_new.copy()
+            if bundle.events:
+                y_checked = bundle._check_events(ids[acc], t[acc], y[acc], f[acc], h[acc], y_new[acc], f_new[acc])
+                stopped[acc] = numpy.isnan(y_checked[:, 0])
+                t_limit[stopped[acc]] = bundle.t_stop[ids[acc][stopped[acc]]]
+
+            _write_dense_outputs(ys, taus, next_output, ids, acc, t, h, y, f, y_new, f_new, t_limit)
+
+            t[acc] = t_new
+            y[acc] = y_new[acc]
+            f[acc] = f_new[acc]
+
+        finished = accepted & last & ~stopped
+        bundle.retire(ids[finished], 0, t_end, y[finished])
+
+        keep = ~(failed | stopped | finished)
+        ids, t, y, f, next_output = ids[keep], t[keep], y[keep], f[keep], next_output[keep]
+        h = h_next[keep]
+
+    bundle.retire(ids, -1, t, y)
+
+
+def _write_dense_outputs(ys, taus, next_output, ids, acc, t, h, y, f, y_new, f_new, t_limit):
+    """
+    Writes the output points taus[k] <= t_limit of the accepted steps ``acc``
+    and advances their ``next_output`` index.
+    """
+    while True:
+        k = next_output[acc]
+        pending = k < len(taus)
+        pending[pending] &= taus[k[pending]] <= t_limit[pending]
+        if not pending.any():
+            return
+
+        p, k = acc[pending], k[pending]
+        s = (taus[k] - t[p]) / h[p]
+        ys[ids[p], :, k] = _hermite(s[:, None], h[p, None], y[p], f[p], y_new[p], f_new[p])
+        next_output[p] += 1
+
+
+# Dictionary mapping integrator names to their backends
+integrators = {
+    **{method: _integrate_scipy for method in SCIPY_METHODS},
+    "RK4": _integrate_rk4,
+    "implicit_midpoint": _integrate_implicit_midpoint,
+}
+
+# Dictionary mapping bundle integrator names to their drivers
+bundle_integrators = {
+    "RK4": _integrate_bundle_rk4,
+    "DOPRI5": _integrate_bundle_dopri5,
+}
@@ -0,0 +1,95 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy
+
+
+def get_paths_parallel(
+    metric, ys0, taus, method="Radau", events=None, max_workers=None, chunksize=None, mp_context=None, **options
+):
+    """
+    Integrates the geodesics of N independent particles on a process pool.
+
+    The initial conditions are split in chunks of consecutive particles and
+    every chunk is integrated particle by particle in a worker. Workers only
+    receive the constructor parameters of the metric (see
+    ``BaseMetric.__reduce__``) and write their paths straight into a shared
+    memory block, so no trajectory is pickled on the way back.
+
+    Parameters
+    ----------
+    metric : BaseMetric
+        Metric of the geodesics.
+    ys0 : array of shape (N, 8)
+        Initial conditions [x0, x1, x2, x3, u0, u1, u2, u3] of each particle
+        in the coordinates of the metric.
+    taus : list
+        List of proper time values where the solutions are evaluated.
+    method : str
+        Integrator backend, see ``integrators.integrators``.
+    events : list of GeodesicEvent, optional
+        Events located during the integration of every particle.
+    max_workers : int, optional
+        Number of worker processes, ``os.cpu_count()`` by default.
+    chunksize : int, optional
+        Number of particles per task, by default about four tasks per worker.
+    mp_context : multiprocessing context, optional
+        Start method of the workers, passed to ``ProcessPoolExecutor``.
+    **options
+        Options of the integrator backend.
+
+    Returns
+    -------
+    numpy.ndarray of shape (N, 8, len(taus))
+        4-state vectors of every particle in the order of ``ys0``. Paths
+        stopped by a terminal event or a failed integration are padded with
+        NaN.
+    """
+    ys0 = numpy.asarray(ys0, dtype=float)
+    taus = numpy.asarray(taus, dtype=float)
+    shape = (len(ys0), 8, len(taus))
+
+    if len(ys0) == 0:
+        return numpy.empty(shape)
+
+    max_workers = max_workers or os.cpu_count() or 1
+    chunksize = chunksize or math.ceil(len(ys0) / (4 * max_workers))
+
+    shm = shared_memory.SharedMemory(create=True, size=math.prod(shape) * numpy.dtype(float).itemsize)
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as executor:
+            futures = [
+                executor.submit(
+                    _integrate_chunk, metric, shm.name, shape, start, ys0[start : start + chunksize],
+                    taus, method, events, options,
+                )
+                for start in range(0, len(ys0), chunksize)
+            ]
+            for future in futures:
+                future.result()
+
+        paths = numpy.ndarray(shape, dtype=float, buffer=shm.buf).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return paths
+
+
+def _integrate_chunk(metric, shm_name, shape, start, ys0, taus, method, events, options):
+    """
+    Integrates the particles ``start, start + 1, ...`` of a parallel run and
+    writes their paths into the shared memory block ``shm_name``.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        paths = numpy.ndarray(shape, dtype=float, buffer=shm.buf)
+        for i, y0 in enumerate(ys0, start=start):
+            ys = metric.geodesic._get_path_from_4state_vector(y0, taus, method, events, **options)
+            paths[i, :, : ys.shape[1]] = ys
+            paths[i, :, ys.shape[1] :] = numpy.nan
+        del paths  # the buffer cannot be released while a view is alive
+    finally:
+        shm.close()
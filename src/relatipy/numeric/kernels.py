@@ -0,0 +1,22 @@
+"""
+User cache of the NumPy kernel modules generated by ``relatipy.symbolic.codegen``.
+
+Every module is stored as ``<key>.py`` in ``kernels/<relatipy version>`` under
+the cache directory, where the key hashes the metric, its coordinates and the
+sympy version. Kernels generated by another version of relatipy are never
+picked up, and ``clear_kernels`` removes them.
+
+Loading a module only needs NumPy: worker processes that get the key of some
+kernels import them with ``load_kernels`` without running sympy. The functions
+are defined in ``relatipy._cache``, which ``relatipy.symbolic`` also uses.
+"""
+
+from .._cache import clear_kernels, get_cache_dir, get_kernel_dir, load_kernels, store_kernels
+
+__all__ = [
+    "clear_kernels",
+    "get_cache_dir",
+    "get_kernel_dir",
+    "load_kernels",
+    "store_kernels",
+]
@@ -7,9 +7,14 @@ from ..geodesic.geodesic import Geodesic
 from ..utils.dimensions import validator
 
 class Minkowski(BaseMetric):
+    christoffel_nonzero = ()
+
     def __init__(self):
         pass
 
+    def __reduce__(self):
+        return (type(self), ())
+
     def _metric_dimensionless(self, xs):
         """
         Returns the Minkowski metric tensor.
@@ -49,3 +54,16 @@ class Minkowski(BaseMetric):
             N = len(xs)
             return numpy.zeros((N, 4, 4, 4))
         return numpy.zeros((4, 4, 4))
+
+    def _get_christoffel_derivatives(self, xs):
+        """
+        Returns the derivatives of the Christoffel symbols of the Minkowski
+        metric (there are no non-zero components).
+
+        Parameters
+        ----------
+        xs : array of shape (4,) or (N, 4)
+            Coordinates [x0, x1, x2, x3].
+        """
+        xs = numpy.asarray(xs, dtype=float)
+        return numpy.zeros(xs.shape[:-1] + (4, 0))
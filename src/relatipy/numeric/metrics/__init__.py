@@ -1,9 +1,12 @@
 from .base import BaseMetric
 from .schwarzschild_metric import Schwarzschild
 from .kerr_metric import Kerr
+from .generated_metric import GeneratedMetric, make_metric
 
 __all__ = [
     "BaseMetric",
     "Schwarzschild",
     "Kerr",
+    "GeneratedMetric",
+    "make_metric",
 ]
\ No newline at end of file
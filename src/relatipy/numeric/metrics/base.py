@@ -1,11 +1,25 @@
 import numpy
+from functools import cached_property, partial
 from itertools import product
 
 from ..constants import _c, _c_SI, _G
-from ..utils.dimensions import validator
+from ..utils.dimensions import _is_quantity, validator
 from ..geodesic.geodesic import Geodesic
 
+# Factors c^n that take tensor components from x0 = ct to x0 = t, n being the
+# number of lower minus upper time indices. They broadcast over leading axes.
+_is_time = (numpy.arange(4) == 0).astype(float)
+_METRIC_SI_SCALE = _c_SI ** (_is_time[:, None] + _is_time[None, :])
+_CHRISTOFFEL_SI_SCALE = _c_SI ** (_is_time[None, :, None] + _is_time[None, None, :] - _is_time[:, None, None])
+
 class BaseMetric:
+    # Independent non-zero Christoffel components (sigma, mu, nu) with mu <= nu.
+    # None means that every symmetric component may be non-zero.
+    christoffel_nonzero = None
+
+    # Radius of the outer event horizon in dimensionless units, None if there is none.
+    horizon_radius = None
+
     def __init__(self, mass, valid_coordinate="Cartesian", kwargs={}):
         self.mass = validator.validate_scalar(mass)
         self.valid_coordinate = valid_coordinate
@@ -13,6 +27,43 @@ class BaseMetric:
         self.kwargs = kwargs
         self.geodesic = Geodesic(self)
 
+    def __reduce__(self):
+        """
+        Pickle the metric as its constructor parameters (mass and the metric
+        kwargs, e.g. the spin), so that process pools do not ship the Geodesic,
+        the last integration result or the cached index tables. The kwargs
+        are passed by name, so subclasses must accept them as keyword
+        arguments of their constructor.
+        """
+        return (partial(type(self), **self.kwargs), (self.mass,))
+
+    @staticmethod
+    def _as_dimensionless(xs):
+        """
+        Returns the coordinates xs as a float array in dimensionless units.
+
+        Plain float ndarrays are taken as already validated and returned
+        untouched, so the integrators, which evaluate the metric on every
+        step, skip the unit checks. Any other input (lists, astropy
+        Quantities, ...) goes through the validator once; a Quantity array is
+        converted as a whole with its single unit.
+
+        Parameters
+        ----------
+        xs : list or array
+            Coordinates of one or several points.
+        """
+        if type(xs) is numpy.ndarray and xs.dtype.kind == "f":
+            return xs
+
+        if _is_quantity(xs):
+            return numpy.asarray(validator.validate_vector(xs), dtype=float)
+
+        xs = numpy.asarray(xs, dtype=object)
+        if xs.ndim == 1:
+            xs = validator.validate_vector(xs)
+        return numpy.asarray(xs, dtype=float)
+
     def metric(self, xs, dimensionless=True):
         """
         Returns the metric tensor components g_{mu nu} as a 2D array.
@@ -22,17 +73,16 @@ class BaseMetric:
         xs : list
             List of coordinates [t, x, y, z] or array of shape (4,) or (4, N).
         """
-        xs = numpy.asarray(xs, dtype=object)
+        xs = self._as_dimensionless(xs)
 
         if xs.ndim == 1:
-            xs = validator.validate_vector(xs)
             metric = self._metric_dimensionless(xs)
             return metric if dimensionless else self._metric_geom_to_si(metric)
 
         if xs.ndim == 2:
             xs = xs.T  # (4, N) -> (N, 4)
             metrics = self._metric_dimensionless(xs)
-            metrics = metrics if dimensionless else numpy.array([self._metric_geom_to_si(g) for g in metrics])
+            metrics = metrics if dimensionless else self._metric_geom_to_si(metrics)
             return metrics.T  # (N, 4, 4) -> (4, 4, N)
 
         raise ValueError(f"xs must be 1D (single point) or 2D (N points), got shape {xs.shape}")
@@ -56,7 +106,7 @@ class BaseMetric:
 
         Parameters
         ----------
-        g_geom : array-like (4x4)
+        g_geom : array-like of shape (4, 4) or (N, 4, 4)
             Metric tensor in geometric units.
 
         Returns
@@ -64,43 +114,106 @@ class BaseMetric:
         numpy.ndarray
             Metric tensor in SI convention.
         """
-        g_geom = numpy.asarray(g_geom, dtype=float)
-        g_si = numpy.zeros_like(g_geom)
-
-        for mu, nu in product(range(4), repeat=2):
-            n_zero = (mu == 0) + (nu == 0)
-            g_si[mu, nu] = (_c_SI ** n_zero) * g_geom[mu, nu]
-
-        return g_si
+        return numpy.asarray(g_geom, dtype=float) * _METRIC_SI_SCALE
 
     def get_4velocity(self, coordinate):
         """
         Returns the four-velocity of a test particle in the given metric.
 
         """
-        us = numpy.zeros(4)
-        g = self.metric(coordinate.xs)
+        return self.get_4velocities(coordinate.xs[None], coordinate.dxs_dt[None])[0]
+
+    def get_4velocities(self, xs, dxs_dt):
+        """
+        Returns the four-velocities of N test particles.
+
+        u^0 follows from the normalization g_{mu nu} u^mu u^nu = c^2, evaluated
+        for the whole batch with one contraction over the (N, 4, 4) metric.
+
+        Parameters
+        ----------
+        xs : array of shape (N, 4)
+            Dimensionless coordinates [x0, x1, x2, x3] of the particles.
+        dxs_dt : array of shape (N, 3)
+            Coordinate velocities dx^i/dt of the particles.
+
+        Returns
+        -------
+        numpy.ndarray of shape (N, 4)
+        """
+        xs = numpy.asarray(xs, dtype=float)
+        dxs_dt = numpy.asarray(dxs_dt, dtype=float)
+        if xs.ndim != 2 or xs.shape[1] != 4 or dxs_dt.shape != (len(xs), 3):
+            raise ValueError(f"xs and dxs_dt must have shapes (N, 4) and (N, 3), got {xs.shape} and {dxs_dt.shape}")
 
-        u_t2 = g[0, 0]
-        for i in range(1, 4):
-            u_t2 += 2 / _c * g[0, i] * coordinate.dxs_dt[i - 1] 
-            for j in range(1, 4):
-                u_t2 += 1 / _c**2 * g[i, j] * coordinate.dxs_dt[i - 1] * coordinate.dxs_dt[j - 1]
+        g = self._metric_dimensionless(xs)  # (N, 4, 4)
+        vs = numpy.concatenate([numpy.ones((len(xs), 1)), dxs_dt / _c], axis=1)  # dx^mu / (c dt)
 
-        # u_t2 = 1/(1-(vs[1]*vs[1] + vs[2]*vs[2] + vs[3]*vs[3])/_c**2)
-        us[0] = _c * numpy.sqrt(1/u_t2)
-        
-        for i in range(1, 4):
-            us[i] = coordinate.dxs_dt[i - 1] * us[0] / _c
-        return us
+        u_t2 = numpy.einsum("nij,ni,nj->n", g, vs, vs)
+        return _c * vs / numpy.sqrt(u_t2)[:, None]
 
     def get_4state_vector(self, coordinate):
         return numpy.concatenate((coordinate.xs, self.get_4velocity(coordinate)))
-    
+
+    def get_4state_vectors(self, xs, dxs_dt):
+        """
+        Returns the 4-state vectors of N test particles, ready for the batched
+        integrators.
+
+        Parameters
+        ----------
+        xs : array of shape (N, 4)
+            Dimensionless coordinates [x0, x1, x2, x3] of the particles.
+        dxs_dt : array of shape (N, 3)
+            Coordinate velocities dx^i/dt of the particles.
+
+        Returns
+        -------
+        numpy.ndarray of shape (N, 8)
+            States [x0, x1, x2, x3, u0, u1, u2, u3].
+        """
+        xs = numpy.asarray(xs, dtype=float)
+        return numpy.concatenate([xs, self.get_4velocities(xs, dxs_dt)], axis=1)
+
+    def get_null_4momentum(self, xs, directions, energy=1.0):
+        """
+        Returns the 4-momenta k^mu of photons at xs moving along the given
+        spatial directions.
+
+        The spatial components are proportional to ``directions`` and k^0 is
+        the future directed root of the null condition g_{mu nu} k^mu k^nu = 0.
+        The momenta are scaled so that the conserved energy
+        p_0 = g_{0 nu} k^nu equals ``energy``.
+
+        Parameters
+        ----------
+        xs : array of shape (4,) or (N, 4)
+            Dimensionless coordinates of the photons.
+        directions : array of shape (3,) or (N, 3)
+            Spatial directions (dx^1, dx^2, dx^3), up to a positive factor.
+        energy : float or array of shape (N,)
+            Energy of the photons in dimensionless units.
+
+        Returns
+        -------
+        numpy.ndarray of shape (4,) or (N, 4)
+        """
+        xs = numpy.asarray(xs, dtype=float)
+        directions = numpy.asarray(directions, dtype=float)
+        g = self.metric(xs) if xs.ndim == 1 else numpy.moveaxis(self.metric(xs.T), -1, 0)
+        g = numpy.asarray(g, dtype=float)
+
+        B = numpy.einsum("...i,...i->...", g[..., 0, 1:], directions)
+        C = numpy.einsum("...ij,...i,...j->...", g[..., 1:, 1:], directions, directions)
+        p_0 = numpy.sqrt(B * B - g[..., 0, 0] * C)
+
+        ks = numpy.concatenate([((p_0 - B) / g[..., 0, 0])[..., None], directions], axis=-1)
+        return ks * (energy / p_0)[..., None]
+
     def get_dxs_dt_from_4velocity(self, us):
         return _c * us/us[0]
 
-    def get_christoffel_symbols(self, xs, dimensionless=True):
+    def get_christoffel_symbols(self, xs, dimensionless=True, compact=False):
         """
         Returns the Christoffel symbols of the metric.
 
@@ -108,28 +221,156 @@ class BaseMetric:
         ----------
         xs : list or array of shape (4,) or (N, 4)
             List of coordinates [x0, x1, x2, x3].
+        compact : bool
+            If True, returns only the K independent non-zero components as an
+            array of shape (K,) or (N, K), together with the index table of
+            shape (K, 3) holding their (sigma, mu, nu) indices, mu <= nu.
         """
-        xs = numpy.asarray(xs, dtype=object)
+        xs = self._as_dimensionless(xs)
+        ndim = xs.ndim
 
-        if xs.ndim == 1:
-            xs = validator.validate_vector(xs)
-            christoffel = self._get_christoffel_symbols(xs)
-            return christoffel if dimensionless else self._christoffel_dimensionless_to_si(christoffel)
+        if ndim not in (1, 2):
+            raise ValueError(f"xs must be 1D (single point) or 2D (N points), got shape {xs.shape}")
 
-        if xs.ndim == 2:
-            christoffels = self._get_christoffel_symbols(xs)
-            return christoffels if dimensionless else numpy.array([self._christoffel_dimensionless_to_si(G) for G in christoffels])
+        if compact:
+            components = self._get_christoffel_components(xs)
+            if not dimensionless:
+                components = components * self._christoffel_components_si_scale
+            return components, self.christoffel_indices
+
+        christoffels = self._get_christoffel_symbols(xs)
+        return christoffels if dimensionless else self._christoffel_dimensionless_to_si(christoffels)
+
+    def _get_christoffel_components(self, xs):
+        """
+        Returns the independent non-zero Christoffel components.
+
+        Subclasses with a compact implementation override this method to avoid
+        building the full tensor.
+
+        Parameters
+        ----------
+        xs : array of shape (4,) or (N, 4)
+            Coordinates [x0, x1, x2, x3].
+
+        Returns
+        -------
+        numpy.ndarray of shape (K,) or (N, K)
+            Components ordered as ``christoffel_indices``.
+        """
+        flat, _, _, _ = self.christoffel_contraction
+        Gamma = self._get_christoffel_symbols(xs)
+        return numpy.take(Gamma.reshape(Gamma.shape[:-3] + (64,)), flat, axis=-1)
+
+    def get_christoffel_derivatives(self, xs):
+        """
+        Returns the derivatives of the independent non-zero Christoffel symbols
+        in dimensionless units.
+
+        Parameters
+        ----------
+        xs : list or array of shape (4,) or (N, 4)
+            List of coordinates [x0, x1, x2, x3].
+
+        Returns
+        -------
+        numpy.ndarray of shape (4, K) or (N, 4, K)
+            Element [..., lambda, k] is the derivative with respect to x^lambda
+            of the k-th component of ``christoffel_indices``.
+        """
+        xs = self._as_dimensionless(xs)
+
+        if xs.ndim in (1, 2):
+            return self._get_christoffel_derivatives(xs)
 
         raise ValueError(f"xs must be 1D (single point) or 2D (N points), got shape {xs.shape}")
 
+    def _get_christoffel_derivatives(self, xs):
+        """
+        Returns the derivatives of the independent non-zero Christoffel symbols.
+
+        Parameters
+        ----------
+        xs : array of shape (4,) or (N, 4)
+            Coordinates [x0, x1, x2, x3].
+        """
+        raise NotImplementedError("This method should be implemented by subclasses.")
+
+    @property
+    def has_christoffel_derivatives(self):
+        return type(self)._get_christoffel_derivatives is not BaseMetric._get_christoffel_derivatives
+
+    def _christoffel_from_components(self, components):
+        """
+        Builds the full Christoffel tensor from its independent components.
+
+        Parameters
+        ----------
+        components : array of shape (K,) or (N, K)
+            Components ordered as ``christoffel_indices``.
+
+        Returns
+        -------
+        numpy.ndarray of shape (4, 4, 4) or (N, 4, 4, 4)
+        """
+        sigmas, mus, nus = self.christoffel_indices.T
+
+        Gamma = numpy.zeros(components.shape[:-1] + (4, 4, 4))
+        Gamma[..., sigmas, mus, nus] = components
+        Gamma[..., sigmas, nus, mus] = components
+        return Gamma
+
+    @cached_property
+    def christoffel_indices(self):
+        """
+        Index table of the independent non-zero Christoffel components.
+
+        Returns
+        -------
+        numpy.ndarray of shape (K, 3)
+            Rows (sigma, mu, nu) with mu <= nu.
+        """
+        nonzero = self.christoffel_nonzero
+        if nonzero is None:
+            nonzero = [(sigma, mu, nu) for sigma, mu, nu in product(range(4), repeat=3) if mu <= nu]
+
+        return numpy.array(nonzero, dtype=int).reshape(-1, 3)
+
+    @cached_property
+    def christoffel_contraction(self):
+        """
+        Index table used to contract the Christoffel symbols with two vectors.
+
+        Returns
+        -------
+        tuple
+            (flat, mus, nus, weights) where flat holds the positions
+            16 * sigma + 4 * mu + nu of the K independent non-zero components
+            in the flattened tensor, mus and nus their lower indices, and
+            weights is an array of shape (K, 4) that scatters each term onto
+            sigma, counting twice the off-diagonal (mu != nu) components.
+        """
+        sigmas, mus, nus = self.christoffel_indices.T
+
+        weights = numpy.zeros((len(sigmas), 4))
+        weights[numpy.arange(len(sigmas)), sigmas] = numpy.where(mus == nus, 1.0, 2.0)
+
+        return 16 * sigmas + 4 * mus + nus, mus, nus, weights
+
+    @cached_property
+    def _christoffel_components_si_scale(self):
+        sigmas, mus, nus = self.christoffel_indices.T
+        return _CHRISTOFFEL_SI_SCALE[sigmas, mus, nus]
+
     @staticmethod
     def _christoffel_dimensionless_to_si(Gamma_geom):
-        Gamma_geom = numpy.asarray(Gamma_geom, dtype=float)
-        Gamma_si = numpy.zeros_like(Gamma_geom)
-
-        for rho in range(4):
-            for mu, nu in product(range(4), repeat=2):
-                exponent = (mu == 0) + (nu == 0) - (rho == 0)
-                Gamma_si[rho, mu, nu] = (_c_SI ** exponent) * Gamma_geom[rho, mu, nu]
+        """
+        Convert the Christoffel symbols from geometric convention (x0 = ct)
+        to SI convention (x0 = t).
 
-        return Gamma_si
+        Parameters
+        ----------
+        Gamma_geom : array-like of shape (4, 4, 4) or (N, 4, 4, 4)
+            Christoffel symbols in geometric units.
+        """
+        return numpy.asarray(Gamma_geom, dtype=float) * _CHRISTOFFEL_SI_SCALE
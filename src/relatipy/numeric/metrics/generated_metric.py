@@ -0,0 +1,200 @@
+import os
+
+from .base import BaseMetric
+from ..kernels import load_kernels
+
+# Classes built by make_metric, by (kernel key, name, coordinate system, parameters, horizon token)
+_classes = {}
+
+
+class GeneratedMetric(BaseMetric):
+    """
+    Metric evaluated by the NumPy kernels that ``relatipy.symbolic.codegen``
+    generates from a symbolic metric.
+
+    Subclasses are built by ``make_metric`` and take the mass and the values
+    of their ``parameters``, in dimensionless units, e.g. ``ReissnerNordstrom(mass, Q)``.
+    The symbols ``R_s`` and ``M`` of the symbolic metric are filled with the
+    Schwarzschild radius and the mass in dimensionless units.
+
+    Pickled metrics carry the key of their kernels, so worker processes load
+    them from the kernel cache without sympy.
+    """
+
+    kernels = None
+    parameters = ()
+    coordinate_system = "Cartesian"
+    _horizon_radius = None
+    # (pid, id) of _horizon_radius, it tells the classes of different horizon functions apart
+    _horizon_token = None
+
+    def __init__(self, mass, *values):
+        if len(values) != len(self.parameters):
+            raise ValueError(f"{type(self).__name__} takes the mass and the parameters {self.parameters}, got {len(values)} values.")
+
+        super().__init__(mass, valid_coordinate=self.coordinate_system, kwargs=dict(zip(self.parameters, values)))
+
+        values = {"R_s": self.R_s, "M": self.R_s / 2, **self.kwargs}
+        self._kernel_args = tuple(values[name] for name in self.kernels.PARAMETERS)
+
+        if self._horizon_radius is not None:
+            self.horizon_radius = self._horizon_radius(self)
+
+    def __reduce__(self):
+        cls = type(self)
+        return (
+            _load_generated_metric,
+            (self.kernels.KERNEL_KEY, cls.__name__, cls.coordinate_system, cls.parameters, cls._horizon_token,
+             self.mass, tuple(self.kwargs.values()), self.horizon_radius),
+        )
+
+    def _metric_dimensionless(self, xs):
+        """
+        Returns the metric tensor.
+
+        Parameters
+        ----------
+        xs : array of shape (4,) or (N, 4)
+            Coordinates [x0, x1, x2, x3].
+        """
+        return self.kernels.metric(xs, *self._kernel_args)
+
+    def inverse_metric(self, xs):
+        """
+        Returns the inverse metric tensor components g^{mu nu} in
+        dimensionless units, shaped as ``metric``.
+
+        Parameters
+        ----------
+        xs : list
+            List of coordinates [x0, x1, x2, x3] or array of shape (4,) or (4, N).
+        """
+        xs = self._as_dimensionless(xs)
+
+        if xs.ndim == 1:
+            return self.kernels.inverse_metric(xs, *self._kernel_args)
+
+        if xs.ndim == 2:
+            return self.kernels.inverse_metric(xs.T, *self._kernel_args).T
+
+        raise ValueError(f"xs must be 1D (single point) or 2D (N points), got shape {xs.shape}")
+
+    def _get_christoffel_symbols(self, xs):
+        """
+        Returns the Christoffel symbols.
+
+        Parameters
+        ----------
+        xs : array of shape (4,) or (N, 4)
+            Coordinates [x0, x1, x2, x3].
+        """
+        return self.kernels.christoffel_symbols(xs, *self._kernel_args)
+
+    def _get_christoffel_components(self, xs):
+        """
+        Returns the independent non-zero Christoffel symbols, ordered as
+        ``christoffel_nonzero``.
+
+        Parameters
+        ----------
+        xs : array of shape (4,) or (N, 4)
+            Coordinates [x0, x1, x2, x3].
+        """
+        return self.kernels.christoffel_components(xs, *self._kernel_args)
+
+    def _get_christoffel_derivatives(self, xs):
+        """
+        Returns the derivatives of the independent non-zero Christoffel symbols.
+
+        Parameters
+        ----------
+        xs : array of shape (4,) or (N, 4)
+            Coordinates [x0, x1, x2, x3].
+        """
+        return self.kernels.christoffel_derivatives(xs, *self._kernel_args)
+
+
+def make_metric(metric, coordinates=None, parameters=(), name="GeneratedMetric", coordinate_system="Cartesian", horizon_radius=None):
+    """
+    Builds a numeric metric class from a symbolic metric.
+
+    The metric, its inverse and its Christoffel symbols are compiled into
+    vectorized NumPy kernels by ``relatipy.symbolic.codegen`` (which needs
+    sympy) and stored in the kernel cache, so later calls with the same
+    metric do not regenerate them.
+
+    Parameters
+    ----------
+    metric : symbolic metric, einsteinpy MetricTensor or sympy Matrix
+        Metric with coordinates x0 = ct, x1, x2, x3 in dimensionless units.
+    coordinates : list of sympy.Symbol, optional
+        Coordinates of the metric, required for plain matrices.
+    parameters : list of sympy.Symbol or str
+        Parameters of the metric other than ``R_s`` and ``M``, in the order
+        the class takes them after the mass.
+    name : str
+        Name of the class.
+    coordinate_system : str
+        Coordinate system of the metric, a key of ``coordinate_systems``.
+    horizon_radius : callable, optional
+        Function of the metric object returning its horizon radius in
+        dimensionless units, e.g. ``lambda m: m.R_s``. Every function gets
+        its own class, so classes built before keep theirs.
+
+    Returns
+    -------
+    type
+        Subclass of ``GeneratedMetric``.
+
+    Examples
+    --------
+    >>> t, r, theta, phi, R_s, Q = sympy.symbols("t r theta phi R_s Q")
+    >>> f = 1 - R_s / r + Q**2 / r**2
+    >>> g = sympy.diag(f, -1 / f, -r**2, -r**2 * sympy.sin(theta)**2)
+    >>> ReissnerNordstrom = make_metric(g, [t, r, theta, phi], [Q], "ReissnerNordstrom", "Spherical")
+    >>> metric = ReissnerNordstrom(1.0, 0.5)
+    """
+    from ...symbolic.codegen import _python_name, compile_kernels
+
+    kernels = compile_kernels(metric, coordinates, name=name)
+    parameters = tuple(_python_name(str(parameter)) for parameter in parameters)
+
+    missing = set(kernels.PARAMETERS) - set(parameters) - {"R_s", "M"}
+    if missing:
+        raise ValueError(f"The parameters {sorted(missing)} of the metric are neither R_s, M nor in parameters.")
+
+    return _make_class(kernels, name, coordinate_system, parameters, horizon_radius)
+
+
+def _make_class(kernels, name, coordinate_system, parameters, horizon_radius=None):
+    # The memo keeps the function alive, so its id is not reused while the class exists
+    horizon_token = (os.getpid(), id(horizon_radius)) if horizon_radius is not None else None
+    key = (kernels.KERNEL_KEY, name, coordinate_system, parameters, horizon_token)
+    if key not in _classes:
+        _classes[key] = type(name, (GeneratedMetric,), {
+            "kernels": kernels,
+            "parameters": parameters,
+            "coordinate_system": coordinate_system,
+            "christoffel_nonzero": kernels.CHRISTOFFEL_NONZERO,
+            "_horizon_radius": staticmethod(horizon_radius) if horizon_radius is not None else None,
+            "_horizon_token": horizon_token,
+            "__module__": __name__,
+        })
+    return _classes[key]
+
+
+def _load_generated_metric(kernel_key, name, coordinate_system, parameters, horizon_token, mass, values, horizon_radius):
+    kernels = load_kernels(kernel_key)
+    if kernels is None:
+        raise RuntimeError(f"The kernels of {name} are not in the kernel cache, build the metric with make_metric first.")
+
+    # In the process that built the class the token finds it again, elsewhere
+    # a class without horizon function is used
+    cls = _classes.get((kernel_key, name, coordinate_system, parameters, horizon_token))
+    if cls is None:
+        cls = _make_class(kernels, name, coordinate_system, parameters)
+
+    metric = cls(mass, *values)
+    # The horizon function of make_metric may not exist in this process
+    metric.horizon_radius = horizon_radius
+    return metric
@@ -4,9 +4,67 @@ from numpy import sin, cos, tan
 from .base import BaseMetric
 
 class Kerr(BaseMetric):
+    christoffel_nonzero = (
+        (0, 0, 1), (0, 0, 2), (0, 1, 3), (0, 2, 3),
+        (1, 0, 0), (1, 0, 3), (1, 1, 1), (1, 1, 2), (1, 2, 2), (1, 3, 3),
+        (2, 0, 0), (2, 0, 3), (2, 1, 1), (2, 1, 2), (2, 2, 2), (2, 3, 3),
+        (3, 0, 1), (3, 0, 2), (3, 1, 3), (3, 2, 3),
+    )
+
     def __init__(self, mass, a):
         super().__init__(mass, valid_coordinate="BoyerLindquist", kwargs={"a": a})
         self.a = a * self.R_s / 2
+        # With |a| > M there is no horizon, the ring singularity is naked
+        if self.a**2 <= self.R_s**2 / 4:
+            self.horizon_radius = self.R_s / 2 + numpy.sqrt(self.R_s**2 / 4 - self.a**2)
+
+    def get_null_4momentum_from_impact_parameters(self, xs, lambdas, etas, sign_r=-1, sign_theta=1, energy=1.0):
+        """
+        Returns the 4-momenta k^mu of photons from their constants of motion.
+
+        Parameters
+        ----------
+        xs : array of shape (4,) or (N, 4)
+            Boyer-Lindquist coordinates [t, r, theta, phi] of the photons.
+        lambdas : float or array of shape (N,)
+            Axial impact parameters lambda = L_z / E.
+        etas : float or array of shape (N,)
+            Carter constants over the energy squared, eta = Q / E^2.
+        sign_r, sign_theta : int or array of shape (N,)
+            Signs of the radial and polar components (-1 for incoming rays).
+        energy : float or array of shape (N,)
+            Energy of the photons in dimensionless units.
+
+        Returns
+        -------
+        numpy.ndarray of shape (4,) or (N, 4)
+        """
+        xs = numpy.asarray(xs, dtype=float)
+        r = xs[..., 1]
+        r2 = r * r
+        s_x2 = numpy.sin(xs[..., 2]) ** 2
+        c_x2 = numpy.cos(xs[..., 2]) ** 2
+        a = self.a
+        a_2 = a * a
+
+        Sigma = r2 + a_2 * c_x2
+        Delta = r2 - self.R_s * r + a_2
+        P = r2 + a_2 - a * lambdas
+
+        R = P * P - Delta * (etas + (lambdas - a) ** 2)
+        Theta = etas + a_2 * c_x2 - lambdas**2 * c_x2 / s_x2
+        # Tolerate round-off at turning points, e.g. Theta at theta = pi / 2 for eta = 0
+        if numpy.any(R < -1e-12 * P * P) or numpy.any(Theta < -1e-12):
+            raise ValueError("The impact parameters give a forbidden region (R < 0 or Theta < 0) at xs.")
+        R = numpy.maximum(R, 0)
+        Theta = numpy.maximum(Theta, 0)
+
+        k0 = (-a * (a * s_x2 - lambdas) + (r2 + a_2) * P / Delta) / Sigma
+        k1 = sign_r * numpy.sqrt(R) / Sigma
+        k2 = sign_theta * numpy.sqrt(Theta) / Sigma
+        k3 = (lambdas / s_x2 - a + a * P / Delta) / Sigma
+
+        return numpy.stack(numpy.broadcast_arrays(k0, k1, k2, k3), axis=-1) * numpy.asarray(energy)[..., None]
 
     def _metric_dimensionless(self, xs):
         """
@@ -33,7 +91,7 @@ class Kerr(BaseMetric):
             R_s  = self.R_s
 
             Sigma = x1_2 * (1 + a_2 / x1_2 * c_x2)
-            Delta = x1_2 * (1 - (R_s * x1 + a_2) / x1_2)
+            Delta = x1_2 * (1 - (R_s * x1 - a_2) / x1_2)
 
             A = 1 - R_s * x1 / Sigma
             B = -Sigma / Delta
@@ -85,18 +143,13 @@ class Kerr(BaseMetric):
         """
         xs = numpy.asarray(xs, dtype=float)
 
-        if xs.ndim == 2:
-            N = len(xs)
-            Gammas = numpy.zeros((N, 4, 4, 4))
-            for i, x in enumerate(xs):
-                Gammas[i] = self._get_christoffel_symbols(x)
-            return Gammas
-
-        x0, x1, x2, x3 = xs
+        # Every expression below is elementwise, so (N, 4) inputs are
+        # evaluated for all the points at once through broadcasting.
+        x0, x1, x2, x3 = xs.T
 
         ############### Auxiliary variables ##############
-        a = self.a
         R_s = self.R_s
+        a = self.a
 
         cos_I2_x2I_ = cos(2 * x2)
         cos_I4_x2I_ = cos(4 * x2)
@@ -106,7 +159,21 @@ class Kerr(BaseMetric):
         tan_Ix2I_ = tan(x2)
 
         R_s_pow2 = R_s**2
+        _1_over_Sigma_Delta = 1 / (
+            -R_s * a**2 * cos_Ix2I_**2 * x1
+            - R_s * x1**3
+            + a**4 * cos_Ix2I_**2
+            + a**2 * cos_Ix2I_**2 * x1**2
+            + a**2 * x1**2
+            + x1**4
+        )
+        _1_over_Delta = 1 / (-R_s * x1 + a**2 + x1**2)
+        _1_over__I2_SigmaI_ = 1 / (a**2 * cos_I2_x2I_ + a**2 + 2 * x1**2)
+        _1_over_Sigma = 1 / (a**2 * cos_Ix2I_**2 + x1**2)
         _1_over_tan_Ix2I_ = 1 / tan_Ix2I_
+        _I2_SigmaI__pow_I_3I_ = (a**2 * cos_I2_x2I_ + a**2 + 2 * x1**2) ** (-3)
+        Sigma_pow_I_2I_ = (a**2 * cos_Ix2I_**2 + x1**2) ** (-2)
+        Sigma_pow_I_3I_ = (a**2 * cos_Ix2I_**2 + x1**2) ** (-3)
         a_pow2 = a**2
         a_pow4 = a**4
         a_pow6 = a**6
@@ -120,249 +187,500 @@ class Kerr(BaseMetric):
         x1_pow5 = x1**5
         x1_pow6 = x1**6
 
-        # Modified manually for optimization
-        a_pow2_cos_Ix2I__pow2 = a_pow2 * cos_Ix2I__pow2
-        R_s_a_pow2_cos_Ix2I__pow2_x1 = R_s * a_pow2_cos_Ix2I__pow2 * x1
-        R_s_x1_pow3 = R_s * x1_pow3
-        _2_x1_pow2 = 2 * x1_pow2
-        _R_s_x1 = -R_s * x1
-        _a_pow2_cos_Ix2I__pow2_x1_pow2 = -a_pow2_cos_Ix2I__pow2 * x1_pow2
-        a_pow2_cos_I2_x2I_ = a_pow2 * cos_I2_x2I_
-        _a_pow2_sin_I2_x2I__over__Ia_pow2_cos_I2_x2I___plus__a_pow2__plus__2_x1_pow2I_ = (
-            -a_pow2 * sin_I2_x2I_ / (a_pow2_cos_I2_x2I_ + a_pow2 + _2_x1_pow2)
-        )
-        a_pow2_x1_pow2 = a_pow2 * x1_pow2
-        _a_pow2_x1_pow2 = -a_pow2_x1_pow2
+        _a_pow2_sin_I2_x2I__over__I2_SigmaI_ = -_1_over__I2_SigmaI_ * a_pow2 * sin_I2_x2I_
+        _a_pow2_cos_Ix2I__pow2_x1_pow2 = -a_pow2 * cos_Ix2I__pow2 * x1_pow2
+        _a_pow2_x1_pow2 = -a_pow2 * x1_pow2
         _cos_I4_x2I_ = -cos_I4_x2I_
-        _x1_pow4 = -x1_pow4
         a_pow4_cos_Ix2I__pow2 = a_pow4 * cos_Ix2I__pow2
 
         ##################################################
 
         ############### Christoffel symbols ##############
-        Gamma = numpy.zeros((4, 4, 4))
+        Gamma = numpy.zeros(xs.shape[:-1] + (4, 4, 4))
 
         # Only non-zero components and symmetry properties
 
         # mu = 0
-        Gamma[0, 0, 1] = (
+        Gamma[..., 0, 0, 1] = (
             R_s
+            * _1_over_Delta
+            * Sigma_pow_I_2I_
             * (
-                a_pow2_x1_pow2 * sin_Ix2I__pow2
+                a_pow2 * sin_Ix2I__pow2 * x1_pow2
                 + a_pow4 * sin_Ix2I__pow2
                 - a_pow4
                 + x1_pow4
             )
-            / (
-                2
-                * (a_pow2_cos_Ix2I__pow2 + x1_pow2) ** 2
-                * (_R_s_x1 + a_pow2 + x1_pow2)
-            )
+            / 2
         )
-        Gamma[0, 0, 2] = (
-            2
-            * R_s
-            * _a_pow2_sin_I2_x2I__over__Ia_pow2_cos_I2_x2I___plus__a_pow2__plus__2_x1_pow2I_
-            * x1
-            / (_2_x1_pow2 + a_pow2 + a_pow2_cos_I2_x2I_)
+        Gamma[..., 0, 0, 2] = (
+            2 * R_s * _1_over__I2_SigmaI_ * _a_pow2_sin_I2_x2I__over__I2_SigmaI_ * x1
         )
-        Gamma[0, 1, 3] = (
+        Gamma[..., 0, 1, 3] = (
             R_s
+            * _1_over_Delta
+            * Sigma_pow_I_2I_
             * a
             * sin_Ix2I__pow2
             * (
                 _a_pow2_cos_Ix2I__pow2_x1_pow2
                 + _a_pow2_x1_pow2
-                + 3 * _x1_pow4
                 + a_pow4_cos_Ix2I__pow2
+                - 3 * x1_pow4
             )
-            / (
-                2
-                * (a_pow2_cos_Ix2I__pow2 + x1_pow2) ** 2
-                * (_R_s_x1 + a_pow2 + x1_pow2)
-            )
-        )
-        Gamma[0, 2, 3] = (
-            R_s
-            * a**3
-            * cos_Ix2I_
-            * sin_Ix2I_**3
-            * x1
-            / (a_pow2_cos_Ix2I__pow2 + x1_pow2) ** 2
+            / 2
         )
+        Gamma[..., 0, 2, 3] = R_s * Sigma_pow_I_2I_ * a**3 * cos_Ix2I_ * sin_Ix2I_**3 * x1
 
-        Gamma[0, 1, 0] = Gamma[0, 0, 1]
-        Gamma[0, 2, 0] = Gamma[0, 0, 2]
-        Gamma[0, 3, 1] = Gamma[0, 1, 3]
-        Gamma[0, 3, 2] = Gamma[0, 2, 3]
+        Gamma[..., 0, 1, 0] = Gamma[..., 0, 0, 1]
+        Gamma[..., 0, 2, 0] = Gamma[..., 0, 0, 2]
+        Gamma[..., 0, 3, 1] = Gamma[..., 0, 1, 3]
+        Gamma[..., 0, 3, 2] = Gamma[..., 0, 2, 3]
 
         # mu = 1
-        Gamma[1, 0, 0] = (
+        Gamma[..., 1, 0, 0] = (
             R_s
+            * Sigma_pow_I_3I_
             * (
-                R_s_a_pow2_cos_Ix2I__pow2_x1
-                - R_s_x1_pow3
+                R_s * a_pow2 * cos_Ix2I__pow2 * x1
+                - R_s * x1_pow3
                 + _a_pow2_cos_Ix2I__pow2_x1_pow2
-                + _a_pow2_x1_pow2
-                + a_pow4_cos_Ix2I__pow2
+                + a_pow2 * x1_pow2
+                - a_pow4_cos_Ix2I__pow2
                 + x1_pow4
             )
-            / (2 * (a_pow2_cos_Ix2I__pow2 + x1_pow2) ** 3)
+            / 2
         )
-        Gamma[1, 0, 3] = (
+        Gamma[..., 1, 0, 3] = (
             R_s
+            * Sigma_pow_I_3I_
             * a
             * sin_Ix2I__pow2
             * (
-                -R_s_a_pow2_cos_Ix2I__pow2_x1
-                + R_s_x1_pow3
-                + _x1_pow4
-                + a_pow2_cos_Ix2I__pow2 * x1_pow2
-                + a_pow2_x1_pow2
-                - a_pow4_cos_Ix2I__pow2
+                -R_s * a_pow2 * cos_Ix2I__pow2 * x1
+                + R_s * x1_pow3
+                + _a_pow2_x1_pow2
+                + a_pow2 * cos_Ix2I__pow2 * x1_pow2
+                + a_pow4_cos_Ix2I__pow2
+                - x1_pow4
             )
-            / (2 * (a_pow2_cos_Ix2I__pow2 + x1_pow2) ** 3)
-        )
-        Gamma[1, 1, 1] = (
-            -R_s * a_pow2_cos_Ix2I__pow2 / 2
-            + R_s * x1_pow2 / 2
-            + a_pow2 * x1
-            + a_pow2_cos_Ix2I__pow2 * x1
-        ) / (
-            R_s_a_pow2_cos_Ix2I__pow2_x1
-            + R_s_x1_pow3
-            + _a_pow2_cos_Ix2I__pow2_x1_pow2
-            + _x1_pow4
-            + a_pow2_x1_pow2
-            + a_pow4_cos_Ix2I__pow2
+            / 2
         )
-        Gamma[1, 1, 2] = (
-            _a_pow2_sin_I2_x2I__over__Ia_pow2_cos_I2_x2I___plus__a_pow2__plus__2_x1_pow2I_
+        Gamma[..., 1, 1, 1] = _1_over_Sigma_Delta * (
+            -R_s * a_pow2 * sin_Ix2I__pow2 / 2
+            + R_s * a_pow2 / 2
+            - R_s * x1_pow2 / 2
+            + a_pow2 * sin_Ix2I__pow2 * x1
         )
-        Gamma[1, 2, 2] = (
-            x1 * (R_s * x1 + a_pow2 - x1_pow2) / (a_pow2_cos_Ix2I__pow2 + x1_pow2)
-        )
-        Gamma[1, 3, 3] = (
-            sin_Ix2I__pow2
+        Gamma[..., 1, 1, 2] = _a_pow2_sin_I2_x2I__over__I2_SigmaI_
+        Gamma[..., 1, 2, 2] = _1_over_Sigma * x1 * (R_s * x1 - a_pow2 - x1_pow2)
+        Gamma[..., 1, 3, 3] = (
+            Sigma_pow_I_3I_
+            * sin_Ix2I__pow2
             * (
-                R_s * a_pow2 * sin_Ix2I__pow2 * x1_pow4 / 2
-                + 2 * R_s * a_pow2_cos_Ix2I__pow2 * x1_pow4
+                2 * R_s * a_pow2 * cos_Ix2I__pow2 * x1_pow4
+                + R_s * a_pow2 * sin_Ix2I__pow2 * x1_pow4 / 2
                 + R_s * a_pow4 * cos_Ix2I__pow4 * x1_pow2
-                - R_s * a_pow4 * sin_Ix2I__pow2 * x1_pow2 / 2
+                + R_s * a_pow4 * sin_Ix2I__pow2 * x1_pow2 / 2
                 - R_s * a_pow4 * x1_pow2 * (_cos_I4_x2I_ + 1) / 16
-                + R_s * a_pow6 * (_cos_I4_x2I_ + 1) / 16
+                - R_s * a_pow6 * (_cos_I4_x2I_ + 1) / 16
                 + R_s * x1_pow6
                 - R_s_pow2 * a_pow2 * sin_Ix2I__pow2 * x1_pow3 / 2
                 + R_s_pow2 * a_pow4 * x1 * (_cos_I4_x2I_ + 1) / 16
-                + a_pow2 * x1_pow5
-                - 2 * a_pow2_cos_Ix2I__pow2 * x1_pow5
+                - 2 * a_pow2 * cos_Ix2I__pow2 * x1_pow5
+                - a_pow2 * x1_pow5
                 - a_pow4 * cos_Ix2I__pow4 * x1_pow3
-                + 2 * a_pow4_cos_Ix2I__pow2 * x1_pow3
-                + a_pow6 * cos_Ix2I__pow4 * x1
+                - 2 * a_pow4_cos_Ix2I__pow2 * x1_pow3
+                - a_pow6 * cos_Ix2I__pow4 * x1
                 - x1**7
             )
-            / (a_pow2_cos_Ix2I__pow2 + x1_pow2) ** 3
         )
 
-        Gamma[1, 2, 1] = Gamma[1, 1, 2]
-        Gamma[1, 3, 0] = Gamma[1, 0, 3]
+        Gamma[..., 1, 2, 1] = Gamma[..., 1, 1, 2]
+        Gamma[..., 1, 3, 0] = Gamma[..., 1, 0, 3]
 
         # mu = 2
-        Gamma[2, 0, 0] = (
-            4
-            * R_s
-            * _a_pow2_sin_I2_x2I__over__Ia_pow2_cos_I2_x2I___plus__a_pow2__plus__2_x1_pow2I_
-            * x1
-            / (_2_x1_pow2 + a_pow2 + a_pow2_cos_I2_x2I_) ** 2
+        Gamma[..., 2, 0, 0] = -4 * R_s * _I2_SigmaI__pow_I_3I_ * a_pow2 * sin_I2_x2I_ * x1
+        Gamma[..., 2, 0, 3] = (
+            4 * R_s * _I2_SigmaI__pow_I_3I_ * a * sin_I2_x2I_ * x1 * (a_pow2 + x1_pow2)
         )
-        Gamma[2, 0, 3] = (
-            4
-            * R_s
-            * a
-            * sin_I2_x2I_
-            * x1
-            * (a_pow2 + x1_pow2)
-            / (_2_x1_pow2 + a_pow2 + a_pow2_cos_I2_x2I_) ** 3
-        )
-        Gamma[2, 1, 1] = (
-            -a_pow2
+        Gamma[..., 2, 1, 1] = _1_over_Sigma_Delta * a_pow2 * cos_Ix2I_ * sin_Ix2I_
+        Gamma[..., 2, 1, 2] = _1_over_Sigma * x1
+        Gamma[..., 2, 2, 2] = _a_pow2_sin_I2_x2I__over__I2_SigmaI_
+        Gamma[..., 2, 3, 3] = (
+            Sigma_pow_I_3I_
             * cos_Ix2I_
             * sin_Ix2I_
-            / (
-                R_s_a_pow2_cos_Ix2I__pow2_x1
-                + R_s_x1_pow3
-                + _a_pow2_cos_Ix2I__pow2_x1_pow2
-                - _a_pow2_x1_pow2
-                + _x1_pow4
-                + a_pow4_cos_Ix2I__pow2
-            )
-        )
-        Gamma[2, 1, 2] = x1 / (a_pow2_cos_Ix2I__pow2 + x1_pow2)
-        Gamma[2, 2, 2] = (
-            _a_pow2_sin_I2_x2I__over__Ia_pow2_cos_I2_x2I___plus__a_pow2__plus__2_x1_pow2I_
-        )
-        Gamma[2, 3, 3] = (
-            cos_Ix2I_
-            * sin_Ix2I_
             * (
-                -2 * R_s_x1_pow3 * a_pow2 * sin_Ix2I__pow2
-                - _2_x1_pow2 * a_pow4_cos_Ix2I__pow2
-                + _R_s_x1 * a_pow4 * sin_Ix2I__pow4
-                + _R_s_x1 * a_pow4 * (_cos_I4_x2I_ + 1) / 4
-                + _x1_pow4 * a_pow2
-                + 2 * _x1_pow4 * a_pow2_cos_Ix2I__pow2
+                -2 * R_s * a_pow2 * sin_Ix2I__pow2 * x1_pow3
+                - R_s * a_pow4 * sin_Ix2I__pow4 * x1
+                - R_s * a_pow4 * x1 * (_cos_I4_x2I_ + 1) / 4
+                - 2 * a_pow2 * cos_Ix2I__pow2 * x1_pow4
+                - a_pow2 * x1_pow4
                 - a_pow4 * cos_Ix2I__pow4 * x1_pow2
+                - 2 * a_pow4_cos_Ix2I__pow2 * x1_pow2
                 - a_pow6 * cos_Ix2I__pow4
                 - x1_pow6
             )
-            / (a_pow2_cos_Ix2I__pow2 + x1_pow2) ** 3
         )
 
-        Gamma[2, 2, 1] = Gamma[2, 1, 2]
-        Gamma[2, 3, 0] = Gamma[2, 0, 3]
+        Gamma[..., 2, 2, 1] = Gamma[..., 2, 1, 2]
+        Gamma[..., 2, 3, 0] = Gamma[..., 2, 0, 3]
 
         # mu = 3
-        Gamma[3, 0, 1] = (
+        Gamma[..., 3, 0, 1] = (
             R_s
+            * _1_over_Delta
+            * Sigma_pow_I_2I_
             * a
-            * (-a_pow2_cos_Ix2I__pow2 + x1_pow2)
-            / (
-                2
-                * (a_pow2_cos_Ix2I__pow2 + x1_pow2) ** 2
-                * (_R_s_x1 + a_pow2 + x1_pow2)
-            )
+            * (-a_pow2 * cos_Ix2I__pow2 + x1_pow2)
+            / 2
         )
-        Gamma[3, 0, 2] = (
-            _1_over_tan_Ix2I_ * _R_s_x1 * a / (a_pow2_cos_Ix2I__pow2 + x1_pow2) ** 2
+        Gamma[..., 3, 0, 2] = -R_s * _1_over_tan_Ix2I_ * Sigma_pow_I_2I_ * a * x1
+        Gamma[..., 3, 1, 3] = (
+            _1_over_Delta
+            * Sigma_pow_I_2I_
+            * (
+                R_s * _a_pow2_cos_Ix2I__pow2_x1_pow2
+                + R_s * _a_pow2_x1_pow2 * sin_Ix2I__pow2 / 2
+                + R_s * a_pow4 * (_cos_I4_x2I_ + 1) / 16
+                - R_s * x1_pow4
+                + 2 * a_pow2 * cos_Ix2I__pow2 * x1_pow3
+                + a_pow4 * cos_Ix2I__pow4 * x1
+                + x1_pow5
+            )
         )
-        Gamma[3, 1, 3] = (
-            R_s * _a_pow2_cos_Ix2I__pow2_x1_pow2
-            + R_s * _a_pow2_x1_pow2 * sin_Ix2I__pow2 / 2
-            + R_s * _x1_pow4
-            + R_s * a_pow4 * (_cos_I4_x2I_ + 1) / 16
-            + 2 * a_pow2_cos_Ix2I__pow2 * x1_pow3
-            + a_pow4 * cos_Ix2I__pow4 * x1
-            + x1_pow5
-        ) / ((a_pow2_cos_Ix2I__pow2 + x1_pow2) ** 2 * (_R_s_x1 + a_pow2 + x1_pow2))
-        Gamma[3, 2, 3] = (
+        Gamma[..., 3, 2, 3] = (
             _1_over_tan_Ix2I_
             * (
                 R_s * a_pow2 * sin_Ix2I__pow2 * x1
-                + _2_x1_pow2 * a_pow2
                 + 2 * _a_pow2_x1_pow2 * sin_Ix2I__pow2
+                + 2 * a_pow2 * x1_pow2
                 - 2 * a_pow4 * sin_Ix2I__pow2
                 + a_pow4 * sin_Ix2I__pow4
                 + a_pow4
                 + x1_pow4
             )
-            / (_2_x1_pow2 * a_pow2_cos_Ix2I__pow2 + a_pow4 * cos_Ix2I__pow4 + x1_pow4)
+            / (2 * a_pow2 * cos_Ix2I__pow2 * x1_pow2 + a_pow4 * cos_Ix2I__pow4 + x1_pow4)
         )
 
-        Gamma[3, 1, 0] = Gamma[3, 0, 1]
-        Gamma[3, 2, 0] = Gamma[3, 0, 2]
-        Gamma[3, 3, 1] = Gamma[3, 1, 3]
-        Gamma[3, 3, 2] = Gamma[3, 2, 3]
+        Gamma[..., 3, 1, 0] = Gamma[..., 3, 0, 1]
+        Gamma[..., 3, 2, 0] = Gamma[..., 3, 0, 2]
+        Gamma[..., 3, 3, 1] = Gamma[..., 3, 1, 3]
+        Gamma[..., 3, 3, 2] = Gamma[..., 3, 2, 3]
 
         ##################################################
 
         return Gamma
+
+    # Generated by utils/symbolic_to_numeric.py
+    def _get_christoffel_derivatives(self, xs):
+        """
+        Returns the derivatives of the independent non-zero Christoffel symbols.
+
+        Parameters
+        ----------
+        xs : array of shape (4,) or (N, 4)
+            Coordinates [x0, x1, x2, x3].
+
+        Returns
+        -------
+        numpy.ndarray of shape (4, K) or (N, 4, K)
+            dGamma[..., lambda, k] is the derivative of the k-th component of
+            ``christoffel_indices`` with respect to x^lambda.
+        """
+        xs = numpy.asarray(xs, dtype=float)
+        x0, x1, x2, x3 = xs.T
+
+        ############### Auxiliary variables ##############
+        R_s = self.R_s
+        a = self.a
+
+        v0001 = x1**3
+        v0002 = R_s*v0001
+        v0003 = 4*v0002
+        v0004 = a**2
+        v0005 = 2*v0004
+        v0006 = R_s*x1
+        v0007 = v0005*v0006
+        v0008 = cos(x2)
+        v0009 = v0008**2
+        v0010 = v0005*v0009
+        v0011 = -v0010*v0006
+        v0012 = v0011 + v0003 + v0007
+        v0013 = x1**6
+        v0014 = 2*v0013
+        v0015 = x1**5
+        v0016 = R_s*v0015
+        v0017 = x1**4
+        v0018 = v0017*v0004
+        v0019 = 2*v0018
+        v0020 = a**6
+        v0021 = v0008**4
+        v0022 = v0020*v0021
+        v0023 = 2*v0022
+        v0024 = v0002*v0005
+        v0025 = a**4
+        v0026 = v0025*v0009
+        v0027 = R_s*v0026
+        v0028 = 2*v0027*x1
+        v0029 = v0018*v0009
+        v0030 = x1**2
+        v0031 = 4*v0026
+        v0032 = v0025*v0030
+        v0033 = v0021*v0032
+        v0034 = 2*v0033
+        v0035 = sin(x2)
+        v0036 = v0035**2
+        v0037 = 2*v0036
+        v0038 = v0027*x1
+        v0039 = -v0010*v0002 + v0014 - 2*v0016 + v0019 + v0023 + v0024*v0036 - v0024 - v0028 + 4*v0029 + v0030*v0031 + v0034 + v0037*v0038
+        v0040 = 1/v0039
+        v0041 = 12*v0015
+        v0042 = 8*v0001
+        v0043 = v0004*v0042
+        v0044 = v0021*v0025
+        v0045 = v0044*x1
+        v0046 = v0004*v0009
+        v0047 = v0001*v0046
+        v0048 = R_s*v0030
+        v0049 = v0004*v0048
+        v0050 = 6*v0049
+        v0051 = 10*R_s*v0017 + 2*R_s*v0025*v0009 + 6*R_s*v0030*v0004*v0009 + 6*R_s*v0030*v0004 - 8*v0026*x1 - v0027*v0037 - v0036*v0050 - v0041 - v0043 - 4*v0045 - 16*v0047
+        v0052 = v0039**(-2)
+        v0053 = v0046*v0048
+        v0054 = v0052*(R_s*v0017 + R_s*v0030*v0004 - v0027 - v0053)
+        v0055 = R_s*v0025
+        v0056 = v0035*v0008
+        v0057 = v0055*v0056
+        v0058 = v0048*v0056
+        v0059 = v0005*v0058 + 2*v0057
+        v0060 = v0008**3
+        v0061 = v0020*v0060
+        v0062 = 8*v0035
+        v0063 = v0025*v0006
+        v0064 = 4*v0056
+        v0065 = v0018*v0035
+        v0066 = v0065*v0008
+        v0067 = R_s*v0056
+        v0068 = v0060*v0063
+        v0069 = v0035**3
+        v0070 = v0069*v0008
+        v0071 = 4*v0070
+        v0072 = v0032*v0060
+        v0073 = v0032*v0062*v0008 - 4*v0035*v0068 - v0043*v0067 + v0061*v0062 + v0062*v0072 - v0063*v0064 + v0063*v0071 + 8*v0066
+        v0074 = 3*v0049
+        v0075 = R_s**2
+        v0076 = v0005*x1
+        v0077 = v0056*v0076
+        v0078 = -v0075*v0077
+        v0079 = v0002*v0004
+        v0080 = v0019*v0009
+        v0081 = 2*v0026
+        v0082 = v0030*v0081
+        v0083 = v0036*v0079
+        v0084 = v0002*v0046
+        v0085 = v0013 - v0016 + v0018 + v0022 + v0033 + v0036*v0038 - v0038 - v0079 + v0080 + v0082 + v0083 - v0084
+        v0086 = 1/v0085
+        v0087 = 6*v0015
+        v0088 = -v0027
+        v0089 = 4*v0001
+        v0090 = v0004*v0089
+        v0091 = v0031*x1
+        v0092 = v0042*v0046
+        v0093 = 2*v0044*x1
+        v0094 = v0027*v0036 + v0093
+        v0095 = 5*R_s*v0017 + 3*R_s*v0030*v0004*v0009 + 3*R_s*v0030*v0004 - v0036*v0074 - v0087 - v0088 - v0090 - v0091 - v0092 - v0094
+        v0096 = v0085**(-2)
+        v0097 = v0096*(v0030*v0035*v0004*v0075*v0008 - v0056*v0063 - v0056*v0079)
+        v0098 = v0030*v0004
+        v0099 = v0036*v0075
+        v0100 = v0098*v0099
+        v0101 = 4*v0061
+        v0102 = 2*v0006
+        v0103 = v0102*v0025
+        v0104 = v0004*v0056
+        v0105 = v0025*v0060
+        v0106 = v0102*v0105
+        v0107 = v0035*v0072
+        v0108 = v0101*v0035 + v0102*v0025*v0070 - v0103*v0056 - v0104*v0003 - v0106*v0035 + 4*v0107 + v0032*v0064 + 4*v0066
+        v0109 = a*v0036
+        v0110 = v0109*v0002
+        v0111 = a**3
+        v0112 = v0111*v0036
+        v0113 = v0102*v0112
+        v0114 = v0036*v0009
+        v0115 = v0111*v0114
+        v0116 = v0102*v0115
+        v0117 = R_s*v0017
+        v0118 = v0109*v0117
+        v0119 = v0115*v0048
+        v0120 = a**5
+        v0121 = -R_s*v0120*v0036*v0009 + v0112*v0048
+        v0122 = v0052*(-3*v0118 - v0119 - v0121)
+        v0123 = v0111*v0070
+        v0124 = 2*v0123
+        v0125 = v0124*v0048
+        v0126 = 2*v0111*v0035*v0060
+        v0127 = v0126*v0048
+        v0128 = a*v0056
+        v0129 = R_s*v0120*v0070
+        v0130 = -2*R_s*v0120*v0035*v0060 + 2*v0111*v0058 + 2*v0129
+        v0131 = 3*v0048
+        v0132 = v0075*x1
+        v0133 = -v0124*v0132
+        v0134 = v0120*v0006
+        v0135 = v0030*v0075
+        v0136 = v0096*(-v0123*v0135 + v0123*v0002 + v0134*v0070)
+        v0137 = v0035**4
+        v0138 = v0111*v0137
+        v0139 = 3*v0030
+        v0140 = v0139*v0075
+        v0141 = v0008**6
+        v0142 = v0141*v0020
+        v0143 = 6*v0029
+        v0144 = 6*v0033
+        v0145 = v0014 + 2*v0142 + v0143 + v0144
+        v0146 = 1/v0145
+        v0147 = v0046*v0075
+        v0148 = -v0041 - 12*v0045 - 24*v0047
+        v0149 = v0145**(-2)
+        v0150 = v0001*v0075
+        v0151 = v0149*(v0117 + v0147*x1 - v0150 + v0049 - v0053 + v0088)
+        v0152 = v0008**5
+        v0153 = v0152*v0020
+        v0154 = v0153*v0035
+        v0155 = 24*v0107 + 12*v0154 + 12*v0066
+        v0156 = v0111*v0009
+        v0157 = v0156*v0099
+        v0158 = v0149*(a*v0001*v0036*v0075 - v0118 + v0119 - v0121 - v0157*x1)
+        v0159 = 2*v0117
+        v0160 = v0030*v0005
+        v0161 = v0160*v0009
+        v0162 = v0011 + v0160 + v0161 + 2*v0017 - 2*v0002 + v0081
+        v0163 = 1/v0162
+        v0164 = v0004*x1
+        v0165 = 4*v0164
+        v0166 = 4*x1
+        v0167 = -v0048
+        v0168 = v0010*x1
+        v0169 = (R_s*v0046 + v0167 - v0168 + v0076)/v0162**2
+        v0170 = v0030 + v0046
+        v0171 = v0170**(-2)
+        v0172 = v0171*v0077
+        v0173 = 1/v0170
+        v0174 = -v0171*v0036*v0081 + v0173*v0036*v0004 - v0173*v0046
+        v0175 = -v0001 - v0164 - v0167
+        v0176 = 2*v0171
+        v0177 = v0013*v0036
+        v0178 = v0018*v0036
+        v0179 = v0023*v0036
+        v0180 = v0137*v0004
+        v0181 = v0178*v0009
+        v0182 = v0026*v0036
+        v0183 = v0182*v0030
+        v0184 = x1**7
+        v0185 = v0015*v0036
+        v0186 = v0149*(2*R_s*v0013*v0036 + R_s*v0137*v0017*v0004 - R_s*v0137*v0020*v0009 + R_s*v0137*v0025*v0030 + 4*R_s*v0017*v0036*v0004*v0009 + 2*R_s*v0021*v0025*v0030*v0036 - v0001*v0037*v0044 + v0137*v0025*v0075*v0009*x1 - v0137*v0026*v0048 - v0150*v0180 - v0179*x1 - v0182*v0089 - v0184*v0037 - 4*v0185*v0046 - v0185*v0005)
+        v0187 = v0035**5
+        v0188 = v0015*v0004
+        v0189 = v0004*v0071
+        v0190 = 2*v0025
+        v0191 = v0190*x1
+        v0192 = v0013 + v0139*v0044 + v0142 + 3*v0029
+        v0193 = 1/v0192
+        v0194 = -6*v0045 - 12*v0047 - v0087
+        v0195 = v0192**(-2)
+        v0196 = v0164*v0195*v0067
+        v0197 = v0046*v0006
+        v0198 = 12*v0107 + 6*v0154 + 6*v0066
+        v0199 = R_s*v0111
+        v0200 = v0199*v0060
+        v0201 = a*v0131
+        v0202 = a*v0002
+        v0203 = v0111*v0006
+        v0204 = v0203*v0060
+        v0205 = v0195*(v0202*v0056 + v0203*v0070 + v0204*v0035)
+        v0206 = v0017 - v0197 - v0002 + v0026 + v0030*v0046 + v0098
+        v0207 = v0104/v0206**2
+        v0208 = 1/v0206
+        v0209 = v0035*v0087
+        v0210 = v0055*v0008
+        v0211 = v0105*v0166
+        v0212 = v0152*v0191
+        v0213 = v0055*v0060
+        v0214 = v0043*v0060
+        v0215 = v0013*v0035
+        v0216 = v0187*v0063
+        v0217 = v0152*v0032
+        v0218 = v0019*v0060
+        v0219 = 2*v0072
+        v0220 = v0195*(-v0106*v0069 - v0154 - v0215*v0008 - v0216*v0008 - v0217*v0035 - v0218*v0035 - v0219*v0035 - v0024*v0070 - v0066)
+        v0221 = 5*v0036
+        v0222 = v0052*(R_s*a*v0030 - v0199*v0009)
+        v0223 = v0036*v0008
+        v0224 = v0022*v0035
+        v0225 = v0033*v0035
+        v0226 = -v0016*v0035 + v0215 - v0035*v0079 + v0065
+        v0227 = v0224 + v0225 + v0226 - v0035*v0038 + v0035*v0080 + v0035*v0082 - v0035*v0084 + v0038*v0069 + v0069*v0079
+        v0228 = 1/v0227
+        v0229 = 5*R_s*v0017*v0035 + R_s*v0025*v0035*v0009 + 3*R_s*v0030*v0035*v0004*v0009 + 3*R_s*v0030*v0035*v0004 - v0209 - v0027*v0069 - v0035*v0090 - v0035*v0091 - v0035*v0092 - v0035*v0093 - v0069*v0074
+        v0230 = v0227**(-2)
+        v0231 = v0230*(a*v0030*v0075*v0008 - v0112*v0006*v0008 - v0202*v0008 - v0204)
+        v0232 = v0013*v0008
+        v0233 = v0016*v0008
+        v0234 = v0018*v0008
+        v0235 = v0079*v0008
+        v0236 = v0060*v0079
+        v0237 = v0101*v0036 + v0102*v0137*v0025*v0008 - v0103*v0223 - v0153 + 4*v0178*v0008 - v0217 - v0218 - v0219 + 4*v0223*v0032 - v0232 + v0233 - v0234 + v0235 + v0236 - 3*v0036*v0060*v0063 + 4*v0036*v0072 + v0068 - 5*v0008*v0083
+        v0238 = v0052*(-v0010*v0048 + 2*v0015 - v0159 - v0036*v0049 + v0046*v0089 + v0094)
+        v0239 = v0230*(-v0100*v0008 + v0106*v0036 + v0137*v0063*v0008 + v0153 + v0217 + v0218 + v0219 + v0223*v0024 + v0232 - v0233 + v0234 - v0235 - v0236 - v0068)
+
+        ##################################################
+
+        ######### Christoffel symbols derivatives ########
+        dGamma = numpy.zeros(xs.shape[:-1] + (4, 20))
+        dGamma[..., 1, 0] = v0012*v0040 + v0051*v0054
+        dGamma[..., 2, 0] = v0040*v0059 + v0054*v0073
+        dGamma[..., 1, 1] = v0086*(-v0056*v0074 - v0057 - v0078) + v0095*v0097
+        dGamma[..., 2, 1] = v0108*v0097 + v0086*(R_s*v0001*v0036*v0004 + R_s*v0025*v0036*x1 - v0100 + v0030*v0004*v0075*v0009 - v0038 - v0084)
+        dGamma[..., 1, 2] = v0122*v0051 + v0040*(-12*v0110 - v0113 - v0116)
+        dGamma[..., 2, 2] = v0122*v0073 + v0040*(-6*v0117*v0128 + v0125 - v0127 - v0130)
+        dGamma[..., 1, 3] = v0136*v0095 + v0086*(v0123*v0131 + v0129 + v0133)
+        dGamma[..., 2, 3] = v0108*v0136 + v0086*(3*v0114*v0134 - v0115*v0140 + 3*v0115*v0002 - v0134*v0137 + v0135*v0138 - v0138*v0002)
+        dGamma[..., 1, 4] = v0146*(v0012 - v0140 + v0147) + v0148*v0151
+        dGamma[..., 2, 4] = v0146*(v0059 + v0078) + v0151*v0155
+        dGamma[..., 1, 5] = v0146*(3*a*v0030*v0036*v0075 - v0109*v0003 - v0113 + v0116 - v0157) + v0148*v0158
+        dGamma[..., 2, 5] = v0146*(2*a*v0001*v0035*v0075*v0008 - v0125 - v0126*v0132 + v0127 - v0128*v0159 - v0130 - v0133) + v0155*v0158
+        dGamma[..., 1, 6] = v0163*(-v0010 - v0102 + 2*v0004) + v0169*(6*R_s*v0030 + 2*R_s*v0004*v0009 - v0165 - v0166*v0046 - v0042)
+        dGamma[..., 2, 6] = v0163*(4*v0035*v0004*v0008*x1 - v0005*v0067) + v0169*(-v0165*v0067 + v0025*v0064 + v0064*v0098)
+        dGamma[..., 1, 7] = v0172
+        dGamma[..., 2, 7] = v0174
+        dGamma[..., 1, 8] = v0173*(v0102 - v0139 - v0004) - v0175*v0176*x1
+        dGamma[..., 2, 8] = v0171*v0175*v0005*v0056
+        dGamma[..., 1, 9] = v0146*(4*R_s*v0001*v0137*v0004 + 16*R_s*v0001*v0036*v0004*v0009 + 2*R_s*v0137*v0025*x1 + 12*R_s*v0015*v0036 + 4*R_s*v0021*v0025*v0036*x1 + v0137*v0025*v0075*v0009 - v0137*v0028 - v0140*v0180 - v0144*v0036 - 14*v0177 - 10*v0178 - v0179 - 20*v0181 - 12*v0183) + v0148*v0186
+        dGamma[..., 2, 9] = v0146*(-R_s*v0101*v0069 + 4*R_s*v0013*v0035*v0008 + 4*R_s*v0152*v0025*v0030*v0035 + 8*R_s*v0017*v0035*v0004*v0060 + 2*R_s*v0187*v0020*v0008 + 2*R_s*v0187*v0025*v0030*v0008 + 4*R_s*v0025*v0030*v0069*v0008 + 8*v0001*v0025*v0060*v0069 + 8*v0001*v0025*v0069*v0008 - v0105*v0035*v0042 - 12*v0105*v0048*v0069 - v0117*v0189 + 8*v0015*v0004*v0069*v0008 - v0150*v0189 - v0152*v0025*v0035*v0089 - v0154*v0166 - v0184*v0064 - v0187*v0191*v0075*v0008 - v0188*v0060*v0062 - v0188*v0064 + 8*v0020*v0060*v0069*x1 + 4*v0025*v0060*v0069*v0075*x1) + v0155*v0186
+        dGamma[..., 1, 10] = -v0193*v0004*v0067 - v0194*v0196
+        dGamma[..., 2, 10] = R_s*v0193*v0036*v0004*x1 - v0193*v0197 - v0196*v0198
+        dGamma[..., 1, 11] = v0193*(v0199*v0070 + v0200*v0035 + v0201*v0056) + v0194*v0205
+        dGamma[..., 2, 11] = v0193*(R_s*a*v0001*v0009 + R_s*v0111*v0021*x1 - v0110 - v0138*v0006) + v0198*v0205
+        dGamma[..., 1, 12] = v0207*(3*R_s*v0030 + R_s*v0004*v0009 - v0168 - v0076 - v0089)
+        dGamma[..., 2, 12] = v0207*(v0160*v0056 + v0190*v0056 - v0056*v0007) - v0208*v0036*v0004 + v0208*v0046
+        dGamma[..., 1, 13] = v0173 - v0176*v0030
+        dGamma[..., 2, 13] = v0172
+        dGamma[..., 1, 14] = v0172
+        dGamma[..., 2, 14] = v0174
+        dGamma[..., 1, 15] = v0193*(-v0187*v0210 - v0209*v0008 - v0211*v0035 - v0212*v0035 - 2*v0213*v0069 - v0214*v0035 - v0050*v0070 - v0056*v0090) + v0194*v0220
+        dGamma[..., 2, 15] = v0193*(-v0013*v0009 + v0137*v0024 + v0137*v0038 - v0141*v0032 - v0142 + v0177 + v0178 + 6*v0181 + 6*v0183 - v0019*v0021 + v0022*v0221 + v0221*v0033 - v0029 - v0034 + v0035**6*v0063 - 6*v0036*v0044*v0006 - 6*v0036*v0084) + v0198*v0220
+        dGamma[..., 1, 16] = a*v0102*v0040 + v0222*v0051
+        dGamma[..., 2, 16] = 2*v0199*v0040*v0056 + v0222*v0073
+        dGamma[..., 1, 17] = v0228*(2*a*v0075*v0008*x1 - v0199*v0223 - v0200 - v0201*v0008) + v0229*v0231
+        dGamma[..., 2, 17] = v0228*(-a*v0135*v0035 + v0156*v0035*v0006 + v0202*v0035 + v0203*v0069) + v0231*v0237
+        dGamma[..., 1, 18] = v0238*v0051 + v0040*(-R_s*v0042 + 10*v0017 - 4*v0197 + 2*v0021*v0025 + 12*v0030*v0004*v0009 - v0036*v0007)
+        dGamma[..., 2, 18] = v0238*v0073 + v0040*(2*R_s*v0025*v0035*v0060 + 2*R_s*v0030*v0035*v0004*v0008 - v0105*v0062*x1 - v0043*v0056 - 2*v0055*v0070)
+        dGamma[..., 1, 19] = v0228*(-5*v0117*v0008 + v0137*v0210 + v0211 + v0212 + v0213*v0037 - v0213 + v0214 + v0223*v0050 - v0060*v0074 - v0074*v0008 - v0076*v0008*v0099 + v0008*v0087 + v0008*v0090) + v0229*v0239
+        dGamma[..., 2, 19] = v0228*(7*R_s*v0001*v0035*v0004*v0009 + 4*R_s*v0021*v0025*v0035*x1 + 3*R_s*v0025*v0035*v0009*x1 - v0143*v0035 - v0161*v0035*v0075 - v0216 - 5*v0224 - 5*v0225 - v0226 - v0024*v0069 - 6*v0026*v0030*v0035 - v0028*v0069 + v0030*v0004*v0069*v0075) + v0237*v0239
+
+        ##################################################
+
+        return dGamma
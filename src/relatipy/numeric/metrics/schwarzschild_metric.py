@@ -1,11 +1,19 @@
 import numpy
-import itertools
+from numpy import sin, cos, tan
 
 from .base import BaseMetric
 
 class Schwarzschild(BaseMetric):
+    christoffel_nonzero = (
+        (0, 0, 1),
+        (1, 0, 0), (1, 1, 1), (1, 2, 2), (1, 3, 3),
+        (2, 1, 2), (2, 3, 3),
+        (3, 1, 3), (3, 2, 3),
+    )
+
     def __init__(self, mass):
         super().__init__(mass, valid_coordinate="Spherical")
+        self.horizon_radius = self.R_s
 
     def _metric_dimensionless(self, xs):
         """
@@ -55,48 +63,88 @@ class Schwarzschild(BaseMetric):
         xs : array of shape (4,) or (N, 4)
             Coordinates [x0, x1, x2, x3].
         """
-        xs = numpy.asarray(xs, dtype=float)
+        return self._christoffel_from_components(self._get_christoffel_components(xs))
+
+    def _get_christoffel_components(self, xs):
+        """
+        Returns the nine independent non-zero Christoffel symbols of the
+        Schwarzschild metric, ordered as ``christoffel_nonzero``.
 
-        if xs.ndim == 2:
-            N = len(xs)
-            Gammas = numpy.zeros((N, 4, 4, 4))
-            for i, x in enumerate(xs):
-                Gammas[i] = self._get_christoffel_symbols(x)
-            return Gammas
+        Parameters
+        ----------
+        xs : array of shape (4,) or (N, 4)
+            Coordinates [x0, x1, x2, x3].
+        """
+        xs = numpy.asarray(xs, dtype=float)
 
-        # resto del código existente sin cambios ...
         r_s = self.R_s
-        r = xs[1]
-        theta = xs[2]
-        cos = numpy.cos
-        sin = numpy.sin
-        Gamma = numpy.array(
-            [
-                [
-                    [0, r_s / (2 * r * (r - r_s)), 0, 0],
-                    [r_s / (2 * r * (r - r_s)), 0, 0, 0],
-                    [0, 0, 0, 0],
-                    [0, 0, 0, 0],
-                ],
-                [
-                    [-r_s * (-r + r_s) / (2 * r**3), 0, 0, 0],
-                    [0, r_s * (-r + r_s) / (2 * r**3 * (1 - r_s / r) ** 2), 0, 0],
-                    [0, 0, -r + r_s, 0],
-                    [0, 0, 0, (-r + r_s) * sin(theta) ** 2],
-                ],
-                [
-                    [0, 0, 0, 0],
-                    [0, 0, 1 / r, 0],
-                    [0, 1 / r, 0, 0],
-                    [0, 0, 0, -sin(theta) * cos(theta)],
-                ],
-                [
-                    [0, 0, 0, 0],
-                    [0, 0, 0, 1 / r],
-                    [0, 0, 0, cos(theta) / sin(theta)],
-                    [0, 1 / r, cos(theta) / sin(theta), 0],
-                ],
-            ]
-        )
+        r = xs[..., 1]
+        theta = xs[..., 2]
+
+        sin_theta = numpy.sin(theta)
+        cos_theta = numpy.cos(theta)
+        inv_r = 1 / r
+        r_minus_r_s = r - r_s
+        r_s_over_2_r_Delta = r_s / (2 * r * r_minus_r_s)
+
+        Gamma = numpy.empty(xs.shape[:-1] + (9,))
+        Gamma[..., 0] = r_s_over_2_r_Delta                          # Gamma^0_{01}
+        Gamma[..., 1] = r_s * r_minus_r_s / (2 * r**3)              # Gamma^1_{00}
+        Gamma[..., 2] = -r_s_over_2_r_Delta                         # Gamma^1_{11}
+        Gamma[..., 3] = -r_minus_r_s                                # Gamma^1_{22}
+        Gamma[..., 4] = -r_minus_r_s * sin_theta**2                 # Gamma^1_{33}
+        Gamma[..., 5] = inv_r                                       # Gamma^2_{12}
+        Gamma[..., 6] = -sin_theta * cos_theta                      # Gamma^2_{33}
+        Gamma[..., 7] = inv_r                                       # Gamma^3_{13}
+        Gamma[..., 8] = cos_theta / sin_theta                       # Gamma^3_{23}
 
         return Gamma
+
+    # Generated by utils/symbolic_to_numeric.py
+    def _get_christoffel_derivatives(self, xs):
+        """
+        Returns the derivatives of the independent non-zero Christoffel symbols.
+
+        Parameters
+        ----------
+        xs : array of shape (4,) or (N, 4)
+            Coordinates [x0, x1, x2, x3].
+
+        Returns
+        -------
+        numpy.ndarray of shape (4, K) or (N, 4, K)
+            dGamma[..., lambda, k] is the derivative of the k-th component of
+            ``christoffel_indices`` with respect to x^lambda.
+        """
+        xs = numpy.asarray(xs, dtype=float)
+        x0, x1, x2, x3 = xs.T
+
+        ############### Auxiliary variables ##############
+        R_s = self.R_s
+
+        v0001 = 2*R_s
+        v0002 = x1**2
+        v0003 = R_s*(v0001 - 4*x1)/(-v0001*x1 + 2*v0002)**2
+        v0004 = sin(x2)
+        v0005 = v0004*cos(x2)
+        v0006 = -1/v0002
+        v0007 = tan(x2)**2
+
+        ##################################################
+
+        ######### Christoffel symbols derivatives ########
+        dGamma = numpy.zeros(xs.shape[:-1] + (4, 9))
+        dGamma[..., 1, 0] = v0003
+        dGamma[..., 1, 1] = R_s/(2*x1**3) - 3*(-R_s**2 + R_s*x1)/(2*x1**4)
+        dGamma[..., 1, 2] = -v0003
+        dGamma[..., 1, 3] = -1
+        dGamma[..., 1, 4] = -v0004**2
+        dGamma[..., 2, 4] = v0001*v0005 - 2*v0005*x1
+        dGamma[..., 1, 5] = v0006
+        dGamma[..., 2, 6] = -cos(2*x2)
+        dGamma[..., 1, 7] = v0006
+        dGamma[..., 2, 8] = (-v0007 - 1)/v0007
+
+        ##################################################
+
+        return dGamma
@@ -1,11 +1,31 @@
-from astropy import units as u
+import sys
+from functools import cached_property
+
+import numpy
+
 from ..constants import _c_SI, _G_SI
 
 
+def _is_quantity(value):
+    """
+    Checks whether value is an astropy Quantity without importing astropy:
+    no Quantity can exist before astropy.units is imported, so purely
+    numeric code never pays for loading it.
+    """
+    units = sys.modules.get("astropy.units")
+    return units is not None and isinstance(value, units.Quantity)
+
 
 class Validator:
     def __init__(self):
-        self.associated_units_validation = {
+        # Validation method of every unit seen so far
+        self._validations_by_unit = {}
+
+    @cached_property
+    def associated_units_validation(self):
+        from astropy import units as u
+
+        return {
             u.kg: self.validate_mass,
             u.s: self.validate_time,
             u.m: self.validate_length,
@@ -15,77 +35,123 @@ class Validator:
         }
 
     def validate_mass(self, mass):
-        if isinstance(mass, u.Quantity):
+        if _is_quantity(mass):
+            from astropy import units as u
+
             try:
-                return mass.to(u.kg).value * _G_SI / _c_SI**2
+                return mass.to_value(u.kg) * _G_SI / _c_SI**2
             except:
                 raise ValueError(f"Invalid mass units: {mass.unit}")
 
-        if mass < 0:
+        if numpy.any(numpy.asarray(mass) < 0):
             raise ValueError("Mass must be positive")
         return mass
 
     def validate_length(self, length):
-        if isinstance(length, u.Quantity):
+        if _is_quantity(length):
+            from astropy import units as u
+
             try:
-                return length.to(u.m).value
+                return length.to_value(u.m)
             except:
                 raise ValueError(f"Invalid length units: {length.unit}")
         return length
 
     def validate_time(self, time):
-        if isinstance(time, u.Quantity):
+        if _is_quantity(time):
+            from astropy import units as u
+
             try:
-                return time.to(u.s).value / _c_SI
+                return time.to_value(u.s) / _c_SI
             except:
                 raise ValueError(f"Invalid time units: {time.unit}")
         return time
 
     def validate_angle(self, angle):
-        if isinstance(angle, u.Quantity):
+        if _is_quantity(angle):
+            from astropy import units as u
+
             try:
-                return angle.to(u.rad).value
+                return angle.to_value(u.rad)
             except:
                 raise ValueError(f"Invalid angle units: {angle.unit}")
         return angle
 
     def validate_velocity(self, velocity):
-        if isinstance(velocity, u.Quantity):
+        if _is_quantity(velocity):
+            from astropy import units as u
+
             try:
-                return velocity.to(u.m / u.s).value / _c_SI
+                return velocity.to_value(u.m / u.s) / _c_SI
             except:
                 raise ValueError(f"Invalid velocity units: {velocity.unit}")
 
-        if velocity > 1:
+        if numpy.any(numpy.asarray(velocity) > 1):
             raise ValueError("Velocity must be less than the speed of light")
         return velocity
 
     def validate_angular_velocity(self, angular_velocity):
-        if isinstance(angular_velocity, u.Quantity):
+        if _is_quantity(angular_velocity):
+            from astropy import units as u
+
             try:
-                return angular_velocity.to(u.rad / u.s).value / _c_SI
+                return angular_velocity.to_value(u.rad / u.s) / _c_SI
             except:
                 raise ValueError(f"Invalid angular velocity units: {angular_velocity.unit}")
         return angular_velocity
 
     def validate_scalar(self, scalar):
-        if isinstance(scalar, u.Quantity):
-            try:
-                return self.associated_units_validation[scalar.unit](scalar)
-            except:
-                raise ValueError(f"Invalid scalar units: {scalar.unit}")
-        
+        """
+        Converts a quantity to geometric units according to its physical type.
+
+        Parameters
+        ----------
+        scalar : float, array or Quantity
+            A Quantity may hold a whole array: it is checked and converted in
+            one step. Anything else is assumed to be in geometric units.
+        """
+        if _is_quantity(scalar):
+            return self._get_validation(scalar.unit)(scalar)
 
         return scalar
 
     def validate_vector(self, vector):
-        vector_si = [x.si if isinstance(x, u.Quantity) else x for x in vector]
-
-        new_vector = []
-        
-        for i in vector_si:
-            new_vector.append(self.validate_scalar(i))
-
-        return new_vector
+        """
+        Converts the components of a vector to geometric units.
+
+        Parameters
+        ----------
+        vector : list, array or Quantity
+            A list of components, each of them a scalar, an array or a
+            Quantity, or a single Quantity array sharing one unit. Plain
+            numeric arrays are already in geometric units and are returned as
+            they are.
+        """
+        if vector is None:
+            return None
+
+        if _is_quantity(vector):
+            return self.validate_scalar(vector)
+
+        if isinstance(vector, numpy.ndarray) and vector.dtype.kind in "fiu":
+            return vector
+
+        return [self.validate_scalar(x) for x in vector]
+
+    def _get_validation(self, unit):
+        """
+        Returns the validation method of the quantities with the given unit.
+        The search among the physical types is done once per unit.
+        """
+        validation = self._validations_by_unit.get(unit)
+        if validation is None:
+            for target, validation in self.associated_units_validation.items():
+                if unit.is_equivalent(target):
+                    break
+            else:
+                raise ValueError(f"Invalid scalar units: {unit}")
+            self._validations_by_unit[unit] = validation
+
+        return validation
 
 validator = Validator()
\ No newline at end of file
@@ -1,7 +1,22 @@
-from . import metrics
-from . import coordinates
+import importlib
+
+# Imported on first access (PEP 562): they all load sympy
+_submodules = ("metrics", "coordinates", "codegen", "cache", "simplification")
 
 __all__ = [
     "metrics",
     "coordinates",
-]
\ No newline at end of file
+    "codegen",
+    "cache",
+    "simplification",
+]
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_submodules))
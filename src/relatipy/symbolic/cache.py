@@ -0,0 +1,167 @@
+"""
+Content-addressed on-disk cache of symbolic results.
+
+Simplifying the Christoffel symbols of a metric takes minutes, so the results
+are pickled under a key that hashes everything they depend on (the metric
+components, the coordinates, the kind of result, the sympy version and the
+cache format), and later runs load them in milliseconds. A different metric
+gets a different key, so entries never go stale: they are only removed by
+``invalidate``, ``clear`` or the size cap, which evicts the least recently
+used entries first.
+
+The entries are stored in ``symbolic`` under the relatipy cache root,
+``get_cache_dir()``: ``$RELATIPY_CACHE_DIR``, or ``relatipy`` under
+``$XDG_CACHE_HOME`` (``~/.cache`` by default). The generated kernel modules
+sit next to them in ``kernels/<relatipy version>``, see ``relatipy._cache``.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+
+import sympy as sp
+
+from .._cache import get_cache_dir
+
+__all__ = [
+    "SymbolicCache",
+    "cache",
+    "get_cache_dir",
+]
+
+# Bumped whenever the layout of the cached values changes
+CACHE_FORMAT = 1
+
+
+class SymbolicCache:
+    """
+    Pickled sympy results stored on disk by content hash.
+
+    Parameters
+    ----------
+    directory : str, optional
+        Directory of the entries, ``symbolic`` under ``get_cache_dir()`` by
+        default.
+    max_size : int
+        Maximum total size of the entries in bytes.
+    """
+
+    suffix = ".pkl"
+
+    def __init__(self, directory=None, max_size=256 * 1024**2):
+        self._directory = directory
+        self.max_size = max_size
+
+    @property
+    def directory(self):
+        # Resolved on every access so that RELATIPY_CACHE_DIR can change
+        return self._directory or os.path.join(get_cache_dir(), "symbolic")
+
+    @staticmethod
+    def key(kind, *objects):
+        """
+        Returns the key of a result.
+
+        Parameters
+        ----------
+        kind : str
+            Name of the result, e.g. "christoffel_symbols".
+        *objects : sympy objects or nested lists of them
+            Everything the result depends on, e.g. the metric components and
+            the coordinates.
+        """
+        digest = hashlib.sha256(f"{CACHE_FORMAT}:{sp.__version__}:{kind}".encode())
+        for obj in objects:
+            digest.update(b"\0" + sp.srepr(obj).encode())
+        return digest.hexdigest()
+
+    def get(self, key, default=None):
+        """
+        Returns the entry ``key``, or ``default`` if it is missing or can not
+        be read (in which case the entry is removed).
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                value = pickle.load(file)
+        except FileNotFoundError:
+            return default
+        except Exception:
+            self.invalidate(key)
+            return default
+
+        # The modification time orders the entries for eviction
+        os.utime(path)
+        return value
+
+    def set(self, key, value):
+        """
+        Stores ``value`` under ``key`` and evicts old entries above
+        ``max_size``.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+
+        # Written aside and renamed, so readers never see half an entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        self._evict(keep=key)
+
+    def invalidate(self, key):
+        """
+        Removes the entry ``key`` if it exists.
+        """
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        """
+        Removes every entry.
+        """
+        for entry in self._entries():
+            self.invalidate(entry.name[: -len(self.suffix)])
+
+    def size(self):
+        """
+        Returns the total size of the entries in bytes.
+        """
+        return sum(entry.stat().st_size for entry in self._entries())
+
+    def _evict(self, keep):
+        entries = sorted(self._entries(), key=lambda entry: entry.stat().st_mtime)
+        total = sum(entry.stat().st_size for entry in entries)
+        for entry in entries:
+            if total <= self.max_size:
+                break
+            if entry.name == keep + self.suffix:
+                continue
+            total -= entry.stat().st_size
+            os.unlink(entry.path)
+
+    def _entries(self):
+        try:
+            return [entry for entry in os.scandir(self.directory) if entry.name.endswith(self.suffix)]
+        except FileNotFoundError:
+            return []
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + self.suffix)
+
+    # Magic methods
+    def __contains__(self, key):
+        return os.path.exists(self._path(key))
+
+    def __repr__(self):
+        return f"SymbolicCache({self.directory!r}, max_size={self.max_size})"
+
+
+cache = SymbolicCache()
@@ -0,0 +1,408 @@
+"""
+Compiler of symbolic metrics into vectorized NumPy kernels.
+
+``generate_kernel_source`` takes a symbolic metric and writes the source of a
+Python module with the functions
+
+    metric(xs, *parameters)                  -> (..., 4, 4)
+    inverse_metric(xs, *parameters)          -> (..., 4, 4)
+    christoffel_components(xs, *parameters)  -> (..., K)
+    christoffel_derivatives(xs, *parameters) -> (..., 4, K)
+    christoffel_symbols(xs, *parameters)     -> (..., 4, 4, 4)
+
+where xs has shape (4,) or (N, 4) and ``parameters`` are the free symbols of
+the metric other than the coordinates (e.g. R_s and a for Kerr), in the order
+of ``PARAMETERS``. Only the upper triangles of the symmetric tensors and the
+independent non-zero Christoffel components (mu <= nu, listed in
+``CHRISTOFFEL_NONZERO``) are evaluated, and the common subexpressions of every
+kernel are computed once with ``sympy.cse``.
+
+``compile_kernels`` returns that source as a module. Modules are stored in
+the kernel cache of ``relatipy._cache`` under ``get_kernel_key``, so later
+runs import them without running sympy.
+"""
+
+import hashlib
+import random
+import re
+import types
+from itertools import product
+
+import sympy as sp
+from sympy.printing.numpy import NumPyPrinter
+
+from .._cache import load_kernels, store_kernels
+
+__all__ = [
+    "compile_kernels",
+    "generate_kernel_source",
+    "get_christoffel_components",
+    "get_inverse_metric",
+    "get_kernel_key",
+    "get_metric",
+]
+
+# Bumped whenever the generated source changes
+KERNEL_FORMAT = 3
+
+
+def get_metric(metric, coordinates=None):
+    """
+    Returns the components and the coordinates of a symbolic metric.
+
+    Parameters
+    ----------
+    metric : symbolic metric, einsteinpy MetricTensor or sympy Matrix
+        Objects with a ``metric()`` method (``relatipy.symbolic.metrics``),
+        objects with ``tensor()`` and ``syms`` (einsteinpy) or any 4x4 matrix.
+    coordinates : list of sympy.Symbol, optional
+        Coordinates [x0, x1, x2, x3], required for plain matrices.
+
+    Returns
+    -------
+    tuple
+        (g, coordinates) with g a 4x4 ``sympy.Matrix``.
+    """
+    if callable(getattr(metric, "metric", None)):
+        metric = metric.metric()
+
+    if hasattr(metric, "tensor") and hasattr(metric, "syms"):
+        coordinates = coordinates or list(metric.syms)
+        metric = metric.tensor().tolist()
+
+    if coordinates is None:
+        raise ValueError("The coordinates of the metric must be given.")
+
+    g = sp.Matrix(metric)
+    if g.shape != (4, 4) or len(coordinates) != 4:
+        raise ValueError(f"Expected a 4x4 metric in 4 coordinates, got shape {g.shape} and {len(coordinates)} coordinates.")
+
+    return g, list(coordinates)
+
+
+def get_inverse_metric(g):
+    """
+    Returns the inverse of a symbolic metric.
+
+    The metric is split in the blocks of coordinates coupled by off-diagonal
+    components (e.g. {t, phi}, {r} and {theta} for Kerr) and every block is
+    inverted on its own.
+
+    Parameters
+    ----------
+    g : sympy.Matrix of shape (4, 4)
+
+    Returns
+    -------
+    sympy.Matrix of shape (4, 4)
+    """
+    g_inv = sp.zeros(4, 4)
+    for block in _get_blocks(g):
+        g_block = g.extract(block, block)
+        g_block_inv = g_block.inv(method="ADJ") if len(block) > 1 else sp.Matrix([[1 / g_block[0, 0]]])
+        for (i, mu), (j, nu) in product(enumerate(block), repeat=2):
+            g_inv[mu, nu] = sp.cancel(sp.together(g_block_inv[i, j]))
+
+    return g_inv
+
+
+def get_christoffel_components(g, coordinates, g_inv=None):
+    """
+    Returns the independent non-zero Christoffel symbols of a symbolic metric,
+
+        Gamma^sigma_{mu nu} = 1/2 g^{sigma lambda} (d_mu g_{lambda nu} + d_nu g_{lambda mu} - d_lambda g_{mu nu}),
+
+    for mu <= nu only, since the other half follows by symmetry.
+
+    Parameters
+    ----------
+    g : sympy.Matrix of shape (4, 4)
+    coordinates : list of sympy.Symbol
+    g_inv : sympy.Matrix of shape (4, 4), optional
+        Inverse metric, computed when not given.
+
+    Returns
+    -------
+    dict
+        {(sigma, mu, nu): expression} for the non-zero components, ordered
+        by (sigma, mu, nu).
+    """
+    g_inv = get_inverse_metric(g) if g_inv is None else g_inv
+    dg = [[[sp.diff(g[mu, nu], x) for x in coordinates] for nu in range(4)] for mu in range(4)]
+
+    components = {}
+    for sigma, mu, nu in product(range(4), repeat=3):
+        if mu > nu:
+            continue
+
+        expr = sum(
+            g_inv[sigma, lambda_] * (dg[lambda_][nu][mu] + dg[lambda_][mu][nu] - dg[mu][nu][lambda_])
+            for lambda_ in range(4)
+            if g_inv[sigma, lambda_] != 0
+        ) / 2
+        expr = sp.cancel(sp.together(expr))
+
+        if not _is_zero(expr):
+            components[(sigma, mu, nu)] = expr
+
+    return components
+
+
+def generate_kernel_source(metric, coordinates=None, name=None):
+    """
+    Returns the source code of a module with the NumPy kernels of a metric.
+
+    Parameters
+    ----------
+    metric : symbolic metric, einsteinpy MetricTensor or sympy Matrix
+        See ``get_metric``.
+    coordinates : list of sympy.Symbol, optional
+        Coordinates [x0, x1, x2, x3], required for plain matrices.
+    name : str, optional
+        Name of the metric, written in the header of the module.
+
+    Returns
+    -------
+    str
+    """
+    g, coordinates = get_metric(metric, coordinates)
+    g_inv = get_inverse_metric(g)
+    christoffels = get_christoffel_components(g, coordinates, g_inv)
+
+    # Coordinates become x0..x3 and parameters valid Python names
+    xs = sp.symbols("x0:4")
+    free_symbols = set().union(*(g[mu, nu].free_symbols for mu, nu in product(range(4), repeat=2)))
+    parameters = sorted(free_symbols - set(coordinates), key=str)
+    renames = dict(zip(coordinates, xs))
+    renames.update({p: sp.Symbol(_python_name(str(p))) for p in parameters})
+
+    def rename(expressions):
+        return [sp.sympify(expr).xreplace(renames) for expr in expressions]
+
+    upper = [(mu, nu) for mu, nu in product(range(4), repeat=2) if mu <= nu]
+    parameter_names = [str(renames[p]) for p in parameters]
+    signature = ", ".join(["xs"] + parameter_names)
+    nonzero = tuple(christoffels)
+
+    description = f"the {name} metric" if name else "a metric"
+    header = f'''"""
+NumPy kernels of {description}.
+
+Generated by relatipy.symbolic.codegen, do not edit.
+"""
+
+import numpy
+
+COORDINATES = {tuple(str(x) for x in coordinates)!r}
+PARAMETERS = {tuple(parameter_names)!r}
+CHRISTOFFEL_NONZERO = {nonzero!r}
+'''
+
+    metric_source = _generate_tensor_kernel(
+        "metric", signature, "Returns the metric components g_{mu nu}, of shape (..., 4, 4).",
+        upper, rename([g[mu, nu] for mu, nu in upper]), (4, 4), symmetric=True,
+    )
+    inverse_source = _generate_tensor_kernel(
+        "inverse_metric", signature, "Returns the inverse metric components g^{mu nu}, of shape (..., 4, 4).",
+        upper, rename([g_inv[mu, nu] for mu, nu in upper]), (4, 4), symmetric=True,
+    )
+    components_source = _generate_tensor_kernel(
+        "christoffel_components", signature,
+        "Returns the independent non-zero Christoffel symbols, of shape (..., K),\n    ordered as CHRISTOFFEL_NONZERO.",
+        [(k,) for k in range(len(nonzero))], rename(christoffels.values()), (len(nonzero),), symmetric=False,
+    )
+
+    derivatives = [(lambda_, k) for lambda_, k in product(range(4), range(len(nonzero)))]
+    christoffel_list = list(christoffels.values())
+    derivatives_source = _generate_tensor_kernel(
+        "christoffel_derivatives", signature,
+        "Returns the derivatives of the independent non-zero Christoffel symbols,\n"
+        "    of shape (..., 4, K): element [..., lambda, k] is the derivative of the\n"
+        "    k-th component of CHRISTOFFEL_NONZERO with respect to x^lambda.",
+        derivatives, rename([sp.diff(christoffel_list[k], coordinates[lambda_]) for lambda_, k in derivatives]),
+        (4, len(nonzero)), symmetric=False,
+    )
+
+    symbols_source = f'''
+def christoffel_symbols({signature}):
+    """
+    Returns the Christoffel symbols Gamma^sigma_{{mu nu}}, of shape (..., 4, 4, 4).
+    """
+    components = christoffel_components({signature})
+    Gamma = numpy.zeros(components.shape[:-1] + (4, 4, 4))
+    if components.shape[-1]:
+        sigmas, mus, nus = numpy.array(CHRISTOFFEL_NONZERO).T
+        Gamma[..., sigmas, mus, nus] = components
+        Gamma[..., sigmas, nus, mus] = components
+    return Gamma
+'''
+
+    return "\n".join([header, metric_source, inverse_source, components_source, derivatives_source, symbols_source])
+
+
+def get_kernel_key(metric, coordinates=None):
+    """
+    Returns the key of the kernels of a metric in the kernel cache, a hash
+    of its components, its coordinates and the sympy version, since the
+    generated code depends on the printer and on ``sympy.cse``.
+
+    Parameters
+    ----------
+    metric : symbolic metric, einsteinpy MetricTensor or sympy Matrix
+        See ``get_metric``.
+    coordinates : list of sympy.Symbol, optional
+        Coordinates [x0, x1, x2, x3], required for plain matrices.
+
+    Returns
+    -------
+    str
+    """
+    g, coordinates = get_metric(metric, coordinates)
+    digest = hashlib.sha256(f"{KERNEL_FORMAT}:{sp.__version__}:{sp.srepr(g)}:{sp.srepr(coordinates)}".encode())
+    return digest.hexdigest()
+
+
+def compile_kernels(metric, coordinates=None, name="metric", cache=True):
+    """
+    Generates the NumPy kernels of a metric and returns them as a module.
+
+    Parameters
+    ----------
+    metric : symbolic metric, einsteinpy MetricTensor or sympy Matrix
+        See ``get_metric``.
+    coordinates : list of sympy.Symbol, optional
+        Coordinates [x0, x1, x2, x3], required for plain matrices.
+    name : str
+        Name of the metric, used in the header and the name of uncached
+        modules. Cached modules are shared by every name of the same metric,
+        so their source does not carry it.
+    cache : bool
+        If True, the module is imported from the kernel cache when it is
+        there and stored in it otherwise.
+
+    Returns
+    -------
+    module
+        Module with ``metric``, ``inverse_metric``, ``christoffel_components``,
+        ``christoffel_derivatives``, ``christoffel_symbols`` and the constants ``PARAMETERS`` and
+        ``CHRISTOFFEL_NONZERO``. Cached modules also have ``KERNEL_KEY``, the
+        argument of ``relatipy.numeric.kernels.load_kernels``.
+    """
+    g, coordinates = get_metric(metric, coordinates)
+
+    if not cache:
+        source = generate_kernel_source(g, coordinates, name)
+        return _load_source(source, f"relatipy_kernels_{_python_name(name)}")
+
+    key = get_kernel_key(g, coordinates)
+    module = load_kernels(key)
+    if module is None:
+        module = store_kernels(key, generate_kernel_source(g, coordinates))
+
+    return module
+
+
+def _load_source(source, module_name):
+    module = types.ModuleType(module_name)
+    exec(compile(source, f"<{module_name}>", "exec"), module.__dict__)
+    return module
+
+
+def _generate_tensor_kernel(function_name, signature, description, indices, expressions, shape, symmetric):
+    """
+    Returns the source of a kernel that evaluates ``expressions`` with their
+    common subexpressions eliminated and stores them at ``indices`` of an
+    array of shape (..., *shape). Symmetric kernels also fill the transposed
+    indices.
+    """
+    printer = _KernelPrinter({"fully_qualified_modules": True})
+
+    nonzero = [(index, expr) for index, expr in zip(indices, expressions) if expr != 0]
+    used = set().union(*(expr.free_symbols for _, expr in nonzero)) if nonzero else set()
+    replacements, reduced = sp.cse(
+        [expr for _, expr in nonzero], symbols=sp.numbered_symbols("v", exclude=used), order="none"
+    )
+
+    lines = [
+        f"def {function_name}({signature}):",
+        '    """',
+        f"    {description}",
+        '    """',
+        "    xs = numpy.asarray(xs, dtype=float)",
+        "    x0, x1, x2, x3 = numpy.moveaxis(xs, -1, 0)",
+        "",
+    ]
+    lines += [f"    {symbol} = {printer.doprint(expr)}" for symbol, expr in replacements]
+    if replacements:
+        lines.append("")
+
+    lines.append(f"    out = numpy.zeros(xs.shape[:-1] + {shape!r})")
+    for (index, _), expr in zip(nonzero, reduced):
+        target = f"out[..., {', '.join(map(str, index))}]"
+        if symmetric and index[0] != index[-1]:
+            target += f" = out[..., {', '.join(map(str, reversed(index)))}]"
+        lines.append(f"    {target} = {printer.doprint(expr)}")
+    lines.append("    return out")
+    lines.append("")
+
+    return "\n" + "\n".join(lines)
+
+
+class _KernelPrinter(NumPyPrinter):
+    """
+    NumPy printer that writes reciprocals as divisions, since x**(-1.0) takes
+    the slow float power of NumPy.
+    """
+
+    def _print_Pow(self, expr, rational=False):
+        if expr.exp.is_Integer and expr.exp.is_negative:
+            denominator = expr.base if expr.exp == -1 else sp.Pow(expr.base, -expr.exp, evaluate=False)
+            if expr.exp == -1 and not expr.base.is_Atom:
+                return f"1/({self._print(denominator)})"
+            return f"1/{self._print(denominator)}"
+        return super()._print_Pow(expr, rational=rational)
+
+
+def _get_blocks(g):
+    """
+    Groups the coordinates coupled by non-zero off-diagonal components.
+    """
+    blocks, seen = [], set()
+    for start in range(4):
+        if start in seen:
+            continue
+        block, stack = {start}, [start]
+        while stack:
+            mu = stack.pop()
+            for nu in range(4):
+                if nu not in block and (g[mu, nu] != 0 or g[nu, mu] != 0):
+                    block.add(nu)
+                    stack.append(nu)
+        seen |= block
+        blocks.append(sorted(block))
+
+    return blocks
+
+
+def _is_zero(expr, samples=3):
+    """
+    Whether a canceled expression vanishes identically. Expressions that only
+    vanish after trigonometric identities are spotted numerically and then
+    confirmed with ``sympy.simplify``.
+    """
+    if expr == 0:
+        return True
+
+    rng = random.Random(0)
+    for _ in range(samples):
+        values = {symbol: rng.uniform(0.1, 1.0) for symbol in expr.free_symbols}
+        value = complex(expr.evalf(subs=values))
+        if abs(value) > 1e-12:
+            return False
+
+    return sp.simplify(expr) == 0
+
+
+def _python_name(name):
+    name = re.sub(r"\W", "_", name)
+    return "_" + name if name[0].isdigit() else name
@@ -1,16 +1,30 @@
 import sympy as sp
 import numpy as np
-import einsteinpy.symbolic as es
-from itertools import product
 
-simplify = lambda expr: expr.expand().simplify()
+from ..cache import cache as default_cache
+from ..simplification import simplify_christoffel_symbols
 
 # coordinates
 x0, x1, x2, x3 = sp.symbols("x^0 x^1 x^2 x^3")
 xs = [x0, x1, x2, x3]
 
 class Kerr:
-    def __init__(self):
+    """
+    Symbolic Kerr metric in Boyer-Lindquist coordinates.
+
+    Parameters
+    ----------
+    cache : SymbolicCache, optional
+        On-disk cache of the simplified Christoffel symbols, None to always
+        compute them.
+    processes : int, optional
+        Number of processes that simplify the Christoffel symbols, all the
+        CPUs by default.
+    """
+
+    def __init__(self, cache=default_cache, processes=None):
+        self.cache = cache
+        self.processes = processes
         self.metic_has_been_computed = False
         self.christoffel_has_been_computed = False
         self._metric = None
@@ -44,7 +58,7 @@ class Kerr:
 
         # Metric
         Sigma = xs[1]**2 * (1 + a**2/xs[1]**2 * sp.cos(xs[2])**2)
-        Delta = xs[1]**2 * (1 - (R_s*xs[1] + a**2)/xs[1]**2)
+        Delta = xs[1]**2 * (1 - (R_s*xs[1] - a**2)/xs[1]**2)
 
         A = 1 - R_s*xs[1]/Sigma
         B = - Sigma/Delta
@@ -56,18 +70,27 @@ class Kerr:
         metric[0, 3] = metric[3, 0] = E/2
         metric_ = sp.Matrix(metric)
 
+        import einsteinpy.symbolic as es
+
         g = es.MetricTensor(metric, xs)
         
         return g
     
     def _compute_christoffel_symbols(self):
+        import einsteinpy.symbolic as es
+
+        if self.cache is not None:
+            key = self.cache.key("christoffel_symbols", self.metric().tensor().tolist(), xs)
+            christoffel = self.cache.get(key)
+            if christoffel is not None:
+                return es.ChristoffelSymbols(christoffel, xs)
+
         ch = es.ChristoffelSymbols.from_metric(self.metric())
 
-        christoffel = np.zeros((4, 4, 4), dtype=object)
+        christoffel = simplify_christoffel_symbols(ch.tensor().tolist(), self.processes)
 
-        for mu, nu, sigma in product(range(4), repeat=3):
-            expr = simplify(ch.tensor()[mu, nu, sigma])#.subs(subs).subs(second_subs)
-            christoffel[mu, nu, sigma] = expr
+        if self.cache is not None:
+            self.cache.set(key, christoffel.tolist())
 
         christoffel = es.ChristoffelSymbols(christoffel, xs)
 
@@ -0,0 +1,85 @@
+"""
+Simplification of symbolic tensors.
+
+Gamma^sigma_{mu nu} is symmetric in its lower indices, so only the 40
+components with mu <= nu are simplified, the other 24 are copied from them.
+The independent components are spread over a process pool, the largest
+first so that no worker is left alone with a long one at the end.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+
+import numpy
+import sympy as sp
+
+__all__ = [
+    "simplify",
+    "simplify_christoffel_symbols",
+    "simplify_expressions",
+]
+
+
+def simplify(expr):
+    return sp.sympify(expr).expand().simplify()
+
+
+def simplify_expressions(expressions, processes=None):
+    """
+    Simplifies a list of expressions in parallel.
+
+    Parameters
+    ----------
+    expressions : list of sympy expressions
+    processes : int, optional
+        Number of worker processes, ``os.cpu_count()`` by default. With one
+        process (or one expression) they are simplified in this process.
+
+    Returns
+    -------
+    list of sympy expressions
+        Simplified expressions, in the input order.
+    """
+    expressions = [sp.sympify(expr) for expr in expressions]
+    processes = processes or os.cpu_count() or 1
+    pending = [i for i, expr in enumerate(expressions) if expr != 0]
+
+    if processes == 1 or len(pending) <= 1:
+        return [simplify(expr) if expr != 0 else expr for expr in expressions]
+
+    pending.sort(key=lambda i: sp.count_ops(expressions[i]), reverse=True)
+    simplified = list(expressions)
+    with ProcessPoolExecutor(max_workers=min(processes, len(pending))) as executor:
+        futures = [(i, executor.submit(simplify, expressions[i])) for i in pending]
+        for i, future in futures:
+            simplified[i] = future.result()
+
+    return simplified
+
+
+def simplify_christoffel_symbols(christoffel, processes=None):
+    """
+    Simplifies the Christoffel symbols Gamma^sigma_{mu nu} of a metric.
+
+    Parameters
+    ----------
+    christoffel : array-like of shape (4, 4, 4)
+        Components indexed as [sigma, mu, nu].
+    processes : int, optional
+        Number of worker processes, see ``simplify_expressions``.
+
+    Returns
+    -------
+    numpy.ndarray of shape (4, 4, 4) and dtype object
+    """
+    christoffel = numpy.asarray(christoffel, dtype=object)
+    independent = [(sigma, mu, nu) for sigma, mu, nu in product(range(4), repeat=3) if mu <= nu]
+
+    simplified = simplify_expressions([christoffel[index] for index in independent], processes)
+
+    result = numpy.zeros((4, 4, 4), dtype=object)
+    for (sigma, mu, nu), expr in zip(independent, simplified):
+        result[sigma, mu, nu] = result[sigma, nu, mu] = expr
+
+    return result
@@ -0,0 +1,73 @@
+# test_camera.py
+
+import numpy as np
+import pytest
+from relatipy.numeric.metrics import Kerr
+from relatipy.numeric.camera import Camera, CAPTURED, DISK, ESCAPED
+from relatipy.numeric.geodesic import DiskEvent
+
+fov = 2 * np.arctan(10 / 1000)
+
+
+class TestCamera:
+    def test_image_plane(self):
+        camera = Camera(Kerr(1.0, 0.5), np.pi / 3, 1000.0, fov, (8, 4))
+        alphas, betas = camera.get_image_plane()
+
+        assert alphas.shape == betas.shape == (4, 8)
+        assert np.allclose(alphas[0, [0, -1]], [-8.75, 8.75])
+        assert np.allclose(betas[[0, -1], 0], [3.75, -3.75])
+
+    def test_initial_conditions_follow_bardeen(self):
+        kerr = Kerr(1.0, 0.7)
+        camera = Camera(kerr, 1.1, 1000.0, fov, 4)
+        alphas, betas = (values.ravel() for values in camera.get_image_plane())
+
+        xs, ks = camera.get_initial_conditions(alphas, betas)
+        g = np.moveaxis(kerr.metric(xs.T), -1, 0)
+        ps = np.einsum("nij,nj->ni", g, ks)
+
+        assert np.allclose(xs[:, 1:3], [1000.0, 1.1])
+        assert np.allclose(np.einsum("ni,ni->n", ps, ks), 0, atol=1e-12)
+        assert np.allclose(ps[:, 3], alphas * np.sin(1.1))
+        assert (ks[:, 1] < 0).all()
+
+    def test_schwarzschild_shadow_radius(self):
+        camera = Camera(Kerr(1.0, 0.0), np.pi / 2 - 0.1, 1000.0, fov, 30)
+        image = camera.render()
+        radii = np.hypot(image.alphas, image.betas)
+        pixel = image.alphas[0, 1] - image.alphas[0, 0]
+
+        assert set(np.unique(image.status)) == {ESCAPED, CAPTURED}
+        assert radii[image.shadow].max() == pytest.approx(3 * np.sqrt(3), abs=pixel)
+        assert radii[~image.shadow].min() == pytest.approx(3 * np.sqrt(3), abs=pixel)
+
+    def test_disk_hits(self):
+        camera = Camera(Kerr(1.0, 0.9), 1.3, 1000.0, fov, 20, disk=DiskEvent(3.0, 8.0))
+        image = camera.render()
+        hits = image.status == DISK
+
+        assert hits.any() and image.shadow.any()
+        assert ((image.disk_radius[hits] >= 3.0) & (image.disk_radius[hits] <= 8.0)).all()
+        assert np.isnan(image.disk_radius[~hits]).all()
+
+    def test_inclination_out_of_range(self):
+        with pytest.raises(ValueError):
+            Camera(Kerr(1.0, 0.5), 0.0, 1000.0, fov, 4)
+
+    def test_naked_singularity_rejected(self):
+        with pytest.raises(ValueError, match="event horizon"):
+            Camera(Kerr(1.0, 1.2), 1.3, 1000.0, fov, 4)
+
+    def test_pole_rays(self, monkeypatch):
+        # With an odd resolution the central column has alpha = 0, its rays cross a pole
+        camera = Camera(Kerr(1.0, 0.0), 1.3, 1000.0, fov, 21, disk=DiskEvent(3.0, 8.0))
+        alphas, betas = camera.get_image_plane()
+        assert np.allclose(alphas[:, 10], 0)
+
+        statuses = []
+        for offset in (0.0, 1e-4, -1e-4):
+            monkeypatch.setattr(camera, "get_image_plane", lambda: (alphas[:, 10:11] + offset, betas[:, 10:11]))
+            statuses.append(camera.render().status)
+
+        assert (statuses[0] == statuses[1]).all() and (statuses[0] == statuses[2]).all()
@@ -0,0 +1,70 @@
+# test_conversions.py
+
+import numpy as np
+import pytest
+from relatipy.numeric.coordinates import BoyerLindquist, Spherical, coordinate_systems, get_conversion_path
+from relatipy.numeric.coordinates.conversions import convert
+
+a = 0.5
+rng = np.random.default_rng(1)
+N = 20
+
+xs_spherical = np.array(
+    [rng.uniform(0, 10, N), rng.uniform(2, 20, N), rng.uniform(0.05, np.pi - 0.05, N), rng.uniform(-3, 3, N)]
+)
+vs_spherical = rng.uniform(-0.1, 0.1, (3, N))
+
+
+def _kwargs(system_name):
+    return {"a": a} if system_name == "BoyerLindquist" else {}
+
+
+def _through_cartesian(xs, vs, source, target):
+    xs_p, vs_p = coordinate_systems[source]._convert_to_cartesian(xs, vs, **_kwargs(source))
+    return coordinate_systems[target]._convert_from_cartesian(xs_p, vs_p, **_kwargs(target))
+
+
+class TestConversions:
+    def test_shortest_paths(self):
+        assert get_conversion_path("Spherical", "BoyerLindquist") == ("Spherical", "BoyerLindquist")
+        assert get_conversion_path("Cylindrical", "BoyerLindquist") == ("Cylindrical", "BoyerLindquist")
+        assert get_conversion_path("Cartesian", "Cylindrical") == ("Cartesian", "Cylindrical")
+        assert get_conversion_path("Spherical", "Spherical") == ("Spherical",)
+
+    @pytest.mark.parametrize(
+        "source, target",
+        [
+            ("Spherical", "BoyerLindquist"),
+            ("BoyerLindquist", "Spherical"),
+            ("Spherical", "Cylindrical"),
+            ("Cylindrical", "Spherical"),
+            ("Cylindrical", "BoyerLindquist"),
+            ("BoyerLindquist", "Cylindrical"),
+        ],
+    )
+    def test_direct_matches_cartesian(self, source, target):
+        xs, vs = _through_cartesian(xs_spherical, vs_spherical, "Spherical", source)
+
+        xs_direct, vs_direct = convert(xs, vs, source, target, _kwargs(source), _kwargs(target))
+        xs_cartesian, vs_cartesian = _through_cartesian(xs, vs, source, target)
+
+        assert np.allclose(xs_direct, xs_cartesian, rtol=1e-10)
+        assert np.allclose(vs_direct, vs_cartesian, rtol=1e-10, atol=1e-14)
+
+    def test_boyer_lindquist_is_spherical_without_spin(self):
+        xs, vs = convert(xs_spherical, vs_spherical, "Spherical", "BoyerLindquist", {}, {"a": 0.0})
+        assert np.allclose(xs, xs_spherical, rtol=1e-14)
+        assert np.allclose(vs, vs_spherical, rtol=1e-14)
+
+    def test_identity_and_spin_change(self):
+        coordinate = BoyerLindquist(xs_spherical[:, 0], vs_spherical[:, 0], a=a)
+        assert coordinate.convert_to("BoyerLindquist", a=a) is coordinate
+
+        other = coordinate.convert_to("BoyerLindquist", a=0.9)
+        back = other.convert_to("BoyerLindquist", a=a)
+        assert np.allclose(back.xs, coordinate.xs)
+        assert np.allclose(back.vs, coordinate.vs)
+
+        spherical = coordinate.convert_to("Spherical")
+        assert np.allclose(other.convert_to("Spherical").xs, spherical.xs)
+        assert isinstance(spherical, Spherical)
@@ -0,0 +1,77 @@
+# test_coordinate_batch.py
+
+import numpy as np
+import pytest
+from relatipy.numeric.coordinates import BoyerLindquist, Cartesian, CoordinateBatch, Cylindrical, Spherical
+
+a = 0.5
+rng = np.random.default_rng(0)
+N = 20
+
+xs_spherical = np.array(
+    [rng.uniform(0, 10, N), rng.uniform(2, 20, N), rng.uniform(0.2, np.pi - 0.2, N), rng.uniform(-3, 3, N)]
+)
+vs_spherical = rng.uniform(-0.1, 0.1, (3, N))
+
+systems = {
+    "Cartesian": lambda xs, vs: Cartesian(xs, vs),
+    "Spherical": lambda xs, vs: Spherical(xs, vs),
+    "Cylindrical": lambda xs, vs: Cylindrical(xs, vs),
+    "BoyerLindquist": lambda xs, vs: BoyerLindquist(xs, vs, a=a),
+}
+
+
+def _kwargs(system_name):
+    return {"a": a} if system_name == "BoyerLindquist" else {}
+
+
+class TestCoordinateBatch:
+    def test_shapes(self):
+        batch = CoordinateBatch("Spherical", xs_spherical, vs_spherical)
+        assert len(batch) == N
+        assert batch.xs.shape == (4, N) and batch.vs.shape == (3, N) and batch.dxs_dt.shape == (3, N)
+        assert batch.state_vector.shape == (7, N)
+
+        with pytest.raises(ValueError):
+            CoordinateBatch("Spherical", xs_spherical[:3], vs_spherical)
+        with pytest.raises(ValueError):
+            CoordinateBatch("Polar", xs_spherical, vs_spherical)
+
+    @pytest.mark.parametrize("target", list(systems))
+    def test_convert_to_matches_single_points(self, target):
+        batch = CoordinateBatch("Spherical", xs_spherical, vs_spherical).convert_to(target, **_kwargs(target))
+        assert batch.name_metric == target
+
+        for i in range(N):
+            single = Spherical(xs_spherical[:, i], vs_spherical[:, i]).convert_to(target, **_kwargs(target))
+            assert np.allclose(batch.xs[:, i], single.xs, rtol=1e-12)
+            assert np.allclose(batch.vs[:, i], single.vs, rtol=1e-12)
+            assert np.allclose(batch.dxs_dt[:, i], single.dxs_dt, rtol=1e-12)
+
+    @pytest.mark.parametrize("target", list(systems))
+    def test_round_trip(self, target):
+        batch = CoordinateBatch("Spherical", xs_spherical, vs_spherical)
+        back = batch.convert_to(target, **_kwargs(target)).convert_to("Spherical")
+
+        assert np.allclose(back.xs, batch.xs)
+        assert np.allclose(back.vs, batch.vs)
+
+    def test_dxs_dt(self):
+        batch = CoordinateBatch("BoyerLindquist", xs_spherical, vs_spherical, a=a)
+        from_dxs_dt = CoordinateBatch("BoyerLindquist", xs_spherical, batch.dxs_dt, from_dxs_dt=True, a=a)
+        assert np.allclose(from_dxs_dt.vs, vs_spherical)
+
+    def test_from_coordinates_and_indexing(self):
+        coordinates = [Cylindrical(xs, vs) for xs, vs in zip(xs_spherical.T, vs_spherical.T)]
+        batch = CoordinateBatch.from_coordinates(coordinates)
+
+        assert np.array_equal(batch.xs, xs_spherical)
+        assert isinstance(batch[3], Cylindrical)
+        assert np.allclose(batch[3].vs, coordinates[3].vs)
+        assert len(batch[2:5]) == 3
+
+    def test_boyer_lindquist_keeps_time(self):
+        xs = xs_spherical.copy()
+        xs_p, _ = BoyerLindquist._convert_to_cartesian(xs, vs_spherical, a)
+        assert np.array_equal(xs_p[0], xs_spherical[0])
+        assert np.array_equal(xs, xs_spherical)
@@ -0,0 +1,33 @@
+# test_coordinate_objects.py
+
+import numpy as np
+import pytest
+from relatipy.numeric.coordinates import BoyerLindquist, Spherical
+
+xs = [0.0, 10.0, 1.0, 0.5]
+vs = [0.01, 0.002, 0.003]
+
+
+class TestCoordinateObjects:
+    def test_no_instance_dict(self):
+        coordinate = BoyerLindquist(xs, vs, a=0.5)
+        assert not hasattr(coordinate, "__dict__")
+        assert coordinate.a == 0.5
+
+        with pytest.raises(ValueError):
+            BoyerLindquist(xs, vs)
+
+    def test_lazy_derived_fields(self):
+        coordinate = Spherical(xs, vs)
+        assert coordinate._dxs_dt is None and coordinate._state_vector is None
+
+        dxs_dt = coordinate.dxs_dt
+        assert dxs_dt is coordinate.dxs_dt  # cached
+        assert np.allclose(Spherical(xs, dxs_dt, from_dxs_dt=True).vs, vs)
+        assert np.array_equal(coordinate.state_vector, np.concatenate([xs, vs]))
+
+    def test_without_velocities(self):
+        coordinate = Spherical(xs)
+        assert np.array_equal(coordinate.vs, np.zeros(3))
+        assert np.array_equal(coordinate.dxs_dt, np.zeros(3))
+        assert coordinate.state_vector.shape == (7,)
@@ -0,0 +1,80 @@
+# test_bundle_integrators.py
+
+import numpy as np
+import pytest
+from relatipy.numeric.metrics import Kerr
+from relatipy.numeric.coordinates import BoyerLindquist
+from relatipy.numeric.geodesic import EscapeEvent, HorizonEvent, integrate_bundle
+
+kerr = Kerr(1.0, 0.5)
+taus = np.linspace(0, 300, 61)
+
+# Circular-ish orbits that finish, plunging orbits that hit the horizon
+initial_conditions = [
+    BoyerLindquist([0, r, np.pi / 2, 0], [0, 0, r**-0.5 * factor], a=0.5)
+    for r in (8.0, 12.0, 16.0) for factor in (1.0, 0.4)
+]
+ys0 = np.array([kerr.get_4state_vector(coordinate) for coordinate in initial_conditions])
+
+
+def oscillators(t, ys):
+    # ys = [x, v, omega]: independent harmonic oscillators of different frequencies
+    return np.stack([ys[:, 1], -ys[:, 2] ** 2 * ys[:, 0], np.zeros(len(ys))], axis=1)
+
+
+class TestBundleIntegrators:
+    def test_dopri5_matches_the_exact_solution(self):
+        omegas = np.array([0.1, 1.0, 10.0])
+        ys = np.stack([np.ones(3), np.zeros(3), omegas], axis=1)
+        ts = np.linspace(0, 10, 41)
+
+        result = integrate_bundle(oscillators, ts, ys, method="DOPRI5", rtol=1e-10, atol=1e-12)
+
+        assert (result.status == 0).all()
+        assert np.allclose(result.y[:, 0], np.cos(omegas[:, None] * ts), atol=1e-6)
+        assert np.allclose(result.y_stop[:, 0], np.cos(omegas * 10), atol=1e-8)
+
+    def test_steps_adapt_per_system(self):
+        slow = np.array([[1.0, 0.0, 0.1]])
+        fast = np.array([[1.0, 0.0, 10.0]])
+        ts = np.linspace(0, 10, 11)
+
+        nfev_slow = integrate_bundle(oscillators, ts, slow, method="DOPRI5").nfev
+        nfev_fast = integrate_bundle(oscillators, ts, fast, method="DOPRI5").nfev
+        nfev_both = integrate_bundle(oscillators, ts, np.concatenate([slow, fast]), method="DOPRI5").nfev
+
+        # The slow system is not dragged along at the step of the fast one
+        assert nfev_slow < nfev_fast / 5
+        assert nfev_both == nfev_slow + nfev_fast
+
+    def test_lockstep_geodesics_match_dop853(self):
+        event = HorizonEvent(kerr, 1e-2)
+        result = kerr.geodesic.get_paths_lockstep(ys0, taus, events=[event], rtol=1e-10, atol=1e-10)
+
+        assert result.y.shape == (len(ys0), 8, len(taus))
+        assert list(result.status) == [0, 1, 0, 1, 0, 1]
+        assert np.allclose(result.y_stop[result.status == 1, 1], kerr.horizon_radius + 1e-2)
+
+        for ys0_i, ys, status in zip(ys0, result.y, result.status):
+            reference = kerr.geodesic._get_path_from_4state_vector(
+                ys0_i, taus, "DOP853", events=[event], rtol=1e-12, atol=1e-12
+            )
+            n = reference.shape[1]
+            assert np.allclose(ys[:, :n], reference, rtol=1e-6, atol=1e-6)
+            assert np.isnan(ys[:, n:]).all()
+
+    def test_retired_particles_leave_the_active_set(self):
+        ts = np.linspace(0, 2000, 11)
+        escaping = np.array([kerr.get_4state_vector(BoyerLindquist([0, 10.0, np.pi / 2, 0], [0.6, 0, 0.1], a=0.5))])
+        orbiting = ys0[:1]
+
+        alone = kerr.geodesic.get_paths_lockstep(orbiting, ts).nfev
+        together = kerr.geodesic.get_paths_lockstep(np.concatenate([orbiting, escaping]), ts, events=[EscapeEvent(50.0)])
+
+        assert list(together.status) == [0, 1]
+        # The escaped particle stops costing evaluations once it leaves
+        assert together.nfev < 1.5 * alone
+
+    def test_unknown_method(self):
+        with pytest.raises(ValueError):
+            integrate_bundle(oscillators, [0, 1], np.ones((1, 3)), method="Euler")
@@ -0,0 +1,94 @@
+# test_events.py
+
+import warnings
+
+import numpy as np
+import pytest
+from relatipy.numeric.metrics import Kerr, Schwarzschild
+from relatipy.numeric.coordinates import BoyerLindquist, Spherical
+from relatipy.numeric.geodesic import EquatorialPlaneEvent, EscapeEvent, HorizonEvent
+
+sch = Schwarzschild(1.0)
+taus = np.linspace(0, 200, 201)
+
+plunging = sch.get_4state_vector(Spherical([0, 10.0, np.pi / 2, 0], [-0.1, 0, 0.05]))
+inclined = sch.get_4state_vector(Spherical([0, 20.0, np.pi / 2 + 0.3, 0], [0, 0.05, 0.2]))
+escaping = sch.get_4state_vector(Spherical([0, 10.0, np.pi / 2, 0], [0.6, 0, 0.1]))
+
+
+class TestEvents:
+    def test_horizon_radius(self):
+        assert sch.horizon_radius == sch.R_s
+        assert np.isclose(Kerr(1.0, 0.6).horizon_radius, 1.8)
+
+    @pytest.mark.parametrize("method, options", [("Radau", {}), ("DOP853", {}), ("RK4", {"step": 0.01})])
+    def test_horizon_event_stops_integration(self, method, options):
+        event = HorizonEvent(sch, epsilon=1e-2)
+        ys = sch.geodesic._get_path_from_4state_vector(plunging, taus, method, events=[event], **options)
+        result = sch.geodesic.last_result
+
+        assert result.status == 1
+        assert ys.shape[1] < len(taus)
+        assert np.isclose(result.y_events[0][0][1], sch.R_s + 1e-2)
+        assert np.isclose(result.t_events[0][0], 25.2325, atol=1e-3)
+
+    def test_horizon_event_in_kerr(self):
+        kerr = Kerr(1.0, 0.6)
+        coordinate = BoyerLindquist([0, 6.0, np.pi / 2, 0], [-0.3, 0, 0], a=0.6)
+        event = HorizonEvent(kerr, epsilon=0.5)
+
+        path = kerr.geodesic.get_path(coordinate, taus, events=[event])
+        result = kerr.geodesic.last_result
+
+        assert result.status == 1
+        assert np.isclose(result.y_events[0][0][1], kerr.horizon_radius + 0.5)
+        assert (path.xs[1] > kerr.horizon_radius).all()
+
+    @pytest.mark.parametrize("method, options", [("DOP853", {}), ("RK4", {"step": 0.5})])
+    def test_escape_event(self, method, options):
+        sch.geodesic._get_path_from_4state_vector(escaping, taus, method, events=[EscapeEvent(50.0)], **options)
+        result = sch.geodesic.last_result
+
+        assert result.status == 1
+        assert np.isclose(result.y_events[0][0][1], 50.0)
+
+    def test_equatorial_plane_crossings_are_recorded(self):
+        long_taus = np.linspace(0, 1000, 101)
+        events = [EquatorialPlaneEvent()]
+
+        sch.geodesic._get_path_from_4state_vector(inclined, long_taus, "DOP853", events=events, rtol=1e-10, atol=1e-10)
+        reference = sch.geodesic.last_result
+        ys = sch.geodesic._get_path_from_4state_vector(inclined, long_taus, "RK4", events=events, step=0.5)
+        result = sch.geodesic.last_result
+
+        assert reference.status == 0 and result.status == 0
+        assert ys.shape[1] == len(long_taus)
+        assert len(result.t_events[0]) == len(reference.t_events[0]) > 0
+        assert np.allclose(result.t_events[0], reference.t_events[0], atol=1e-3)
+        assert np.allclose(np.cos(result.y_events[0][:, 2]), 0, atol=1e-8)
+
+    def test_horizon_event_requires_horizon(self):
+        class NoHorizon:
+            horizon_radius = None
+
+        with pytest.raises(ValueError):
+            HorizonEvent(NoHorizon())
+
+    def test_kerr_naked_singularity(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            kerr = Kerr(1.0, 1.2)
+            g = kerr.metric(np.array([0, 6.0, np.pi / 2, 0]))
+
+        assert kerr.horizon_radius is None
+        assert np.isfinite(g).all()
+        with pytest.raises(ValueError):
+            HorizonEvent(kerr)
+
+        xs = np.array([[0, 50.0, np.pi / 2, 0]])
+        ks = kerr.get_null_4momentum_from_impact_parameters(xs, 10.0, 20.0)
+        result = kerr.geodesic.get_null_paths(xs, ks, np.linspace(0, 10, 11), step=0.1)
+        assert result.y.shape == (1, 8, 11)
+        with pytest.raises(ValueError, match="event horizon"):
+            kerr.geodesic.get_null_paths(xs, ks, np.linspace(0, 1, 11), radial_steps=True, step=0.1)
+
@@ -0,0 +1,185 @@
+# test_geodesic.py
+
+import numpy as np
+import pytest
+import astropy.units as u
+from relatipy.numeric.metrics import Kerr, Schwarzschild
+from relatipy.numeric.coordinates import BoyerLindquist, Spherical
+from relatipy.numeric.geodesic import HorizonEvent
+
+M = 5.972e24 * u.kg
+a = 0.5
+
+xs_1 = [0.0 * u.s, 7e6 * u.m, np.pi / 2 * u.rad, 0.0 * u.rad]
+vs_1 = [0 * u.m / u.s, 70 * u.rad / u.s, 10 * u.rad / u.s]
+
+xs_2 = [0.0 * u.s, 9e6 * u.m, np.pi / 3 * u.rad, 0.0 * u.rad]
+vs_2 = [100 * u.m / u.s, 6 * u.rad / u.s, 10 * u.rad / u.s]
+
+taus = np.linspace(0, 100, 100)
+
+
+class TestGeodesicBatch:
+    def test_get_paths_matches_single_schwarzschild(self):
+        sch = Schwarzschild(M)
+        initial_conditions = [Spherical(xs_1, vs_1), Spherical(xs_2, vs_2)]
+
+        paths = sch.geodesic.get_paths(initial_conditions, taus)
+        assert paths.shape == (2, 8, len(taus))
+
+        for path, coordinate in zip(paths, initial_conditions):
+            ys0 = sch.get_4state_vector(coordinate)
+            single = sch.geodesic._get_path_from_4state_vector(ys0, taus)
+            assert np.isclose(path, single).all()
+
+    def test_get_paths_matches_single_kerr(self):
+        kerr = Kerr(M, a)
+        initial_conditions = [BoyerLindquist(xs_1, vs_1, a=a), BoyerLindquist(xs_2, vs_2, a=a)]
+
+        paths = kerr.geodesic.get_paths(initial_conditions, taus)
+
+        for path, coordinate in zip(paths, initial_conditions):
+            ys0 = kerr.get_4state_vector(coordinate)
+            single = kerr.geodesic._get_path_from_4state_vector(ys0, taus)
+            assert np.isclose(path, single).all()
+
+    def test_get_paths_from_state_array(self):
+        kerr = Kerr(M, a)
+        initial_conditions = [BoyerLindquist(xs_1, vs_1, a=a), BoyerLindquist(xs_2, vs_2, a=a)]
+        ys0 = np.array([kerr.get_4state_vector(c) for c in initial_conditions])
+
+        paths_array = kerr.geodesic.get_paths(ys0, taus)
+        paths_objects = kerr.geodesic.get_paths(initial_conditions, taus)
+        assert np.isclose(paths_array, paths_objects).all()
+
+    def test_get_paths_rejects_events(self):
+        # Particle 0 escapes, particle 1 falls into the black hole
+        sch = Schwarzschild(1.0)
+        ys0 = np.array([
+            sch.get_4state_vector(Spherical([0, 20.0, np.pi / 2, 0], [0.5, 0, 0.02])),
+            sch.get_4state_vector(Spherical([0, 10.0, np.pi / 2, 0], [-0.1, 0, 0.05])),
+        ])
+        taus = np.linspace(0, 100, 101)
+
+        with pytest.raises(ValueError):
+            sch.geodesic.get_paths(ys0, taus, events=[HorizonEvent(sch, 1e-2)])
+
+        result = sch.geodesic.get_paths_lockstep(ys0, taus, events=[HorizonEvent(sch, 1e-2)])
+        assert list(result.status) == [0, 1]
+        assert not np.isnan(result.y[0]).any()
+        assert np.isnan(result.y[1, :, -1]).all()
+
+
+class TestGetPath:
+    def test_raw_and_converted_paths(self, capsys):
+        kerr = Kerr(M, a)
+        coordinate = BoyerLindquist(xs_1, vs_1, a=a)
+
+        path = kerr.geodesic.get_path(coordinate, taus)
+        raw = kerr.geodesic.get_path(coordinate, taus, convert=False)
+        assert capsys.readouterr().out == ""
+
+        assert raw.shape == (8, len(taus))
+        assert np.array_equal(path.xs, raw[:4])
+        assert np.allclose(path.dxs_dt, raw[5:] / raw[4], rtol=1e-12)
+
+    def test_path_back_in_cartesian(self):
+        sch = Schwarzschild(M)
+        coordinate = Spherical(xs_1, vs_1)
+
+        path = sch.geodesic.get_path(coordinate.convert_to("Cartesian"), taus)
+        raw = sch.geodesic.get_path(coordinate, taus, convert=False)
+        expected = Spherical(raw[:4], raw[5:] / raw[4], from_dxs_dt=True).convert_to("Cartesian")
+
+        assert path.name_metric == "Cartesian"
+        assert np.allclose(path.xs, expected.xs)
+        assert np.allclose(path.vs, expected.vs)
+
+
+class TestInitialConditions:
+    def test_get_4state_vectors_kerr(self):
+        kerr = Kerr(M, a)
+        rng = np.random.default_rng(0)
+        N = 20
+        xs = np.column_stack(
+            [np.zeros(N), rng.uniform(3, 20, N) * kerr.R_s, rng.uniform(0.3, np.pi - 0.3, N), rng.uniform(0, 6, N)]
+        )
+        dxs_dt = np.column_stack([rng.uniform(-0.1, 0.1, N), rng.uniform(-0.01, 0.01, N) / xs[:, 1], 0.2 / xs[:, 1]])
+
+        ys0 = kerr.get_4state_vectors(xs, dxs_dt)
+        assert ys0.shape == (N, 8)
+        assert np.array_equal(ys0[:, :4], xs)
+
+        # Timelike normalization g_{mu nu} u^mu u^nu = c^2 and dx^i/dt = c u^i / u^0
+        us = ys0[:, 4:]
+        g = np.moveaxis(kerr.metric(xs.T), -1, 0)
+        assert np.allclose(np.einsum("nij,ni,nj->n", g, us, us), 1)
+        assert np.allclose(us[:, 1:] / us[:, :1], dxs_dt)
+
+    def test_get_4state_vectors_matches_coordinates(self):
+        sch = Schwarzschild(M)
+        # The last particle moves at relativistic speed, in dimensionless units
+        coordinates = [
+            Spherical(xs_1, vs_1), Spherical(xs_2, vs_2), Spherical([0.0, 5 * sch.R_s, 1.0, 0.0], [0.3, 0.1, 0.2])
+        ]
+
+        ys0 = sch.geodesic._get_4state_vectors(coordinates)
+        for y0, coordinate in zip(ys0, coordinates):
+            # Hand-computed u^0 = dt/dtau of the Schwarzschild metric, u^i = u^0 dx^i/dt
+            r, theta = coordinate.xs[1], coordinate.xs[2]
+            dr, dtheta, dphi = coordinate.dxs_dt
+            f = 1 - sch.R_s / r
+            u0 = 1 / np.sqrt(f - dr**2 / f - r**2 * dtheta**2 - r**2 * np.sin(theta) ** 2 * dphi**2)
+
+            assert np.allclose(y0[:4], coordinate.xs, rtol=1e-12, atol=0)
+            assert np.allclose(y0[4:], u0 * np.array([1, dr, dtheta, dphi]), rtol=1e-12, atol=0)
+
+
+class TestGeodesicAcceleration:
+    def _full_contraction(self, chris, us):
+        return -np.einsum("...smn,...m,...n->...s", chris, us, us)
+
+    def test_acceleration_kerr(self):
+        kerr = Kerr(M, a)
+        coordinate = BoyerLindquist(xs_1, vs_1, a=a)
+        xs, us = coordinate.xs, kerr.get_4velocity(coordinate)
+
+        chris = kerr.get_christoffel_symbols(xs)
+        assert np.allclose(kerr.geodesic.get_acceleration(chris, us), self._full_contraction(chris, us))
+
+    def test_acceleration_schwarzschild_batch(self):
+        sch = Schwarzschild(M)
+        coordinates = [Spherical(xs_1, vs_1), Spherical(xs_2, vs_2)]
+        xs = np.array([c.xs for c in coordinates], dtype=float)
+        us = np.array([sch.get_4velocity(c) for c in coordinates])
+
+        chris = sch.get_christoffel_symbols(xs)
+        acceleration = sch.geodesic.get_acceleration(chris, us)
+        assert acceleration.shape == (2, 4)
+        assert np.allclose(acceleration, self._full_contraction(chris, us))
+
+
+class TestGeodesicJacobian:
+    def _numerical_jacobian(self, geodesic, ys, h=1e-6):
+        jac = np.zeros(ys.shape[:-1] + (8, 8))
+        for j in range(8):
+            step = np.zeros(8)
+            step[j] = h
+            jac[..., j] = (geodesic.model_geodesic(0, ys + step) - geodesic.model_geodesic(0, ys - step)) / (2 * h)
+        return jac
+
+    def test_jacobian_matches_finite_differences(self):
+        ys = np.array(
+            [
+                [0.3, 5.0, 1.1, 0.4, 1.3, 0.1, 0.02, 0.05],
+                [0.0, 12.0, 2.5, 1.0, 1.1, -0.05, 0.01, 0.02],
+            ]
+        )
+        for metric in (Kerr(1.0, 0.8), Schwarzschild(1.0)):
+            jac = metric.geodesic.jacobian_geodesic(0, ys)
+            assert np.allclose(jac, self._numerical_jacobian(metric.geodesic, ys), atol=1e-8)
+
+            jac_batch = metric.geodesic.jacobian_geodesic_batch(0, ys.ravel()).toarray()
+            assert np.allclose(jac_batch[:8, :8], jac[0])
+            assert np.allclose(jac_batch[8:, 8:], jac[1])
+            assert not jac_batch[:8, 8:].any()
@@ -0,0 +1,69 @@
+# test_integrators.py
+
+import numpy as np
+import pytest
+from relatipy.numeric.metrics import Schwarzschild
+from relatipy.numeric.coordinates import Spherical
+from relatipy.numeric.geodesic import integrators
+
+sch = Schwarzschild(1.0)
+initial_conditions = Spherical([0, 20.0, np.pi / 2, 0], [0, 0.01, 0.22])
+ys0 = sch.get_4state_vector(initial_conditions)
+taus = np.linspace(0, 1000, 51)
+
+reference = sch.geodesic._get_path_from_4state_vector(ys0, taus, "DOP853", rtol=1e-11, atol=1e-11)
+
+
+def energy(ys):
+    g = sch.metric(ys[:4])  # (4, 4, T)
+    return np.einsum("jn,jn->n", g[0], ys[4:])
+
+
+class TestIntegrators:
+    @pytest.mark.parametrize(
+        "method, options",
+        [
+            ("RK45", {"rtol": 1e-9, "atol": 1e-9}),
+            ("DOP853", {"rtol": 1e-9, "atol": 1e-9}),
+            ("Radau", {"rtol": 1e-9, "atol": 1e-9}),
+            ("LSODA", {"rtol": 1e-9, "atol": 1e-9}),
+            ("RK4", {"step": 1.0}),
+            ("implicit_midpoint", {"step": 0.5}),
+        ],
+    )
+    def test_backends_agree(self, method, options):
+        ys = sch.geodesic._get_path_from_4state_vector(ys0, taus, method, **options)
+        result = sch.geodesic.last_result
+
+        assert ys.shape == reference.shape
+        assert result.status == 0
+        assert result.nfev > 0
+        assert np.allclose(ys[:4], reference[:4], rtol=1e-4, atol=1e-4)
+
+    def test_rk4_reports_evaluations(self):
+        sch.geodesic._get_path_from_4state_vector(ys0, taus, "RK4", step=5.0)
+        assert sch.geodesic.last_result.nfev == 4 * 4 * (len(taus) - 1)
+
+    def test_implicit_midpoint_conserves_energy(self):
+        long_taus = np.linspace(0, 20000, 11)
+        ys = sch.geodesic._get_path_from_4state_vector(ys0, long_taus, "implicit_midpoint", step=2.0)
+        E = energy(ys)
+        assert np.isclose(E, E[0], rtol=1e-8, atol=0).all()
+
+    def test_get_path_with_method(self):
+        path = sch.geodesic.get_path(initial_conditions, taus, method="RK4", step=1.0)
+        assert np.allclose(path[:4, :], reference[:4], rtol=1e-4, atol=1e-4)
+
+    def test_get_paths_with_method(self):
+        paths = sch.geodesic.get_paths(np.array([ys0, ys0]), taus, method="DOP853", rtol=1e-9, atol=1e-9)
+        assert np.allclose(paths[1, :4], reference[:4], rtol=1e-4, atol=1e-4)
+
+    def test_unknown_method(self):
+        assert "implicit_midpoint" in integrators
+        with pytest.raises(ValueError):
+            sch.geodesic._get_path_from_4state_vector(ys0, taus, "Euler")
+
+    @pytest.mark.parametrize("method", ["RK4", "implicit_midpoint"])
+    def test_fixed_step_rejects_unknown_options(self, method):
+        with pytest.raises(TypeError):
+            sch.geodesic._get_path_from_4state_vector(ys0, taus, method, step=1.0, rtol=1e-9)
@@ -0,0 +1,77 @@
+# test_null_geodesics.py
+
+import numpy as np
+import pytest
+from relatipy.numeric.metrics import Kerr, Schwarzschild
+
+sch = Schwarzschild(1.0)
+lambdas = np.linspace(0, 200, 201)
+
+
+def lower(metric, xs, ks):
+    g = np.moveaxis(metric.metric(xs.T), -1, 0)
+    return np.einsum("nij,nj->ni", g, ks)
+
+
+class TestNullMomentum:
+    def test_null_4momentum_from_directions(self):
+        xs = np.array([[0, 10.0, np.pi / 2, 0], [0, 4.0, 1.0, 2.0], [0, 30.0, 2.5, 1.0]])
+        directions = np.array([[-1.0, 0, 0.01], [0.2, 0.1, -0.3], [1.0, -0.01, 0.02]])
+
+        ks = sch.get_null_4momentum(xs, directions, energy=2.0)
+
+        assert np.allclose(np.einsum("ni,ni->n", lower(sch, xs, ks), ks), 0)
+        assert np.allclose(lower(sch, xs, ks)[:, 0], 2.0)
+        assert (ks[:, 0] > 0).all()
+        assert np.allclose(ks[:, 1:] / np.linalg.norm(ks[:, 1:], axis=1)[:, None],
+                           directions / np.linalg.norm(directions, axis=1)[:, None])
+
+    def test_impact_parameters_set_the_constants_of_motion(self):
+        kerr = Kerr(1.0, 0.9)
+        xs = np.tile([0, 20.0, 1.2, 0], (4, 1))
+        lambdas_z, etas = np.array([-6.0, -2.0, 3.0, 6.0]), np.array([10.0, 20.0, 5.0, 12.0])
+
+        ks = kerr.get_null_4momentum_from_impact_parameters(xs, lambdas_z, etas)
+        ps = lower(kerr, xs, ks)
+
+        assert np.allclose(np.einsum("ni,ni->n", ps, ks), 0)
+        assert np.allclose(ps[:, 0], 1)
+        assert np.allclose(ps[:, 3], -lambdas_z)
+        assert (ks[:, 1] < 0).all()
+
+    def test_forbidden_impact_parameters(self):
+        with pytest.raises(ValueError):
+            Kerr(1.0, 0.5).get_null_4momentum_from_impact_parameters([0, 20.0, 0.3, 0], 6.0, 0.0)
+
+
+class TestNullPaths:
+    def test_capture_depends_on_the_critical_impact_parameter(self):
+        # Schwarzschild photons are captured if b < 3 sqrt(3) M
+        bs = np.array([0.0, 4.0, 5.0, 5.4, 6.0, 10.0])
+        xs = np.tile([0, 50.0, np.pi / 2, 0], (len(bs), 1))
+        ks = Kerr(1.0, 0.0).get_null_4momentum_from_impact_parameters(xs, bs, 0.0)
+
+        result = sch.geodesic.get_null_paths(xs, ks, lambdas, escape_radius=100.0, step=0.05)
+
+        assert result.y.shape == (len(bs), 8, len(lambdas))
+        assert (result.status == 1).all()
+        assert result.events[result.event[0]].radius == pytest.approx(sch.R_s + 1e-3)
+        assert list(result.event) == [1, 1, 1, 0, 0, 0]
+        assert np.allclose(result.y_stop[3:, 1], 100.0)
+        assert np.isnan(result.y[:, :, -1]).all()
+
+    def test_bundle_matches_single_rays_and_conserves_constants(self):
+        kerr = Kerr(1.0, 0.7)
+        xs = np.tile([0, 30.0, 1.3, 0], (3, 1))
+        ks = kerr.get_null_4momentum_from_impact_parameters(xs, np.array([-7.0, 7.0, 9.0]), np.array([8.0, 8.0, 12.0]))
+
+        result = kerr.geodesic.get_null_paths(xs, ks, lambdas[:41], escape_radius=None, step=0.05)
+
+        assert (result.status == 0).all()
+        for ys0, ys in zip(np.concatenate([xs, ks], axis=1), result.y):
+            single = kerr.geodesic._get_path_from_4state_vector(ys0, lambdas[:41], "RK4", step=0.05)
+            assert np.allclose(ys, single)
+
+        ps = lower(kerr, result.y_stop[:, :4], result.y_stop[:, 4:])
+        assert np.allclose(ps[:, 0], 1, atol=1e-6)
+        assert np.allclose(ps[:, 3], [7.0, -7.0, -9.0], atol=1e-5)
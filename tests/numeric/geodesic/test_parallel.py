@@ -0,0 +1,61 @@
+# test_parallel.py
+
+import pickle
+
+import numpy as np
+from relatipy.numeric.metrics import Kerr, Schwarzschild
+from relatipy.numeric.coordinates import BoyerLindquist, Spherical
+from relatipy.numeric.geodesic import HorizonEvent
+
+taus = np.linspace(0, 50, 51)
+
+
+class KeywordOnlyKerr(Kerr):
+    def __init__(self, mass, *, a):
+        super().__init__(mass, a)
+
+
+class TestParallel:
+    def test_metric_pickles_as_parameters(self):
+        kerr = Kerr(1.0, 0.7)
+        kerr.christoffel_contraction  # cached tables are not shipped
+        clone = pickle.loads(pickle.dumps(kerr))
+
+        assert type(clone) is Kerr
+        assert clone.mass == kerr.mass and clone.a == kerr.a
+        assert clone.kwargs == {"a": 0.7}
+        assert "christoffel_contraction" not in clone.__dict__
+
+    def test_keyword_only_metric_pickles(self):
+        kerr = KeywordOnlyKerr(1.0, a=0.7)
+        clone = pickle.loads(pickle.dumps(kerr))
+
+        assert type(clone) is KeywordOnlyKerr
+        assert clone.mass == kerr.mass and clone.a == kerr.a
+
+    def test_parallel_matches_serial(self):
+        kerr = Kerr(1.0, 0.5)
+        initial_conditions = [
+            BoyerLindquist([0, r, np.pi / 2, 0], [0, 0, r**-0.5], a=0.5) for r in (8.0, 10.0, 12.0, 14.0, 16.0)
+        ]
+
+        paths = kerr.geodesic.get_paths_parallel(initial_conditions, taus, max_workers=2, chunksize=2)
+
+        assert paths.shape == (5, 8, len(taus))
+        for coordinate, path in zip(initial_conditions, paths):
+            ys0 = kerr.get_4state_vector(coordinate)
+            assert np.allclose(path, kerr.geodesic._get_path_from_4state_vector(ys0, taus))
+
+    def test_terminated_paths_are_padded_with_nan(self):
+        sch = Schwarzschild(1.0)
+        ys0 = np.array([
+            sch.get_4state_vector(Spherical([0, 10.0, np.pi / 2, 0], [-0.1, 0, 0.05])),
+            sch.get_4state_vector(Spherical([0, 20.0, np.pi / 2, 0], [0, 0, 0.2])),
+        ])
+
+        paths = sch.geodesic.get_paths_parallel(
+            ys0, np.linspace(0, 200, 201), events=[HorizonEvent(sch, 1e-2)], max_workers=2
+        )
+
+        assert np.isnan(paths[0, :, -1]).all() and not np.isnan(paths[0, :, 0]).any()
+        assert not np.isnan(paths[1]).any()
@@ -0,0 +1,102 @@
+# test_generated_metric.py
+
+import pickle
+
+import numpy as np
+import pytest
+import sympy as sp
+from relatipy.numeric.coordinates import Spherical
+from relatipy.numeric.metrics import GeneratedMetric, Kerr, Schwarzschild, make_metric
+from relatipy.symbolic.metrics import Kerr as SymbolicKerr
+
+t, r, theta, phi, R_s, Q = sp.symbols("t r theta phi R_s Q")
+coordinates = [t, r, theta, phi]
+
+xs = np.array([
+    [0.0, 10.0, 1.0, 0.5],
+    [1.0, 5.0, 2.0, 1.0],
+    [2.0, 3.0, 0.3, 4.0],
+])
+
+
+@pytest.fixture(scope="module", autouse=True)
+def kernel_cache(tmp_path_factory):
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("RELATIPY_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
+        yield
+
+
+@pytest.fixture(scope="module")
+def ReissnerNordstrom():
+    f = 1 - R_s / r + Q**2 / r**2
+    g = sp.diag(f, -1 / f, -r**2, -r**2 * sp.sin(theta)**2)
+    horizon_radius = lambda metric: metric.R_s / 2 + np.sqrt(metric.R_s**2 / 4 - metric.kwargs["Q"]**2)
+    return make_metric(g, coordinates, [Q], "ReissnerNordstrom", "Spherical", horizon_radius=horizon_radius)
+
+
+def test_reissner_nordstrom_without_charge(ReissnerNordstrom):
+    metric, sch = ReissnerNordstrom(1.0, 0.0), Schwarzschild(1.0)
+
+    assert issubclass(ReissnerNordstrom, GeneratedMetric)
+    assert metric.horizon_radius == sch.horizon_radius
+    assert np.allclose(metric.metric(xs.T), sch.metric(xs.T))
+    assert np.allclose(metric.metric(xs[0]), sch.metric(xs[0]))
+    assert np.allclose(metric.get_christoffel_symbols(xs), sch.get_christoffel_symbols(xs))
+    assert np.allclose(metric.get_christoffel_symbols(xs, dimensionless=False), sch.get_christoffel_symbols(xs, dimensionless=False))
+    assert np.allclose(np.einsum("ijn,jkn->nik", metric.metric(xs.T), metric.inverse_metric(xs.T)), np.eye(4))
+
+    # Same geodesic as the hand-written metric
+    coordinate = Spherical([0, 10.0, np.pi / 2, 0], [0, 0, 0.3])
+    taus = np.linspace(0, 20, 21)
+    path = metric.geodesic._get_path_from_4state_vector(metric.get_4state_vector(coordinate), taus)
+    assert np.allclose(path, sch.geodesic._get_path_from_4state_vector(sch.get_4state_vector(coordinate), taus))
+
+
+def test_reissner_nordstrom_pickles(ReissnerNordstrom):
+    metric = ReissnerNordstrom(1.0, 0.3)
+    clone = pickle.loads(pickle.dumps(metric))
+
+    assert type(clone) is ReissnerNordstrom
+    assert clone.kwargs == {"Q": 0.3} and clone.horizon_radius == metric.horizon_radius
+    assert np.array_equal(clone.get_christoffel_symbols(xs), metric.get_christoffel_symbols(xs))
+
+    ys0 = np.array([metric.get_4state_vector(Spherical([0, r_0, np.pi / 2, 0], [0, 0, 0.3])) for r_0 in (8.0, 12.0)])
+    taus = np.linspace(0, 20, 21)
+    paths = metric.geodesic.get_paths_parallel(ys0, taus, max_workers=2)
+    for y0, path in zip(ys0, paths):
+        assert np.allclose(path, metric.geodesic._get_path_from_4state_vector(y0, taus))
+
+
+def test_kerr_from_symbolic_metric():
+    GeneratedKerr = make_metric(SymbolicKerr(), parameters=["a"], name="GeneratedKerr", coordinate_system="BoyerLindquist")
+    kerr = Kerr(1.0, 0.9)
+    metric = GeneratedKerr(1.0, kerr.a)
+
+    assert GeneratedKerr.christoffel_nonzero == Kerr.christoffel_nonzero
+    assert np.allclose(metric.metric(xs.T), kerr.metric(xs.T))
+    components, indices = metric.get_christoffel_symbols(xs, compact=True)
+    assert np.array_equal(indices, kerr.christoffel_indices)
+    assert np.allclose(components, kerr.get_christoffel_symbols(xs, compact=True)[0])
+    assert metric.has_christoffel_derivatives
+    assert np.allclose(metric.get_christoffel_derivatives(xs), kerr.get_christoffel_derivatives(xs))
+
+
+def test_parameters_are_checked(ReissnerNordstrom):
+    f = 1 - R_s / r + Q**2 / r**2
+    with pytest.raises(ValueError):
+        make_metric(sp.diag(f, -1 / f, -r**2, -r**2 * sp.sin(theta)**2), coordinates)
+    with pytest.raises(ValueError):
+        ReissnerNordstrom(1.0)
+
+
+def test_horizon_radius_per_class(ReissnerNordstrom):
+    f = 1 - R_s / r + Q**2 / r**2
+    g = sp.diag(f, -1 / f, -r**2, -r**2 * sp.sin(theta)**2)
+    Inner = make_metric(g, coordinates, [Q], "ReissnerNordstrom", "Spherical", horizon_radius=lambda metric: 0.5)
+    Plain = make_metric(g, coordinates, [Q], "ReissnerNordstrom", "Spherical")
+
+    assert len({ReissnerNordstrom, Inner, Plain}) == 3
+    assert ReissnerNordstrom(1.0, 0.0).horizon_radius == Schwarzschild(1.0).horizon_radius
+    assert Inner(1.0, 0.0).horizon_radius == 0.5
+    assert Plain(1.0, 0.0).horizon_radius is None
+    assert type(pickle.loads(pickle.dumps(Inner(1.0, 0.3)))) is Inner
@@ -58,6 +58,34 @@ initial_conditions_3_rp = BoyerLindquist(xs_3, vs_3, a=a_3)
 x_vec_3 = np.array(initial_conditions_3.position())
 
 
+def closed_form_kerr_metric(xs, R_s, a):
+    """Boyer-Lindquist Kerr metric with Delta = r^2 - R_s r + a^2, signature (+, -, -, -)."""
+    r, theta = xs[1], xs[2]
+    Sigma = r**2 + a**2 * np.cos(theta) ** 2
+    Delta = r**2 - R_s * r + a**2
+    g = np.zeros((4, 4))
+    g[0, 0] = 1 - R_s * r / Sigma
+    g[1, 1] = -Sigma / Delta
+    g[2, 2] = -Sigma
+    g[3, 3] = -(r**2 + a**2 + R_s * r * a**2 * np.sin(theta) ** 2 / Sigma) * np.sin(theta) ** 2
+    g[0, 3] = g[3, 0] = R_s * r * a * np.sin(theta) ** 2 / Sigma
+    return g
+
+
+def closed_form_kerr_christoffels(xs, R_s, a, h=1e-5):
+    """Christoffel symbols of closed_form_kerr_metric from central differences."""
+    xs = np.asarray(xs, dtype=float)
+    dg = np.zeros((4, 4, 4))  # dg[rho, mu, nu] = d_rho g_{mu nu}
+    for rho in range(4):
+        step = np.zeros(4)
+        step[rho] = h
+        dg[rho] = (closed_form_kerr_metric(xs + step, R_s, a) - closed_form_kerr_metric(xs - step, R_s, a)) / (2 * h)
+    g_inv = np.linalg.inv(closed_form_kerr_metric(xs, R_s, a))
+    return 0.5 * (
+        np.einsum("sr,mrn->smn", g_inv, dg) + np.einsum("sr,nrm->smn", g_inv, dg) - np.einsum("sr,rmn->smn", g_inv, dg)
+    )
+
+
 class TestKerrMetric:
     def test_kerr_metric(self):
         # CI 1
@@ -246,4 +274,76 @@ class TestKerrMetric:
         kerr = rp_Kerr(M_3, a_3)
         path = kerr.geodesic.get_path(initial_conditions_3_rp, taus_3)
         Q = path._get_Q(kerr)
-        assert np.isclose(Q, Q[0]).all(), "Q is not constant over the trajectory"
\ No newline at end of file
+        assert np.isclose(Q, Q[0]).all(), "Q is not constant over the trajectory"
+
+    def test_kerr_closed_form(self):
+        kerr = rp_Kerr(1.0, 0.9)
+        r_plus = kerr.R_s / 2 + np.sqrt(kerr.R_s**2 / 4 - kerr.a**2)
+        xs = np.array([[0.0, 1.2, 0.4, 0.0], [0.0, 1.5, 1.0, 2.0], [0.0, 3.0, np.pi / 2, 1.0], [0.0, 12.0, 2.5, 4.0]])
+
+        gs = kerr.metric(xs.T)
+        for i, x in enumerate(xs):
+            g = closed_form_kerr_metric(x, kerr.R_s, kerr.a)
+            assert np.allclose(kerr.metric(x), g, rtol=1e-12, atol=0)
+            assert np.allclose(gs[..., i], g, rtol=1e-12, atol=0)
+            # g_rr changes sign at the outer horizon r_+ = R_s / 2 + sqrt(R_s^2 / 4 - a^2)
+            assert np.sign(g[1, 1]) == np.sign(r_plus - x[1])
+
+        for x, christoffel in zip(xs, kerr.get_christoffel_symbols(xs)):
+            assert np.allclose(christoffel, closed_form_kerr_christoffels(x, kerr.R_s, kerr.a), rtol=1e-6, atol=1e-8)
+
+    def test_kerr_christoffel_symbols_batch(self):
+        kerr = rp_Kerr(M_2, a_2)
+        rng = np.random.default_rng(0)
+        xs = np.column_stack(
+            [
+                rng.uniform(0, 10, 50),
+                rng.uniform(2, 50, 50) * kerr.R_s,
+                rng.uniform(0.1, np.pi - 0.1, 50),
+                rng.uniform(0, 2 * np.pi, 50),
+            ]
+        )
+
+        christoffels = kerr.get_christoffel_symbols(xs)
+        assert christoffels.shape == (50, 4, 4, 4)
+        for x, christoffel in zip(xs, christoffels):
+            assert np.allclose(christoffel, kerr.get_christoffel_symbols(x), rtol=1e-12, atol=0)
+
+    def test_kerr_metric_float_fast_path(self):
+        kerr = rp_Kerr(M_1, a_1)
+        xs = initial_conditions_1_rp.xs
+        xs_float = np.array([float(x) for x in xs])
+
+        # Quantities go through the validator, float arrays are used as they are
+        assert np.allclose(kerr.metric(xs), kerr.metric(xs_float), rtol=1e-12, atol=0)
+        assert np.allclose(
+            kerr.get_christoffel_symbols(xs, compact=True)[0],
+            kerr.get_christoffel_symbols(xs_float, compact=True)[0],
+            rtol=1e-12, atol=0,
+        )
+        assert np.allclose(
+            kerr.metric([0 * u.s, xs_float[1] * u.m, xs_float[2] * u.rad, xs_float[3] * u.rad]),
+            kerr.metric(xs_float), rtol=1e-12, atol=0,
+        )
+
+    def test_kerr_metric_quantity_arrays(self):
+        kerr = rp_Kerr(M_1, a_1)
+        xs_float = np.array([0.0, 10.0, 1.0, 0.5])
+        xs_quantity = xs_float * u.km
+        xs_list = [x * u.km for x in xs_float]
+
+        # A Quantity array is an ndarray too, it must not take the float fast path
+        assert not np.allclose(kerr.metric(xs_quantity), kerr.metric(xs_float))
+        assert np.allclose(kerr.metric(xs_quantity), kerr.metric(xs_list), rtol=1e-12, atol=0)
+        assert np.allclose(
+            kerr.get_christoffel_symbols(xs_quantity), kerr.get_christoffel_symbols(xs_list), rtol=1e-12, atol=0
+        )
+        assert np.allclose(
+            kerr.get_christoffel_derivatives(xs_quantity), kerr.get_christoffel_derivatives(xs_list), rtol=1e-12, atol=0
+        )
+
+        xs_batch = np.tile(xs_float, (3, 1))
+        assert np.allclose(kerr.metric(xs_batch.T * u.km)[..., 0], kerr.metric(xs_list), rtol=1e-12, atol=0)
+        assert np.allclose(
+            kerr.get_christoffel_symbols(xs_batch * u.km)[0], kerr.get_christoffel_symbols(xs_list), rtol=1e-12, atol=0
+        )
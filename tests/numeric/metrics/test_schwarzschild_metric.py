@@ -4,6 +4,7 @@ from einsteinpy.metric import Schwarzschild
 from einsteinpy.coordinates import SphericalDifferential
 from relatipy.numeric.metrics import Schwarzschild as rp_Schwarzschild
 from relatipy.numeric.coordinates import Spherical
+from relatipy.numeric.constants import _c_SI
 from einsteinpy.geodesic.geodesic import Geodesic
 from einsteinpy.geodesic import Timelike
 from initial_conditions import position_ep_1, momentum_ep_1, position_ep_2, momentum_ep_2, position_ep_3, momentum_ep_3, M_1, M_2, M_3
@@ -301,4 +302,58 @@ class TestSchwarzschildMetric:
         path_cartesian = sch.geodesic.get_path(initial_conditions_3_cartesian, taus_3)  # (8, 100)
         path_spherical = sch.geodesic.get_path(initial_conditions_3_rp, taus_3).convert_to("Cartesian")  # (4, 100) 
         for i in range(7):
-            assert np.isclose(path_cartesian[i], path_spherical[i]).all(), "The trajectories are not the same"
\ No newline at end of file
+            assert np.isclose(path_cartesian[i], path_spherical[i]).all(), "The trajectories are not the same"
+
+    def test_schwarzschild_christoffel_symbols_batch(self):
+        sch = rp_Schwarzschild(M_2)
+        rng = np.random.default_rng(0)
+        xs = np.column_stack(
+            [
+                rng.uniform(0, 10, 50),
+                rng.uniform(2, 50, 50) * sch.R_s,
+                rng.uniform(0.1, np.pi - 0.1, 50),
+                rng.uniform(0, 2 * np.pi, 50),
+            ]
+        )
+
+        christoffels = sch.get_christoffel_symbols(xs)
+        assert christoffels.shape == (50, 4, 4, 4)
+        for x, christoffel in zip(xs, christoffels):
+            assert np.allclose(christoffel, sch.get_christoffel_symbols(x), rtol=1e-12, atol=0)
+
+    def test_schwarzschild_christoffel_symbols_compact(self):
+        sch = rp_Schwarzschild(M_1)
+        christoffel = sch.get_christoffel_symbols(xs_1, dimensionless=False)
+        components, indices = sch.get_christoffel_symbols(xs_1, dimensionless=False, compact=True)
+
+        assert components.shape == (9,)
+        assert indices.shape == (9, 3)
+        assert np.allclose(components, christoffel[tuple(indices.T)])
+
+        # Every other component is either symmetric to a listed one or zero
+        rebuilt = np.zeros((4, 4, 4))
+        rebuilt[tuple(indices.T)] = components
+        rebuilt[indices[:, 0], indices[:, 2], indices[:, 1]] = components
+        assert np.allclose(rebuilt, christoffel)
+
+    def test_schwarzschild_si_batch(self):
+        sch = rp_Schwarzschild(M_2)
+        rng = np.random.default_rng(1)
+        xs = np.column_stack(
+            [
+                rng.uniform(0, 10, 20),
+                rng.uniform(2, 50, 20) * sch.R_s,
+                rng.uniform(0.1, np.pi - 0.1, 20),
+                rng.uniform(0, 2 * np.pi, 20),
+            ]
+        )
+
+        metrics = sch.metric(xs.T, dimensionless=False)  # (4, 4, N)
+        christoffels = sch.get_christoffel_symbols(xs, dimensionless=False)  # (N, 4, 4, 4)
+        for i, x in enumerate(xs):
+            assert np.allclose(metrics[..., i], sch.metric(x, dimensionless=False), rtol=1e-12, atol=0)
+            assert np.allclose(christoffels[i], sch.get_christoffel_symbols(x, dimensionless=False), rtol=1e-12, atol=0)
+
+        # g_00 picks up a factor c^2 with x0 = t
+        g = sch.metric(xs[0])
+        assert np.isclose(sch.metric(xs[0], dimensionless=False)[0, 0], g[0, 0] * _c_SI**2)
@@ -0,0 +1,43 @@
+# test_lazy_imports.py
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+def _loaded_after(statement):
+    script = f"import sys\n{statement}\nprint(' '.join(sorted(sys.modules)))"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True, env=env).stdout
+    return set(output.split())
+
+
+@pytest.mark.parametrize("module", ["relatipy", "relatipy.numeric.metrics", "relatipy.numeric.camera"])
+def test_numeric_imports_skip_heavy_dependencies(module):
+    loaded = _loaded_after(f"import {module}")
+    assert not loaded & {"scipy", "astropy", "sympy", "einsteinpy"}
+
+
+def test_subpackages_load_on_access():
+    loaded = _loaded_after("import relatipy; relatipy.numeric.geodesic.Geodesic")
+    assert "relatipy.numeric.geodesic" in loaded
+    assert "relatipy.symbolic" not in loaded
+
+
+def test_symbolic_caches_skip_numeric():
+    loaded = _loaded_after("import relatipy.symbolic.cache, relatipy.symbolic.codegen")
+    assert not {name for name in loaded if name.startswith("relatipy.numeric")}
+
+
+def test_cached_kernels_load_without_sympy(tmp_path):
+    statement = (
+        f"import os; os.environ['RELATIPY_CACHE_DIR'] = {str(tmp_path)!r}\n"
+        "from relatipy.numeric.kernels import load_kernels, store_kernels\n"
+        "store_kernels('test', 'import numpy\\nPARAMETERS = ()\\n')\n"
+        "assert load_kernels('test').PARAMETERS == ()"
+    )
+    loaded = _loaded_after(statement)
+    assert "relatipy_kernels_test" in loaded
+    assert not loaded & {"sympy", "einsteinpy"}
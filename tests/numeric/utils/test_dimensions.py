@@ -1,3 +1,4 @@
+import numpy as np
 import astropy.units as u
 from relatipy.numeric.utils.dimensions import validator
 from relatipy.numeric.constants import _G_SI, _c_SI
@@ -31,4 +32,29 @@ class TestValidator:
 
     def test_validate_angular_velocity(self):
         assert validator.validate_angular_velocity(1) == 1
-        assert validator.validate_angular_velocity(_c_SI * u.rad / u.s) == 1
\ No newline at end of file
+        assert validator.validate_angular_velocity(_c_SI * u.rad / u.s) == 1
+
+    def test_validate_quantity_arrays(self):
+        radii = np.linspace(1, 10, 1000)
+        assert np.allclose(validator.validate_scalar(radii * u.km), radii * 1e3)
+        assert np.allclose(validator.validate_scalar(radii * _c_SI * u.m / u.s), radii)
+        assert np.allclose(validator.validate_scalar(radii * u.deg), np.deg2rad(radii))
+
+        with pytest.raises(ValueError):
+            validator.validate_scalar(radii * u.K)
+
+    def test_validate_vector(self):
+        ts = np.linspace(0, 1, 5)
+        rs = np.linspace(1, 2, 5)
+
+        # One row per component, every row converted at once
+        xs = validator.validate_vector([ts * _c_SI * u.s, rs * u.m, rs * u.rad, 0 * u.rad])
+        assert np.allclose(xs[0], ts) and np.allclose(xs[1], rs) and xs[3] == 0
+
+        # A single Quantity array shares one unit
+        assert np.allclose(validator.validate_vector(np.stack([rs, rs]) * u.km), 1e3 * np.stack([rs, rs]))
+
+        # Plain arrays are already dimensionless
+        array = np.array([0.0, 10.0, 1.0, 0.5])
+        assert validator.validate_vector(array) is array
+        assert validator.validate_vector(None) is None
@@ -0,0 +1,123 @@
+# test_codegen.py
+
+import importlib.metadata
+
+import numpy as np
+import pytest
+import sympy as sp
+import relatipy
+from relatipy import _cache
+from relatipy.numeric.metrics import Kerr, Schwarzschild
+from relatipy.numeric.metrics.Minkowski_metric import Minkowski
+from relatipy.numeric.kernels import clear_kernels, get_kernel_dir, load_kernels
+from relatipy.symbolic.codegen import compile_kernels, generate_kernel_source, get_kernel_key
+from relatipy.symbolic.metrics import Kerr as SymbolicKerr
+
+xs = np.array([
+    [0.0, 10.0, 1.0, 0.5],
+    [1.0, 5.0, 2.0, 1.0],
+    [2.0, 3.0, 0.3, 4.0],
+])
+
+
+@pytest.fixture(scope="module")
+def kerr_kernels():
+    return compile_kernels(SymbolicKerr(), name="Kerr", cache=False)
+
+
+def test_kerr_kernels(kerr_kernels):
+    metric = Kerr(1.0, 0.9)
+    parameters = {"R_s": metric.R_s, "a": metric.a}
+    args = [parameters[name] for name in kerr_kernels.PARAMETERS]
+    assert kerr_kernels.CHRISTOFFEL_NONZERO == Kerr.christoffel_nonzero
+
+    g = kerr_kernels.metric(xs, *args)
+    assert g.shape == (3, 4, 4)
+    assert np.allclose(g, metric._metric_dimensionless(xs))
+    assert np.allclose(np.einsum("nij,njk->nik", g, kerr_kernels.inverse_metric(xs, *args)), np.eye(4))
+
+    assert np.allclose(kerr_kernels.christoffel_components(xs, *args), metric._get_christoffel_components(xs))
+    assert np.allclose(kerr_kernels.christoffel_symbols(xs, *args), metric._get_christoffel_symbols(xs))
+    assert np.allclose(kerr_kernels.christoffel_derivatives(xs, *args), metric._get_christoffel_derivatives(xs))
+
+
+def test_single_point(kerr_kernels):
+    metric = Kerr(1.0, 0.5)
+    args = [{"R_s": metric.R_s, "a": metric.a}[name] for name in kerr_kernels.PARAMETERS]
+
+    assert kerr_kernels.metric(xs[0], *args).shape == (4, 4)
+    assert np.allclose(kerr_kernels.christoffel_symbols(xs[0], *args), metric._get_christoffel_symbols(xs[:1])[0])
+
+
+def test_matrix_metrics():
+    t, r, theta, phi, R_s = sp.symbols("t r theta phi R_s")
+    g = sp.diag(1 - R_s / r, -1 / (1 - R_s / r), -r**2, -r**2 * sp.sin(theta)**2)
+    kernels = compile_kernels(g, [t, r, theta, phi], name="Schwarzschild", cache=False)
+
+    metric = Schwarzschild(1.0)
+    assert kernels.PARAMETERS == ("R_s",)
+    assert kernels.CHRISTOFFEL_NONZERO == Schwarzschild.christoffel_nonzero
+    assert np.allclose(kernels.christoffel_symbols(xs, metric.R_s), metric._get_christoffel_symbols(xs))
+
+    kernels = compile_kernels(sp.diag(1, -1, -1, -1), [t, r, theta, phi], name="Minkowski", cache=False)
+    assert kernels.CHRISTOFFEL_NONZERO == Minkowski.christoffel_nonzero == ()
+    assert np.array_equal(kernels.inverse_metric(xs), np.broadcast_to(np.diag([1.0, -1, -1, -1]), (3, 4, 4)))
+    assert np.array_equal(kernels.christoffel_symbols(xs), np.zeros((3, 4, 4, 4)))
+
+
+def test_coordinates_required():
+    with pytest.raises(ValueError):
+        generate_kernel_source(sp.eye(4))
+
+
+def test_kernel_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("RELATIPY_CACHE_DIR", str(tmp_path))
+    t, r, theta, phi, R_s = sp.symbols("t r theta phi R_s")
+    coordinates = [t, r, theta, phi]
+    g = sp.diag(1 - R_s / r, -1 / (1 - R_s / r), -r**2, -r**2 * sp.sin(theta)**2)
+
+    key = get_kernel_key(g, coordinates)
+    assert key != get_kernel_key(g.subs(R_s, 2 * R_s), coordinates)
+    assert load_kernels(key) is None
+    with monkeypatch.context() as patch:
+        patch.setattr(sp, "__version__", "0.0")
+        assert key != get_kernel_key(g, coordinates)
+
+    kernels = compile_kernels(g, coordinates, name="Schwarzschild")
+    assert kernels.KERNEL_KEY == key
+    assert kernels.__file__.startswith(get_kernel_dir())
+    assert load_kernels(key) is kernels
+    assert compile_kernels(g, coordinates, name="Other") is kernels
+    # The cached module is shared by every name
+    with open(kernels.__file__) as file:
+        assert "Schwarzschild" not in file.read()
+
+    metric = Schwarzschild(1.0)
+    assert np.allclose(kernels.christoffel_symbols(xs, metric.R_s), metric._get_christoffel_symbols(xs))
+
+    clear_kernels()
+    assert load_kernels(key) is None
+
+
+def test_kernel_dir_version(monkeypatch, tmp_path):
+    monkeypatch.setenv("RELATIPY_CACHE_DIR", str(tmp_path))
+
+    def get_kernel_dir_of(version):
+        def fake_version(name):
+            if version is None:
+                raise importlib.metadata.PackageNotFoundError(name)
+            return version
+
+        _cache._get_version.cache_clear()
+        with monkeypatch.context() as patch:
+            patch.setattr(importlib.metadata, "version", fake_version)
+            return get_kernel_dir()
+
+    try:
+        assert get_kernel_dir_of("1.2.0") == str(tmp_path / "kernels" / "1.2.0")
+        assert get_kernel_dir_of("1.3.0") == str(tmp_path / "kernels" / "1.3.0")
+        # From a source tree without metadata it falls back to __version__
+        assert get_kernel_dir_of(None) == str(tmp_path / "kernels" / relatipy.__version__)
+    finally:
+        _cache._get_version.cache_clear()
+
@@ -0,0 +1,43 @@
+# test_simplification.py
+
+import numpy as np
+import pytest
+import sympy as sp
+from relatipy.symbolic import simplification
+from relatipy.symbolic.simplification import simplify_christoffel_symbols, simplify_expressions
+
+r, theta = sp.symbols("r theta", positive=True)
+
+
+def christoffel_2_sphere():
+    # Gamma^sigma_{mu nu} of the sphere written in an unsimplified form
+    christoffel = np.zeros((4, 4, 4), dtype=object)
+    christoffel[2, 3, 3] = -sp.sin(theta) * sp.cos(theta) * (sp.sin(theta)**2 + sp.cos(theta)**2)
+    christoffel[3, 2, 3] = christoffel[3, 3, 2] = sp.cos(theta) / sp.sin(theta) * (r**2 - r**2 + 1)
+    christoffel[1, 2, 2] = -r * (1 + sp.tan(theta)**2) * sp.cos(theta)**2
+    return christoffel
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_simplify_christoffel_symbols(processes):
+    simplified = simplify_christoffel_symbols(christoffel_2_sphere(), processes=processes)
+
+    assert simplified.shape == (4, 4, 4)
+    assert simplified[2, 3, 3] == -sp.sin(2 * theta) / 2
+    assert simplified[3, 2, 3] == simplified[3, 3, 2]
+    assert sp.simplify(simplified[3, 2, 3] - sp.cos(theta) / sp.sin(theta)) == 0
+    assert simplified[1, 2, 2] == -r
+    assert np.count_nonzero(simplified != 0) == 4
+
+
+def test_only_independent_components(monkeypatch):
+    calls = []
+    monkeypatch.setattr(simplification, "simplify_expressions", lambda expressions, processes: calls.append(expressions) or expressions)
+
+    simplify_christoffel_symbols(christoffel_2_sphere())
+    assert len(calls[0]) == 40
+
+
+def test_simplify_expressions_order():
+    expressions = [sp.sin(theta)**2 + sp.cos(theta)**2, 0, (r**2 - 1) / (r - 1)]
+    assert simplify_expressions(expressions, processes=2) == [1, 0, r + 1]
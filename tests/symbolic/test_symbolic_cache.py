@@ -0,0 +1,76 @@
+# test_symbolic_cache.py
+
+import os
+
+import sympy as sp
+from relatipy.symbolic.cache import SymbolicCache
+from relatipy.symbolic.metrics import Kerr
+from relatipy.symbolic.metrics.kerr_metric import xs
+
+r, theta = sp.symbols("r theta")
+
+
+def test_roundtrip(tmp_path):
+    cache = SymbolicCache(str(tmp_path))
+    key = cache.key("test", [r**2, sp.sin(theta)], [r, theta])
+
+    assert key not in cache
+    assert cache.get(key) is None
+
+    cache.set(key, [[r**2 * sp.sin(theta)], [0]])
+    assert key in cache
+    assert cache.get(key) == [[r**2 * sp.sin(theta)], [0]]
+
+
+def test_keys():
+    key = SymbolicCache.key("test", [r**2], [r])
+    assert key == SymbolicCache.key("test", [r**2], [r])
+    assert key != SymbolicCache.key("test", [r**3], [r])
+    assert key != SymbolicCache.key("other", [r**2], [r])
+
+
+def test_invalidation(tmp_path):
+    cache = SymbolicCache(str(tmp_path))
+    keys = [cache.key("test", i) for i in range(3)]
+    for key in keys:
+        cache.set(key, r)
+
+    cache.invalidate(keys[0])
+    assert keys[0] not in cache and keys[1] in cache
+
+    # Unreadable entries are dropped
+    with open(os.path.join(cache.directory, keys[1] + cache.suffix), "wb") as file:
+        file.write(b"corrupted")
+    assert cache.get(keys[1]) is None
+    assert keys[1] not in cache
+
+    cache.clear()
+    assert cache.size() == 0
+
+
+def test_size_cap(tmp_path):
+    cache = SymbolicCache(str(tmp_path))
+    keys = [cache.key("test", i) for i in range(4)]
+    for i, key in enumerate(keys[:3]):
+        cache.set(key, sp.Symbol("x") ** 100)
+        os.utime(os.path.join(cache.directory, key + cache.suffix), (i, i))
+    entry_size = cache.size() // 3
+
+    # Reading an entry makes it the most recently used
+    cache.get(keys[0])
+    cache.max_size = 3 * entry_size
+    cache.set(keys[3], sp.Symbol("x") ** 100)
+
+    assert [key in cache for key in keys] == [True, False, True, True]
+    assert cache.size() <= cache.max_size
+
+
+def test_kerr_christoffel_symbols_from_cache(tmp_path):
+    cache = SymbolicCache(str(tmp_path))
+    metric = Kerr(cache=cache)
+    key = cache.key("christoffel_symbols", metric.metric().tensor().tolist(), xs)
+
+    christoffel = [[[sp.Integer(sigma + mu + nu) for nu in range(4)] for mu in range(4)] for sigma in range(4)]
+    cache.set(key, christoffel)
+
+    assert metric.christoffel_symbols().tensor().tolist() == christoffel